@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""Dates per second of ``Cleaner.clean_date`` against parsing every date with dateutil,
+as it did before the ISO fast path. Run from the repository root:
+
+    python -m benchmarks.clean_date [--dates 20000]
+"""
+
+import argparse
+import random
+import time
+
+from oc_ds_converter.lib.cleaner import Cleaner
+
+# The uncached dateutil path, i.e. the previous implementation
+parse_with_dateutil = Cleaner._Cleaner__parse_date.__wrapped__  # type: ignore[attr-defined]
+
+FREE_TEXT_DATES = ['May 2020', '2020-02-30', '2019-13-01', '12 March 1998', '2020/05/07', 'Spring 2001', '']
+
+
+def make_dates(n: int, seed: int = 0) -> list[str]:
+    rnd = random.Random(seed)
+    dates = []
+    for _ in range(n):
+        year = rnd.randint(1900, 2025)
+        kind = rnd.random()
+        if kind < 0.3:
+            dates.append(str(year))
+        elif kind < 0.5:
+            dates.append(f'{year}-{rnd.randint(1, 12):02d}')
+        elif kind < 0.7:
+            dates.append(f'{year}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}')
+        elif kind < 0.95:
+            # Crossref date-parts joined with hyphens
+            dates.append(f'{year}-{rnd.randint(1, 12)}-{rnd.randint(1, 28)}')
+        else:
+            dates.append(rnd.choice(FREE_TEXT_DATES))
+    return dates
+
+
+def dates_per_second(func, dates: list[str]) -> float:
+    start = time.perf_counter()
+    for date in dates:
+        func(date)
+    return len(dates) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dates', type=int, default=20000)
+    args = parser.parse_args()
+    dates = make_dates(args.dates)
+    for date in set(dates):
+        assert Cleaner(date).clean_date() == parse_with_dateutil(date), date
+    before = dates_per_second(parse_with_dateutil, dates)
+    after = dates_per_second(lambda date: Cleaner(date).clean_date(), dates)
+    print(f'before: {before:,.0f} dates/s')
+    print(f'after:  {after:,.0f} dates/s ({after / before:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""Rows per second of ``Cleaner.clean_volume_and_issue`` against the previous implementation,
+which compiled the patterns on every call. Run from the repository root:
+
+    python -m benchmarks.clean_volume_and_issue [--rows 20000]
+"""
+
+import argparse
+import html
+import random
+import re
+import time
+from copy import deepcopy
+
+from oc_ds_converter.lib.cleaner import Cleaner
+from oc_ds_converter.lib.master_of_regex import invalid_vi_patterns, issues_valid_patterns, volumes_valid_patterns
+
+# Mostly plain numbers, as in the dumps, plus the kinds of values the patterns exist for
+SAMPLE_VALUES = [
+    '1', '2', '3', '12', '45', '118', '2019', '1-2', '3–4', '10/11', 'S1', 'Suppl 2', 'Special Issue',
+    'vol. 4', 'Vol. 12, No. 3', 'n/a', 'not available', '&na;', 'ser. 2ª, vol. 10', '(2015)', '3 (2010)',
+    'Spring', 'January-March', '1 supplement', 'e1', 'Pt 2', '-', '.', 'issue 4', 'no. 7, 2001', '',
+]
+
+
+def legacy_clean_volume_and_issue(row: dict) -> None:
+    output = {'volume': '', 'issue': '', 'pub_date': ''}
+    for field in {'volume', 'issue'}:
+        vi = row[field]
+        vi = Cleaner(vi).normalize_hyphens()
+        vi = Cleaner(vi).normalize_spaces().strip()
+        vi = html.unescape(vi)
+        for pattern, strategy in invalid_vi_patterns.items():
+            pattern = f'^{pattern}$'
+            capturing_groups = re.search(pattern, vi, re.IGNORECASE)
+            if capturing_groups:
+                if strategy == 'del':
+                    row[field] = ''
+                elif strategy == 'do_nothing':
+                    row[field] = vi
+                elif strategy == 's)':
+                    row[field] = f'{vi}s)'
+                else:
+                    row[field] = ''
+                    whatever, volume, issue, pub_date = Cleaner.fix_invalid_vi(capturing_groups, strategy)
+                    row[field] = whatever if whatever else row[field]
+                    output['volume'] = volume if volume else ''
+                    output['issue'] = issue if issue else ''
+                    output['pub_date'] = pub_date if pub_date else ''
+    row['volume'] = output['volume'] if not row['volume'] else row['volume']
+    row['issue'] = output['issue'] if not row['issue'] else row['issue']
+    row['pub_date'] = output['pub_date'] if not row['pub_date'] else row['pub_date']
+    switch_vi = {'volume': '', 'issue': ''}
+    for field in {'volume', 'issue'}:
+        vi = row[field]
+        for pattern in volumes_valid_patterns:
+            pattern = f'^{pattern}$'
+            if re.search(pattern, vi, re.IGNORECASE):
+                if field == 'issue':
+                    switch_vi['volume'] = vi
+        for pattern in issues_valid_patterns:
+            pattern = f'^{pattern}$'
+            if re.search(pattern, vi, re.IGNORECASE):
+                if field == 'volume':
+                    switch_vi['issue'] = vi
+    if switch_vi['volume'] and switch_vi['issue']:
+        row['volume'] = switch_vi['volume']
+        row['issue'] = switch_vi['issue']
+    elif switch_vi['volume'] and not row['volume']:
+        row['volume'] = switch_vi['volume']
+        row['issue'] = ''
+        row['type'] = 'journal volume' if row['type'] == 'journal issue' else row['type']
+    elif switch_vi['issue'] and not row['issue']:
+        row['issue'] = switch_vi['issue']
+        row['volume'] = ''
+        row['type'] = 'journal issue' if row['type'] == 'journal volume' else row['type']
+
+def make_rows(n: int, seed: int = 0) -> list[dict]:
+    rnd = random.Random(seed)
+    plain = [v for v in SAMPLE_VALUES if v.isdigit()]
+    rows = []
+    for _ in range(n):
+        # About four rows out of five only hold numbers
+        values = plain if rnd.random() < 0.8 else SAMPLE_VALUES
+        rows.append({
+            'volume': rnd.choice(values), 'issue': rnd.choice(values), 'pub_date': '', 'type': 'journal article'})
+    return rows
+
+
+def rows_per_second(func, rows: list[dict]) -> float:
+    rows = deepcopy(rows)
+    start = time.perf_counter()
+    for row in rows:
+        func(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+    rows = make_rows(args.rows)
+    for value in SAMPLE_VALUES:
+        for other in SAMPLE_VALUES:
+            expected = {'volume': value, 'issue': other, 'pub_date': '', 'type': 'journal issue'}
+            actual = dict(expected)
+            legacy_clean_volume_and_issue(expected)
+            Cleaner.clean_volume_and_issue(actual)
+            assert actual == expected, (value, other, actual, expected)
+    before = rows_per_second(legacy_clean_volume_and_issue, rows)
+    after = rows_per_second(Cleaner.clean_volume_and_issue, rows)
+    print(f'before: {before:,.0f} rows/s')
+    print(f'after:  {after:,.0f} rows/s ({after / before:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""Titles per second of ``strip_markup`` against building a Beautiful Soup for every
+title, as the processors did before. Run from the repository root:
+
+    python -m benchmarks.strip_markup [--titles 20000]
+"""
+
+import argparse
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from oc_ds_converter.lib.markup import strip_markup
+
+TITLES = [
+    'A survey of graph neural networks',
+    'Effect of <i>Escherichia coli</i> on CO<sub>2</sub> levels',
+    '<jats:title>Measuring <jats:italic>in vivo</jats:italic> responses</jats:title>',
+    'Bounds on <mml:math><mml:msup><mml:mi>x</mml:mi><mml:mn>2</mml:mn></mml:msup></mml:math>',
+    'Research &amp; development in Europe',
+    'Caf&eacute; culture',
+]
+
+
+def soup_text(text: str) -> str:
+    return BeautifulSoup(text, 'html.parser').get_text()
+
+
+def titles_per_second(func, titles: list[str]) -> float:
+    start = time.perf_counter()
+    for title in titles:
+        func(title)
+    return len(titles) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=20000)
+    args = parser.parse_args()
+    rnd = random.Random(0)
+    titles = [f'{rnd.choice(TITLES)} {i}' for i in range(args.titles)]
+    for title in TITLES:
+        assert strip_markup(title) == soup_text(title), title
+    before = titles_per_second(soup_text, titles)
+    after = titles_per_second(strip_markup, titles)
+    print(f'before: {before:,.0f} titles/s')
+    print(f'after:  {after:,.0f} titles/s ({after / before:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,6 @@ import fakeredis
 import csv
 import json
 
-from bs4 import BeautifulSoup
 from pandas.core.apply import include_axis
 from soupsieve.util import lower
 
@@ -23,6 +22,7 @@ from oc_ds_converter.oc_idmanager import WikidataManager
 from oc_ds_converter.oc_idmanager.doi import DOIManager
 from oc_ds_converter.oc_idmanager.orcid import ORCIDManager
 from oc_ds_converter.lib.master_of_regex import *
+from oc_ds_converter.lib.markup import strip_markup
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.sqlite_manager import SqliteStorageManager
@@ -35,14 +35,13 @@ from oc_ds_converter.oc_idmanager.ror import RORManager
 from oc_ds_converter.oc_idmanager.viaf import ViafManager
 from oc_ds_converter.oc_idmanager.crossref import CrossrefManager
 
+from oc_ds_converter.datasource.meta_filter import meta_filtered
 from oc_ds_converter.datasource.redis import RedisDataSource
 from oc_ds_converter.ra_processor import RaProcessor
 from typing import Dict, List, Tuple, Optional, Type, Callable
 from pathlib import Path
 from typing import List, Tuple
 
-from bs4 import BeautifulSoup
-
 from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
 from oc_ds_converter.lib.cleaner import Cleaner
 from oc_ds_converter.oc_idmanager.doi import DOIManager
@@ -216,11 +215,11 @@ class DataciteProcessing(RaProcessor):
             self.BR_redis = FakeRedisWrapper()
             self.RA_redis = FakeRedisWrapper()
         else:
-            self.BR_redis = RedisDataSource("DB-META-BR")
-            self.RA_redis = RedisDataSource("DB-META-RA")
+            self.BR_redis = meta_filtered(RedisDataSource("DB-META-BR"), "DB-META-BR")
+            self.RA_redis = meta_filtered(RedisDataSource("DB-META-RA"), "DB-META-RA")
 
-        self._redis_values_ra = []
-        self._redis_values_br = []
+        self._redis_values_ra = set()
+        self._redis_values_br = set()
 
         if not publishers_filepath_dc:
             self.publishers_filepath = None
@@ -360,13 +359,22 @@ class DataciteProcessing(RaProcessor):
         id_manager = self.get_id_manager(r_schema, self.ra_man_dict)
         return id_manager.normalise(r, include_prefix=True) if id_manager else None
 
+    def reset_file_state(self) -> None:
+        """Drop the data gathered for the previous input file, so that a single instance
+        (with its id managers, DOI-ORCID index and connections) can be reused across files."""
+        self.temporary_manager.delete_storage()
+        self._redis_values_br = set()
+        self._redis_values_ra = set()
+        self._doi_orcid_cache = {}
+        self._meta_existence = {}
+
     def update_redis_values(self, br, ra):
-        self._redis_values_br = [
+        self._redis_values_br = {
             x for x in (self.doi_m.normalise(b, include_prefix=True) for b in (br or [])) if x
-        ]
-        self._redis_values_ra = [
+        }
+        self._redis_values_ra = {
             x for x in (self._normalize_ra(r) for r in (ra or [])) if x
-        ]
+        }
 
     def validated_as(self, id_dict):
         """ Controllo nello storage temporaneo: Prima verifica se l'id è già stato validato nella memoria/coda temporanea (tmp_doi_m.validated_as_id).
@@ -500,8 +508,7 @@ class DataciteProcessing(RaProcessor):
                 for title in attributes.get("titles"):
                     if title.get("title"):
                         p_title = title.get("title")
-                        soup = BeautifulSoup(p_title, 'html.parser')
-                        title_soup = soup.get_text().replace('\n', '')
+                        title_soup = strip_markup(p_title).replace('\n', '')
                         title_soup_space_replaced = ' '.join(title_soup.split())
                         title_soup_strip = title_soup_space_replaced.strip()
                         clean_tit = html.unescape(title_soup_strip)
@@ -756,8 +763,7 @@ class DataciteProcessing(RaProcessor):
         if container:
             if container.get("title"):
                 cont_title = (container["title"].lower()).replace('\n', '')
-                ven_soup = BeautifulSoup(cont_title, 'html.parser')
-                ventit = html.unescape(ven_soup.get_text())
+                ventit = html.unescape(strip_markup(cont_title))
                 ambiguous_brackets = re.search(r'\[\s*((?:[^\s]+:[^\s]+)?(?:\s+[^\s]+:[^\s]+)*)\s*\]', ventit)
                 if ambiguous_brackets:
                     match = ambiguous_brackets.group(1)
@@ -934,6 +940,7 @@ class DataciteProcessing(RaProcessor):
         if kv_in_memory:
             self.storage_manager.set_multi_value(kv_in_memory)
         self.temporary_manager.delete_storage()
+        self._meta_existence = {}
 
     # added (division in first and second iteration)
     def extract_all_ids(self, citation, is_citing: bool):
@@ -1017,7 +1024,7 @@ class DataciteProcessing(RaProcessor):
             validity = self.RA_redis.mexists_as_set(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         elif redis_db == "br":
-            validity = self.BR_redis.mexists_as_set(ids)
+            validity = self.check_meta_existence(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         else:
             raise ValueError("redis_db must be either 'ra' or 'br'")
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from hashlib import blake2b
+
+from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
+
+# The environment variable holding the directory of the Meta filters: spawned worker
+# processes inherit it, so they load the filters of the process that enabled them
+META_FILTERS_ENV = "OC_DS_CONVERTER_META_FILTERS"
+META_SERVICES = ("DB-META-BR", "DB-META-RA")
+DEFAULT_ERROR_RATE = 0.01
+# Keys asked to Redis by each SCAN round-trip of the export, instead of its default of 10
+EXPORT_SCAN_COUNT = 10000
+
+_MAGIC = b"OCBLOOM1"
+# Magic, number of bits, number of hash functions, number of items
+_HEADER = struct.Struct("<8sQQQ")
+_MIN_BITS = 8192
+
+
+def _positions(key: str, num_bits: int, num_hashes: int) -> list[int]:
+    digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+
+class BloomFilter:
+    """A Bloom filter stored in a file and memory-mapped read-only, so that every worker
+    process of the machine shares the same pages. ``might_contain`` never answers False
+    for a key that was added, and answers True for a key that was not with a probability
+    close to the error rate the filter was sized for."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.num_bits, self.num_hashes, self.count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a Bloom filter file")
+
+    def might_contain(self, key: str) -> bool:
+        bits = self._mmap
+        offset = _HEADER.size
+        for position in _positions(key, self.num_bits, self.num_hashes):
+            if not bits[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self.might_contain(key)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    @staticmethod
+    def write(path: str, keys: Iterable[str], capacity: int, error_rate: float = DEFAULT_ERROR_RATE) -> int:
+        """Write to ``path`` a filter holding ``keys``, sized for ``capacity`` keys with a
+        false positive rate of ``error_rate``, and return the number of keys added."""
+        capacity = max(capacity, 1)
+        num_bits = max(_MIN_BITS, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(-math.log2(error_rate)))
+        bits = bytearray((num_bits + 7) // 8)
+        count = 0
+        for key in keys:
+            for position in _positions(key, num_bits, num_hashes):
+                bits[position >> 3] |= 1 << (position & 7)
+            count += 1
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, num_bits, num_hashes, count))
+            f.write(bits)
+        os.replace(tmp_path, path)
+        return count
+
+
+class MetaFilteredRedis:
+    """Wraps the Redis data source of a Meta keyspace with a Bloom filter of its keys, so
+    that the ids that are definitely not in Meta are answered locally and only the possible
+    hits are looked up in Redis. The other methods are those of the wrapped data source.
+
+    The filter is a snapshot: ids added to Meta after it was exported are reported as absent
+    until it is exported again."""
+
+    def __init__(self, datasource: RedisDataSource | FakeRedisWrapper, bloom_filter: BloomFilter) -> None:
+        self._datasource = datasource
+        self.bloom_filter = bloom_filter
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._datasource, name)
+
+    def exists_as_set(self, resource_id: str) -> bool:
+        if not self.bloom_filter.might_contain(resource_id):
+            return False
+        return self._datasource.exists_as_set(resource_id)
+
+    def mexists_as_set(self, resources_id: list[str]) -> list[bool]:
+        result = [False] * len(resources_id)
+        candidates = [i for i, rid in enumerate(resources_id) if self.bloom_filter.might_contain(rid)]
+        if candidates:
+            found = self._datasource.mexists_as_set([resources_id[i] for i in candidates])
+            for i, exists in zip(candidates, found):
+                result[i] = exists
+        return result
+
+
+def meta_filter_path(directory: str, service: str) -> str:
+    return os.path.join(directory, f"{service}.bloom")
+
+
+def export_meta_filter(
+    datasource: RedisDataSource | FakeRedisWrapper,
+    path: str,
+    capacity: int | None = None,
+    error_rate: float = DEFAULT_ERROR_RATE,
+) -> int:
+    """Write the keys of a Meta Redis database to the Bloom filter file at ``path``, and
+    return their number. ``capacity`` defaults to the size of the database."""
+    if capacity is None:
+        capacity = datasource.dbsize()
+    keys = (k.decode("utf-8") if isinstance(k, bytes) else k for k in datasource.scan_iter(count=EXPORT_SCAN_COUNT))  # type: ignore[attr-defined]
+    return BloomFilter.write(path, keys, capacity, error_rate)
+
+
+def enable_meta_filters(directory: str) -> None:
+    """Answer the Meta existence checks with the filters exported to ``directory``, in the
+    processors created afterwards by this process and by the worker processes it starts."""
+    os.environ[META_FILTERS_ENV] = os.path.abspath(directory)
+
+
+def disable_meta_filters() -> None:
+    os.environ.pop(META_FILTERS_ENV, None)
+
+
+_filters: dict[str, BloomFilter] = {}
+
+
+def meta_filtered(datasource: RedisDataSource, service: str) -> RedisDataSource | MetaFilteredRedis:
+    """Return ``datasource`` wrapped with the filter of ``service``, if the Meta filters are
+    enabled and that filter exists, and ``datasource`` itself otherwise."""
+    directory = os.environ.get(META_FILTERS_ENV)
+    if not directory:
+        return datasource
+    path = meta_filter_path(directory, service)
+    bloom_filter = _filters.get(path)
+    if bloom_filter is None:
+        if not os.path.exists(path):
+            return datasource
+        bloom_filter = _filters[path] = BloomFilter(path)
+    return MetaFilteredRedis(datasource, bloom_filter)
@@ -4,19 +4,25 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import sqlite3
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from csv import DictReader
 from multiprocessing import get_context
 from os import cpu_count, sep, walk
 from os.path import exists
 from typing import Protocol, cast
+from urllib.parse import quote
 
 import fakeredis
 
 from oc_ds_converter.datasource.redis import RedisDataSource
 from oc_ds_converter.lib.console import create_progress
+from oc_ds_converter.lib.csvmanager import CSVManager
 from oc_ds_converter.oc_idmanager import DOIManager
 
 
@@ -26,6 +32,10 @@ class OrcidIndexInterface(Protocol):
 
 
 class OrcidIndexRedis:
+    # Hash of the index files loaded by load_orcid_index_to_redis: the keys of the index
+    # are prefixed DOIs, so it cannot clash with them
+    LOADED_FILES_KEY = "oc_ds_converter:loaded_files"
+
     def __init__(self, testing: bool = False) -> None:
         if testing:
             self._r = fakeredis.FakeStrictRedis(decode_responses=True)
@@ -59,6 +69,12 @@ class OrcidIndexRedis:
                 pipe.sadd(doi, *values)
         pipe.execute()
 
+    def get_loaded_files(self) -> dict[str, str]:
+        return cast(dict[str, str], self._r.hgetall(self.LOADED_FILES_KEY))
+
+    def mark_file_loaded(self, name: str, signature: str) -> None:
+        self._r.hset(self.LOADED_FILES_KEY, name, signature)
+
     def has_data(self) -> bool:
         return cast(int, self._r.dbsize()) > 0
 
@@ -66,6 +82,59 @@ class OrcidIndexRedis:
         self._r.flushdb()
 
 
+_SQLITE_HEADER = b"SQLite format 3\x00"
+# Maximum number of DOIs looked up by a single query, below the SQLite limit on parameters
+_SQLITE_BATCH = 500
+
+
+class OrcidIndexSQLite:
+    """DOI-ORCID index compiled by ``build_orcid_index_db`` into a SQLite file.
+
+    The file is opened read-only and memory-mapped, so it is ready in a few milliseconds
+    and all the worker processes of the machine share its pages in the operating system
+    cache instead of holding their own copy of the index."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        uri = f"file:{quote(os.path.abspath(db_path))}?mode=ro&immutable=1"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size={os.path.getsize(db_path)}")
+
+    def get_value(self, doi: str) -> set[str] | None:
+        rows = self._conn.execute("SELECT value FROM doi_orcid WHERE doi = ?", (doi,)).fetchall()
+        if rows:
+            return {value for (value,) in rows}
+        return None
+
+    def get_values_batch(self, dois: list[str]) -> dict[str, set[str]]:
+        result: dict[str, set[str]] = {}
+        unique_dois = list(dict.fromkeys(dois))
+        for i in range(0, len(unique_dois), _SQLITE_BATCH):
+            chunk = unique_dois[i:i + _SQLITE_BATCH]
+            query = f"SELECT doi, value FROM doi_orcid WHERE doi IN ({','.join('?' * len(chunk))})"
+            for doi, value in self._conn.execute(query, chunk):
+                result.setdefault(doi, set()).add(value)
+        return result
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def is_orcid_index_db(path: str | None) -> bool:
+    """True if ``path`` is a DOI-ORCID index compiled by ``build_orcid_index_db``."""
+    if not path or not os.path.isfile(path):
+        return False
+    with open(path, "rb") as f:
+        return f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+
+
+def open_orcid_index(path: str) -> OrcidIndexSQLite | CSVManager:
+    """Open the DOI-ORCID index at ``path``: a compiled index file or a directory of CSV files."""
+    if is_orcid_index_db(path):
+        return OrcidIndexSQLite(path)
+    return CSVManager(path)
+
+
 def _process_csv_file(csv_path: str) -> dict[str, set[str]]:
     """Process a single CSV file and return DOI -> ORCID mappings.
 
@@ -85,69 +154,195 @@ def _process_csv_file(csv_path: str) -> dict[str, set[str]]:
     return dict(result)
 
 
+def _parse_csv_files(
+    csv_paths: list[str], max_workers: int
+) -> Iterator[tuple[str, dict[str, set[str]]]]:
+    """Parse the CSV files in a pool of ``max_workers`` processes, yielding each path with
+    its DOI -> ORCID mappings as soon as the file is parsed.
+
+    Only a few parsed files wait to be consumed, so the memory used by the calling process
+    does not depend on the size of the index.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=get_context("forkserver")
+    ) as executor:
+        paths = iter(csv_paths)
+        pending: dict[Future[dict[str, set[str]]], str] = {}
+        for csv_path in paths:
+            pending[executor.submit(_process_csv_file, csv_path)] = csv_path
+            if len(pending) >= max_workers * 2:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending[executor.submit(_process_csv_file, next_path)] = next_path
+
+
+def _file_signature(csv_path: str) -> tuple[str, str]:
+    """The modification time and size of a file, and the hash of its content."""
+    stat = os.stat(csv_path)
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return f"{stat.st_mtime_ns}:{stat.st_size}", digest.hexdigest()
+
+
+def _files_to_load(
+    files: dict[str, str], loaded_files: dict[str, str]
+) -> tuple[list[str], dict[str, str]]:
+    """Compare the index files with those already loaded, whose signature is
+    ``<mtime>:<size>:<hash>``. A file whose modification time or size changed is hashed,
+    and it is loaded again only if its content changed too.
+
+    Returns:
+        tuple: the names of the files to load, and the new signature of each of them
+            and of the unchanged files whose modification time changed
+    """
+    to_load: list[str] = []
+    signatures: dict[str, str] = {}
+    for name, csv_path in files.items():
+        stored = loaded_files.get(name)
+        stat = os.stat(csv_path)
+        if stored is not None and stored.rsplit(':', 1)[0] == f"{stat.st_mtime_ns}:{stat.st_size}":
+            continue
+        stat_part, file_hash = _file_signature(csv_path)
+        signatures[name] = f"{stat_part}:{file_hash}"
+        if stored is None or stored.rsplit(':', 1)[1] != file_hash:
+            to_load.append(name)
+    return to_load, signatures
+
+
 def load_orcid_index_to_redis(
     orcid_index_dir: str,
     orcid_index_redis: OrcidIndexRedis,
-    batch_size: int = 1000000,
+    batch_size: int = 100000,
     max_workers: int | None = None,
-) -> None:
+) -> int:
+    """Load into Redis the CSV files of ``orcid_index_dir`` that are new or whose content
+    changed since they were last loaded, and return their number.
+
+    Each file is recorded in Redis, with its modification time, size and hash, once all
+    its values are written, so an interrupted load resumes from the files it did not
+    complete. The values are only ever added, so if a loaded file was deleted or changed
+    the index is cleared and loaded again from all the files. The workers parse one file each, and
+    the values of every file are written as soon as it is parsed, in pipelines of at
+    most ``batch_size`` values.
+    """
     if not exists(orcid_index_dir):
-        return
+        return 0
 
-    files_to_process: list[str] = []
+    files: dict[str, str] = {}
     for cur_dir, _, cur_files in walk(orcid_index_dir):
         for cur_file in cur_files:
             if cur_file.endswith('.csv'):
-                files_to_process.append(cur_dir + sep + cur_file)
-
-    if not files_to_process:
-        return
+                csv_path = cur_dir + sep + cur_file
+                files[os.path.relpath(csv_path, orcid_index_dir)] = csv_path
+
+    loaded_files = orcid_index_redis.get_loaded_files()
+    if not loaded_files and orcid_index_redis.has_data():
+        # Values loaded without recording their files, e.g. by an older version
+        orcid_index_redis.clear()
+    to_load, signatures = _files_to_load(files, loaded_files)
+    if any(name not in files for name in loaded_files) or any(name in loaded_files for name in to_load):
+        # The values of a file cannot be told apart from those of the other files, so
+        # the ones dropped from a deleted or changed file are removed by reloading them all
+        orcid_index_redis.clear()
+        signatures = {name: loaded_files[name] for name in files if name in loaded_files} | signatures
+        to_load = list(files)
+    for name, signature in signatures.items():
+        if name not in to_load:
+            orcid_index_redis.mark_file_loaded(name, signature)
+
+    if not to_load:
+        return 0
 
     if max_workers is None:
-        max_workers = min(cpu_count() or 4, len(files_to_process))
-
-    batch: dict[str, set[str]] = {}
-    count = 0
+        max_workers = min(cpu_count() or 4, len(to_load))
 
     with create_progress() as progress:
         task = progress.add_task(
-            "[green]Loading DOI-ORCID index files", total=len(files_to_process)
+            "[green]Loading DOI-ORCID index files", total=len(to_load)
         )
 
-        with ProcessPoolExecutor(
-            max_workers=max_workers, mp_context=get_context("forkserver")
-        ) as executor:
-            futures = {
-                executor.submit(_process_csv_file, path): path
-                for path in files_to_process
-            }
-
-            for future in as_completed(futures):
-                file_data = future.result()
-
-                # Merge results into batch
-                for doi, values in file_data.items():
-                    if doi in batch:
-                        batch[doi].update(values)
-                    else:
-                        batch[doi] = values
-                    count += len(values)
-
-                # Flush to Redis when batch is large enough
+        names = {files[name]: name for name in to_load}
+        for csv_path, mappings in _parse_csv_files([files[name] for name in to_load], max_workers):
+            name = names[csv_path]
+            batch: dict[str, set[str]] = {}
+            count = 0
+            for doi, values in mappings.items():
+                batch[doi] = values
+                count += len(values)
                 if count >= batch_size:
                     orcid_index_redis.add_values_batch(batch)
                     batch = {}
                     count = 0
+            if batch:
+                orcid_index_redis.add_values_batch(batch)
+            orcid_index_redis.mark_file_loaded(name, signatures[name])
+            progress.update(task, advance=1)
+
+    return len(to_load)
+
 
+def build_orcid_index_db(
+    orcid_index_dir: str,
+    db_path: str,
+    max_workers: int | None = None,
+) -> int:
+    """Compile the CSV files of ``orcid_index_dir`` into the index file read by
+    ``OrcidIndexSQLite``, with the DOIs normalised as in the Redis index, and return the
+    number of DOIs. The file is written next to ``db_path`` and then moved in place, so
+    the processes reading the previous version are not affected."""
+    files_to_process: list[str] = []
+    if exists(orcid_index_dir):
+        for cur_dir, _, cur_files in walk(orcid_index_dir):
+            for cur_file in cur_files:
+                if cur_file.endswith('.csv'):
+                    files_to_process.append(cur_dir + sep + cur_file)
+
+    tmp_path = db_path + ".tmp"
+    if exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(
+        "CREATE TABLE doi_orcid (doi TEXT NOT NULL, value TEXT NOT NULL, "
+        "PRIMARY KEY (doi, value)) WITHOUT ROWID"
+    )
+
+    if files_to_process:
+        if max_workers is None:
+            max_workers = min(cpu_count() or 4, len(files_to_process))
+        with create_progress() as progress:
+            task = progress.add_task(
+                "[green]Compiling DOI-ORCID index files", total=len(files_to_process)
+            )
+            for _, mappings in _parse_csv_files(files_to_process, max_workers):
+                conn.executemany(
+                    "INSERT OR IGNORE INTO doi_orcid VALUES (?, ?)",
+                    ((doi, value) for doi, values in mappings.items() for value in values),
+                )
+                conn.commit()
                 progress.update(task, advance=1)
 
-        if batch:
-            orcid_index_redis.add_values_batch(batch)
+    count = conn.execute("SELECT COUNT(DISTINCT doi) FROM doi_orcid").fetchone()[0]
+    conn.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, db_path)
+    return count
 
 
 class PublishersRedis:
     MEMBER_PREFIX = "member:"
     DOI_PREFIX_KEY = "prefix:"
+    # Hash from each DOI prefix to the JSON [member id, name] of its publisher, so that a
+    # prefix is resolved with a single round-trip
+    PREFIX_INDEX_KEY = "prefix_index"
 
     def __init__(self, testing: bool = False) -> None:
         if testing:
@@ -172,6 +367,21 @@ class PublishersRedis:
             return self.get_by_member(str(member_id))
         return None
 
+    def get_name_and_member_by_prefix(self, prefix: str) -> tuple[str, str] | None:
+        pipe = self._r.pipeline()
+        pipe.hget(self.PREFIX_INDEX_KEY, prefix)
+        pipe.get(f"{self.DOI_PREFIX_KEY}{prefix}")
+        indexed, member_id = pipe.execute()
+        if indexed:
+            member_id, name = json.loads(str(indexed))
+            return name, member_id
+        if member_id:
+            # Databases loaded before the prefix index was introduced
+            pub_data = self.get_by_member(str(member_id))
+            if pub_data:
+                return str(pub_data["name"]), str(member_id)
+        return None
+
     def set_publisher(self, member_id: str, name: str, prefixes: set[str]) -> None:
         member_key = f"{self.MEMBER_PREFIX}{member_id}"
         data = {"name": name, "prefixes": list(prefixes)}
@@ -179,6 +389,7 @@ class PublishersRedis:
         for prefix in prefixes:
             prefix_key = f"{self.DOI_PREFIX_KEY}{prefix}"
             self._r.set(prefix_key, member_id)
+            self._r.hset(self.PREFIX_INDEX_KEY, prefix, json.dumps([member_id, name]))
 
     def set_publishers_batch(self, publishers: dict[str, dict[str, str | set[str]]]) -> None:
         pipe = self._r.pipeline()
@@ -189,6 +400,7 @@ class PublishersRedis:
             for prefix in prefixes_list:
                 prefix_key = f"{self.DOI_PREFIX_KEY}{prefix}"
                 pipe.set(prefix_key, member_id)
+                pipe.hset(self.PREFIX_INDEX_KEY, prefix, json.dumps([member_id, data["name"]]))
         pipe.execute()
 
     def has_data(self) -> bool:
@@ -45,6 +45,12 @@ class FakeRedisWrapper:
     def flushdb(self) -> None:
         self._r.flushdb()
 
+    def scan_iter(self, match: str = "*", count: int | None = None) -> object:
+        return self._r.scan_iter(match=match, count=count)
+
+    def dbsize(self) -> int:
+        return cast(int, self._r.dbsize())
+
     def exists_as_set(self, resource_id: str) -> bool:
         return cast(int, self._r.scard(resource_id)) > 0
 
@@ -119,8 +125,11 @@ class RedisDataSource(DataSource):
     def delete(self, resource_id: str) -> None:
         self._r.delete(resource_id)
 
-    def scan_iter(self, match: str = "*") -> object:
-        return self._r.scan_iter(match=match)
+    def scan_iter(self, match: str = "*", count: int | None = None) -> object:
+        return self._r.scan_iter(match=match, count=count)
+
+    def dbsize(self) -> int:
+        return cast(int, self._r.dbsize())
 
     def set(self, resource_id: str, value: object) -> bool | None:
         return cast(bool | None, self._r.set(resource_id, json.dumps(value)))
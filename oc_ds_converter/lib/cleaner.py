@@ -8,6 +8,7 @@
 import html
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple, Union
 
 from dateutil.parser import parse
@@ -21,6 +22,27 @@ from oc_ds_converter.lib.master_of_regex import (
 )
 
 
+def _anchored(pattern: str) -> re.Pattern:
+    return re.compile(f'^{pattern}$', re.IGNORECASE)
+
+
+def _any_of(patterns) -> re.Pattern:
+    # Each pattern keeps its own anchors, exactly as if searched on its own
+    return re.compile('|'.join(f'(?:^{pattern}$)' for pattern in patterns), re.IGNORECASE)
+
+
+# Compiled once: the alternations in vi_pattern are too many for the re module cache
+INVALID_VI_REGEXES = [(_anchored(pattern), strategy) for pattern, strategy in invalid_vi_patterns.items()]
+ANY_INVALID_VI_REGEX = _any_of(invalid_vi_patterns)
+VOLUME_VALID_REGEX = _any_of(volumes_valid_patterns)
+ISSUE_VALID_REGEX = _any_of(issues_valid_patterns)
+
+# YYYY, YYYY-MM and YYYY-MM-DD, with month and day possibly not zero-padded as in Crossref date-parts
+ISO_DATE_REGEX = re.compile(r'([1-9]\d{3})(?:-(\d{1,2})(?:-(\d{1,2}))?)?', re.ASCII)
+# Dates that are not plain ISO dates are parsed with dateutil, and the results memoized
+DATE_CACHE_SIZE = 65536
+
+
 class Cleaner:
     def __init__(self, string:str):
         '''
@@ -145,7 +167,8 @@ class Cleaner:
         new_title = ' '.join(words)
         return new_title
 
-    def __date_parse_hack(self, date:str) -> datetime:
+    @staticmethod
+    def __date_parse_hack(date:str) -> str:
         dt = parse(date, default=datetime(2001, 1, 1))
         dt2 = parse(date, default=datetime(2002, 2, 2))
 
@@ -159,20 +182,28 @@ class Cleaner:
             clean_date = ''
         return clean_date
 
-    def clean_date(self) -> str:
-        '''
-        It tries to parse a date-string into a datetime object, 
-        considering both the validity of the format (YYYYY-MM-DD) and the value (e.g. 30 February is not a valid date). 
-        For example, a date 2020-02-30 will become 2020-02, because the day is invalid. 
-        On the other hand, 2020-27-12 will become 2020 since the day
-        and month are invalid. 
-        If the year is not valid (e.g.year >9999) data would be totally discarded.
+    @staticmethod
+    def __iso_date(date:str) -> Union[str, None]:
+        match = ISO_DATE_REGEX.fullmatch(date)
+        if not match:
+            return None
+        year, month, day = match.groups()
+        try:
+            datetime(int(year), int(month or 1), int(day or 1))
+        except ValueError:
+            # Left to dateutil, which may still recover part of the date
+            return None
+        if day:
+            return f'{year}-{int(month):02d}-{int(day):02d}'
+        if month:
+            return f'{year}-{int(month):02d}'
+        return year
 
-        :returns: str -- The cleaned date or an empty string
-        '''
-        date = self.string
+    @staticmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
+    def __parse_date(date:str) -> str:
         try:
-            date = self.__date_parse_hack(date)
+            date = Cleaner.__date_parse_hack(date)
         except ValueError:
             try:
                 # e.g. 2021-12-17
@@ -180,12 +211,12 @@ class Cleaner:
                     try:
                         # Maybe only the day is invalid, try year-month
                         new_date = date[:-3]
-                        date = self.__date_parse_hack(new_date)
+                        date = Cleaner.__date_parse_hack(new_date)
                     except ValueError:
                         try:
                             # Maybe only the month is invalid, try year
                             new_date = date[:-6]
-                            date = self.__date_parse_hack(new_date)
+                            date = Cleaner.__date_parse_hack(new_date)
                         except ValueError:
                             date = ''
                 # e.g. 2021-12
@@ -193,7 +224,7 @@ class Cleaner:
                     # Maybe only the month is invalid, try year
                     try:
                         new_date = date[:-3]
-                        date = self.__date_parse_hack(new_date)
+                        date = Cleaner.__date_parse_hack(new_date)
                     except ValueError:
                         date = ''
                 else:
@@ -202,6 +233,25 @@ class Cleaner:
                 date = ''
         return date
 
+    def clean_date(self) -> str:
+        '''
+        It tries to parse a date-string into a datetime object, 
+        considering both the validity of the format (YYYYY-MM-DD) and the value (e.g. 30 February is not a valid date). 
+        For example, a date 2020-02-30 will become 2020-02, because the day is invalid. 
+        On the other hand, 2020-27-12 will become 2020 since the day
+        and month are invalid. 
+        If the year is not valid (e.g.year >9999) data would be totally discarded.
+        Valid ISO dates are normalised directly, any other string is parsed with dateutil.
+
+        :returns: str -- The cleaned date or an empty string
+        '''
+        date = self.string
+        if isinstance(date, str):
+            iso_date = self.__iso_date(date)
+            if iso_date is not None:
+                return iso_date
+        return self.__parse_date(date)
+
     def clean_name(self) -> str:
         '''
         The first letter of each element of the name is capitalized and superfluous spaces are removed.
@@ -316,9 +366,11 @@ class Cleaner:
             vi = Cleaner(vi).normalize_hyphens()
             vi = Cleaner(vi).normalize_spaces().strip()
             vi = html.unescape(vi)
-            for pattern, strategy in invalid_vi_patterns.items():
-                pattern = f'^{pattern}$'
-                capturing_groups = re.search(pattern, vi, re.IGNORECASE)
+            # Plain numbers, by far the most frequent values, match none of the patterns
+            if (vi.isdigit() and vi.isascii()) or not ANY_INVALID_VI_REGEX.search(vi):
+                continue
+            for regex, strategy in INVALID_VI_REGEXES:
+                capturing_groups = regex.search(vi)
                 if capturing_groups:
                     if strategy == 'del':
                         row[field] = ''
@@ -339,16 +391,12 @@ class Cleaner:
         switch_vi = {'volume': '', 'issue': ''}
         for field in {'volume', 'issue'}:
             vi = row[field]
-            for pattern in volumes_valid_patterns:
-                pattern = f'^{pattern}$'
-                if re.search(pattern, vi, re.IGNORECASE):
-                    if field == 'issue':
-                        switch_vi['volume'] = vi
-            for pattern in issues_valid_patterns:
-                pattern = f'^{pattern}$'
-                if re.search(pattern, vi, re.IGNORECASE):
-                    if field == 'volume':
-                        switch_vi['issue'] = vi
+            if not vi or (vi.isdigit() and vi.isascii()):
+                continue
+            if field == 'issue' and VOLUME_VALID_REGEX.search(vi):
+                switch_vi['volume'] = vi
+            if field == 'volume' and ISSUE_VALID_REGEX.search(vi):
+                switch_vi['issue'] = vi
         if switch_vi['volume'] and switch_vi['issue']:
             row['volume'] = switch_vi['volume']
             row['issue'] = switch_vi['issue']
@@ -9,12 +9,13 @@ import json
 import os
 import re
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
 from oc_ds_converter.datasource.orcid_index import OrcidIndexRedis, PublishersRedis
+from oc_ds_converter.datasource.meta_filter import MetaFilteredRedis, meta_filtered
 from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
+from oc_ds_converter.lib.markup import strip_markup
 from oc_ds_converter.oc_idmanager import ORCIDManager
 from oc_ds_converter.oc_idmanager.doi import DOIManager
 from oc_ds_converter.oc_idmanager.issn import ISSNManager
@@ -25,6 +26,8 @@ from oc_ds_converter.ra_processor import RaProcessor
 
 
 _WHITESPACE_RE = re.compile(r'\s+')
+# Number of DOI prefixes whose publisher is kept by each processor
+PREFIX_CACHE_SIZE = 1024
 
 
 class CrossrefStyleProcessing(RaProcessor):
@@ -39,8 +42,7 @@ class CrossrefStyleProcessing(RaProcessor):
     @staticmethod
     def clean_markup(text: str) -> str:
         if '<' in text:
-            soup = BeautifulSoup(text, 'html.parser')
-            text = soup.get_text()
+            text = strip_markup(text)
         return html.unescape(text).replace('\n', '')
 
     @staticmethod
@@ -81,6 +83,8 @@ class CrossrefStyleProcessing(RaProcessor):
         self._publishers_redis: PublishersRedis | None = None
         if use_redis_publishers:
             self._publishers_redis = PublishersRedis(testing=testing)
+        # Most rows of a file share a handful of prefixes
+        self._publisher_by_prefix = lru_cache(maxsize=PREFIX_CACHE_SIZE)(self._lookup_publisher_by_prefix)
 
         if storage_manager is None:
             self.storage_manager = RedisStorageManager(testing=testing)
@@ -95,6 +99,7 @@ class CrossrefStyleProcessing(RaProcessor):
         self.venue_id_man_dict: dict[str, object] = {"issn": self.issn_m}
 
         self.tmp_doi_m = DOIManager(storage_manager=self.temporary_manager, testing=testing)
+        self._prevalidation_doi_m = DOIManager(storage_manager=BatchManager(), testing=testing)
 
         self.venue_tmp_id_man_dict: dict[str, object] = {"issn": self.issn_m}
 
@@ -106,27 +111,40 @@ class CrossrefStyleProcessing(RaProcessor):
         )
 
         if testing:
-            self.BR_redis: FakeRedisWrapper | RedisDataSource = FakeRedisWrapper()
-            self.RA_redis: FakeRedisWrapper | RedisDataSource = FakeRedisWrapper()
+            self.BR_redis: FakeRedisWrapper | RedisDataSource | MetaFilteredRedis = FakeRedisWrapper()
+            self.RA_redis: FakeRedisWrapper | RedisDataSource | MetaFilteredRedis = FakeRedisWrapper()
         else:
-            self.BR_redis = RedisDataSource("DB-META-BR")
-            self.RA_redis = RedisDataSource("DB-META-RA")
+            self.BR_redis = meta_filtered(RedisDataSource("DB-META-BR"), "DB-META-BR")
+            self.RA_redis = meta_filtered(RedisDataSource("DB-META-RA"), "DB-META-RA")
 
-        self._redis_values_br: list[str] = []
-        self._redis_values_ra: list[str] = []
+        self._redis_values_br: set[str] = set()
+        self._redis_values_ra: set[str] = set()
         self._doi_orcid_cache: dict[str, set[str]] = {}
+        self._storage_values: dict[str, bool | None] = {}
+        self._prevalidated_dois: dict[str, tuple[bool, str]] = {}
+
+    def reset_file_state(self) -> None:
+        """Drop the data gathered for the previous input file, so that a single instance
+        (with its id managers and connections) can be reused across files."""
+        self.temporary_manager.delete_storage()
+        self._redis_values_br = set()
+        self._redis_values_ra = set()
+        self._doi_orcid_cache = {}
+        self._storage_values = {}
+        self._prevalidated_dois = {}
+        self._meta_existence = {}
 
     def update_redis_values(self, br: list[str], ra: list[str] | None = None) -> None:
-        self._redis_values_br = [
+        self._redis_values_br = {
             x for x in (
                 self.doi_m.normalise(b, include_prefix=True) for b in (br or [])
             ) if x
-        ]
-        self._redis_values_ra = [
+        }
+        self._redis_values_ra = {
             x for x in (
                 self.orcid_m.normalise(r, include_prefix=True) for r in (ra or [])
             ) if x
-        ]
+        }
 
     def prefetch_doi_orcid_index(self, dois: list[str]) -> None:
         keys = [
@@ -135,6 +153,30 @@ class CrossrefStyleProcessing(RaProcessor):
         ]
         self._doi_orcid_cache = self.orcid_index.get_values_batch(keys)
 
+    def prefetch_storage_values(self, ids: list[str]) -> None:
+        """Read the stored validity of the given normalised ids with a single storage
+        round-trip. The values are used by ``stored_validity`` and ``validated_as``
+        until the next ``memory_to_storage``."""
+        self._storage_values = self.storage_manager.get_values_batch(ids)
+
+    def stored_validity(self, norm_id: str) -> bool | None:
+        if norm_id in self._storage_values:
+            return self._storage_values[norm_id]
+        return self.storage_manager.get_value(norm_id)
+
+    def prevalidate_dois(self, norm_ids: list[str]) -> None:
+        """Validate concurrently the DOIs that ``to_validated_id_list`` would otherwise check
+        against the API one at a time: those neither stored nor found in Meta. The results
+        are used by ``to_validated_id_list`` until the next ``memory_to_storage``."""
+        to_check = [
+            norm_id for norm_id in dict.fromkeys(norm_ids)
+            if norm_id not in self._redis_values_br
+            and self.tmp_doi_m.validated_as_id(norm_id) is None
+            and self.stored_validity(norm_id) is None
+        ]
+        self._prevalidation_doi_m.storage_manager.delete_storage()
+        self._prevalidated_dois = self._prevalidation_doi_m.check_many(to_check) if to_check else {}
+
     def orcid_finder(self, doi: str) -> dict[str, str]:
         norm_doi = self.doi_m.normalise(doi, include_prefix=True)
         if not norm_doi:
@@ -155,7 +197,11 @@ class CrossrefStyleProcessing(RaProcessor):
         kv_in_memory = self.temporary_manager.get_validity_list_of_tuples()
         if kv_in_memory:
             self.storage_manager.set_multi_value(kv_in_memory)
+            self.storage_manager.store_file()
         self.temporary_manager.delete_storage()
+        self._storage_values = {}
+        self._prevalidated_dois = {}
+        self._meta_existence = {}
 
     def get_id_manager(
         self, schema_or_id: str, id_man_dict: dict[str, object]
@@ -180,7 +226,7 @@ class CrossrefStyleProcessing(RaProcessor):
             validity = self.RA_redis.mexists_as_set(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         if redis_db == "br":
-            validity = self.BR_redis.mexists_as_set(ids)
+            validity = self.check_meta_existence(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         raise ValueError("redis_db must be either 'ra' or 'br'")
 
@@ -191,13 +237,13 @@ class CrossrefStyleProcessing(RaProcessor):
         if schema == "orcid":
             validity_value = self.tmp_orcid_m.validated_as_id(identifier)
             if validity_value is None:
-                validity_value = self.orcid_m.validated_as_id(identifier)
+                validity_value = self.stored_validity(identifier)
             return validity_value
 
         if schema == "doi":
             validity_value = self.tmp_doi_m.validated_as_id(identifier)
             if validity_value is None:
-                validity_value = self.doi_m.validated_as_id(identifier)
+                validity_value = self.stored_validity(identifier)
             return validity_value
         return None
 
@@ -210,6 +256,12 @@ class CrossrefStyleProcessing(RaProcessor):
             if norm_id in self._redis_values_br:
                 self.tmp_doi_m.storage_manager.set_value(norm_id, True)
                 valid_id_list.append(norm_id)
+            elif norm_id in self._prevalidated_dois:
+                # As in is_valid, a repaired DOI is stored under its repaired form only
+                valid, stored_id = self._prevalidated_dois.pop(norm_id)
+                self.tmp_doi_m.storage_manager.set_value(stored_id, valid)
+                if valid:
+                    valid_id_list.append(norm_id)
             elif self.tmp_doi_m.is_valid(norm_id):
                 valid_id_list.append(norm_id)
 
@@ -226,19 +278,12 @@ class CrossrefStyleProcessing(RaProcessor):
 
     def get_publisher_by_prefix(self, prefix: str) -> tuple[str, str] | None:
         """Look up publisher by DOI prefix. Returns (name, member_id) or None."""
+        return self._publisher_by_prefix(prefix)
+
+    def _lookup_publisher_by_prefix(self, prefix: str) -> tuple[str, str] | None:
         if self.use_redis_publishers and self._publishers_redis:
-            pub_data = self._publishers_redis.get_by_prefix(prefix)
-            if pub_data:
-                member_id = self._publishers_redis._r.get(
-                    f"{self._publishers_redis.DOI_PREFIX_KEY}{prefix}"
-                )
-                return str(pub_data['name']), str(member_id)
-            return None
-        if self.publishers_mapping:
-            for member, data in self.publishers_mapping.items():
-                if prefix in data['prefixes']:
-                    return str(data['name']), member
-        return None
+            return self._publishers_redis.get_name_and_member_by_prefix(prefix)
+        return self.publishers_prefix_index.get(prefix)
 
     def _extract_volume(self, item: dict) -> str:
         return item.get('volume', '')
@@ -8,19 +8,27 @@ from __future__ import annotations
 
 import os
 import gzip
+import io
 import os.path
 import pathlib
 import tarfile
 import zipfile
-from json import load, loads
+from collections.abc import Iterable, Iterator
+from json import JSONDecoder, load, loads
 from os import makedirs, sep, walk
 from os.path import basename, exists, isdir
-from typing import Tuple
+from typing import TextIO, Tuple, TypeVar
 
 import zstandard as zstd
 
 from oc_ds_converter.lib.file_manager import init_cache
 
+T = TypeVar("T")
+
+_JSON_DECODER = JSONDecoder()
+_STREAM_CHUNK_SIZE = 1 << 16
+_JSON_WHITESPACE = ' \t\n\r'
+
 
 def get_all_files(is_dir_or_targz_file:str, cache_filepath:str|None=None) -> Tuple[list, tarfile.TarFile|None]:
     result = []
@@ -65,6 +73,168 @@ def load_json(file:str|tarfile.TarInfo, targz_fd:tarfile.TarFile | None) -> dict
     return result
 
 
+def open_json_text(
+    file: str | tarfile.TarInfo,
+    targz_fd: tarfile.TarFile | None,
+    content: bytes | None = None,
+) -> TextIO:
+    """Open a .json, .json.gz or tar member as a decoded text stream, without reading it.
+
+    If ``content`` is given, it holds the raw bytes of ``file`` (e.g. a tar member already
+    extracted by another process) and neither the filesystem nor ``targz_fd`` is accessed.
+    """
+    if content is not None:
+        return io.TextIOWrapper(io.BytesIO(content), encoding="utf-8")
+    if targz_fd is None:
+        if file.endswith(".json.gz"):  # type: ignore
+            return gzip.open(file, 'rt', encoding='utf-8')  # type: ignore
+        return open(file, encoding="utf8")  # type: ignore
+    cur_tar_file = targz_fd.extractfile(file)
+    if cur_tar_file is None:
+        raise ValueError(f"{file} is not a regular file in the archive")
+    return io.TextIOWrapper(cur_tar_file, encoding="utf-8")
+
+
+class _JsonStreamReader:
+    """Minimal pull parser over a text stream: it only understands the structure of the
+    enclosing containers and delegates every value to ``json.JSONDecoder.raw_decode``,
+    keeping at most one value plus one read chunk in memory."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = _STREAM_CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Malformed JSON stream: expected one of {chars!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A bare number cut at the end of the buffer decodes "successfully": make sure
+            # something follows the value before trusting it.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_json_items(
+    file: str | tarfile.TarInfo,
+    targz_fd: tarfile.TarFile | None,
+    key: str = "items",
+    content: bytes | None = None,
+) -> Iterator[dict]:
+    """Lazily yield the elements of the top-level ``key`` array of a JSON object.
+
+    Unlike ``load_json``, the file is never held in memory as a whole, so the memory used
+    per file is bounded by the size of its largest item. Other top-level keys are parsed
+    and discarded. See ``open_json_text`` for ``content``.
+    """
+    with open_json_text(file, targz_fd, content) as stream:
+        reader = _JsonStreamReader(stream)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            cur_key = reader.value()
+            reader.expect(':')
+            if cur_key == key:
+                reader.expect('[')
+                if reader.peek() == ']':
+                    reader.expect(']')
+                else:
+                    while True:
+                        yield reader.value()  # type: ignore[misc]
+                        if reader.expect(',]') == ']':
+                            break
+            else:
+                reader.value()
+            if reader.expect(',}') == '}':
+                return
+
+
+def read_tar_member(targz_fd: tarfile.TarFile, member: tarfile.TarInfo) -> bytes:
+    """Return the decompressed bytes of a single archive member."""
+    cur_tar_file = targz_fd.extractfile(member)
+    if cur_tar_file is None:
+        raise ValueError(f"{member.name} is not a regular file in the archive")
+    return cur_tar_file.read()
+
+
+class GzipJsonLines:
+    """Lazily yields the JSON value on each line of a gzipped JSON Lines file, or None for
+    blank lines, so that each value keeps the position of its line.
+
+    Each line is decompressed and parsed once, and only the current one is held in memory.
+    ``offset`` is the position, in the decompressed file, after the last line yielded: a
+    reader created with that ``offset`` continues from the next line, without splitting or
+    parsing the lines before it. The first ``skip_lines`` lines after ``offset`` are read
+    but not parsed.
+    """
+
+    def __init__(self, path: str, offset: int = 0, skip_lines: int = 0) -> None:
+        self.path = path
+        self.offset = offset
+        self.skip_lines = skip_lines
+
+    def __iter__(self) -> Iterator[dict | None]:
+        with gzip.open(self.path, 'rb') as f:
+            if self.offset:
+                f.seek(self.offset)
+            for line_number, line in enumerate(f):
+                self.offset += len(line)
+                if line_number < self.skip_lines:
+                    continue
+                yield loads(line) if line.strip() else None
+
+
+def batched(iterable: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """Split ``iterable`` into lists of at most ``batch_size`` elements."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    batch: list[T] = []
+    for element in iterable:
+        batch.append(element)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _is_container_zip(zip_path: str) -> bool:
     """Check if a zip contains other zips (container) vs data files (final)."""
     with zipfile.ZipFile(zip_path, 'r') as zf:
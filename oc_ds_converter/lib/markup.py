@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import re
+
+from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
+
+# A start, end or self-closing tag with well-formed attributes, such as the JATS and
+# MathML inline elements found in titles
+_TAG = re.compile(
+    r'</?[A-Za-z][A-Za-z0-9:_.-]*'
+    r'(?:\s+[^\s"\'<>/=]+(?:\s*=\s*(?:"[^"<>]*"|\'[^\'<>]*\'|[^\s"\'<>=`]+))?)*'
+    r'\s*/?>'
+)
+_TAG_NAME = re.compile(r'</?([A-Za-z][A-Za-z0-9:_.-]*)')
+# Elements whose text the HTML parser or Beautiful Soup treat differently from that of
+# the other elements
+_SPECIAL_ELEMENTS = frozenset({
+    'script', 'style', 'template', 'rt', 'rp', 'textarea', 'title', 'xmp', 'iframe',
+    'noembed', 'noframes', 'noscript', 'plaintext', 'pre',
+})
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+_REFERENCE = re.compile(r'&(?:([A-Za-z][A-Za-z0-9]*)|#([0-9]{1,7})|#[xX]([0-9A-Fa-f]{1,6}));')
+
+
+def _is_plain_char(codepoint: int) -> bool:
+    return 0x20 <= codepoint < 0x7F or 0xA0 <= codepoint < 0xD800 or 0xE000 <= codepoint < 0xFDD0
+
+
+def _text_node(data: str) -> str:
+    # Beautiful Soup replaces a string made only of ASCII spaces with a space or a newline
+    if data and not data.strip(_ASCII_SPACES):
+        return '\n' if '\n' in data else ' '
+    return data
+
+
+def _dereference(match: re.Match[str]) -> str:
+    name, decimal, hexadecimal = match.groups()
+    if name is not None:
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        if character is None:
+            raise ValueError(name)
+        return character
+    codepoint = int(decimal) if decimal is not None else int(hexadecimal, 16)
+    if not _is_plain_char(codepoint):
+        raise ValueError(codepoint)
+    return chr(codepoint)
+
+
+def _strip_simple_markup(text: str) -> str | None:
+    """The text of ``text`` if it only contains well-formed tags and character references,
+    None otherwise."""
+    if '<' in text:
+        for tag in _TAG.findall(text):
+            name = _TAG_NAME.match(tag).group(1).lower()  # type: ignore[union-attr]
+            if name in _SPECIAL_ELEMENTS:
+                return None
+        segments = _TAG.split(text)
+    else:
+        segments = [text]
+    for i, segment in enumerate(segments):
+        if '<' in segment:
+            return None
+        if '&' in segment:
+            if segment.count('&') != len(_REFERENCE.findall(segment)):
+                return None
+            try:
+                segment = _REFERENCE.sub(_dereference, segment)
+            except ValueError:
+                return None
+        segments[i] = _text_node(segment)
+    return ''.join(segments)
+
+
+def strip_markup(text: str) -> str:
+    """Returns the text of a string that may contain HTML or XML markup, with the character
+    references resolved: the same as ``BeautifulSoup(text, 'html.parser').get_text()``.
+
+    Titles only contain a few inline tags and entities, which are removed with regular
+    expressions; the other strings, e.g. those with comments, CDATA sections or stray
+    ``<`` and ``&`` characters, are still parsed with Beautiful Soup.
+    """
+    if '<' not in text and '&' not in text:
+        return _text_node(text)
+    stripped = _strip_simple_markup(text)
+    if stripped is None:
+        return BeautifulSoup(text, 'html.parser').get_text()
+    return stripped
@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: ISC
 
 import csv
+import gzip
 import json
 import os
+import shutil
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from filelock import BaseFileLock
@@ -86,6 +89,62 @@ def delete_cache_files(cache_path: str) -> None:
     lock_file = cache_path + ".lock"
     if os.path.exists(lock_file):
         os.remove(lock_file)
+    work_dir = get_cited_work_dir(cache_path)
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+
+
+def get_cited_work_dir(cache_path: str) -> str:
+    return os.path.splitext(cache_path)[0] + "_cited_work"
+
+
+def _cited_work_path(cache_path: str, filename: str) -> str:
+    return os.path.join(get_cited_work_dir(cache_path), Path(filename).name + ".jsonl.gz")
+
+
+class CitedWorkWriter:
+    """Spill of the entities of an input file that the cited-entities iteration needs,
+    reduced to their citations, written while the citing-entities iteration parses the file.
+
+    The second iteration reads it back through ``iter_cited_work`` instead of decompressing
+    and parsing the original file again. The spill becomes visible only after ``commit``,
+    which must precede ``mark_file_completed`` so that a completed file always has a
+    complete spill.
+    """
+
+    def __init__(self, cache_path: str, filename: str) -> None:
+        self.filepath = _cited_work_path(cache_path, filename)
+        Path(self.filepath).parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_filepath = self.filepath + ".tmp"
+        self._file = gzip.open(self._tmp_filepath, "wt", encoding="utf-8", compresslevel=1)
+
+    def write(self, entities: Iterable[dict]) -> None:
+        for entity in entities:
+            self._file.write(json.dumps(entity, ensure_ascii=False))
+            self._file.write("\n")
+
+    def commit(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_filepath, self.filepath)
+
+
+def has_cited_work(cache_path: str, filename: str) -> bool:
+    return os.path.exists(_cited_work_path(cache_path, filename))
+
+
+def iter_cited_work(cache_path: str, filename: str) -> Iterator[dict] | None:
+    """Return the entities spilled by ``CitedWorkWriter`` for ``filename``, or None if the
+    first iteration did not produce a spill for it."""
+    if not has_cited_work(cache_path, filename):
+        return None
+    filepath = _cited_work_path(cache_path, filename)
+
+    def _read() -> Iterator[dict]:
+        with gzip.open(filepath, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    return _read()
 
 
 def create_output_dirs(csv_dir: str) -> str:
@@ -97,15 +156,17 @@ def create_output_dirs(csv_dir: str) -> str:
     return citations_dir
 
 
-def write_csv_output(filepath: str, rows: list[dict[str, str]]) -> None:
+def write_csv_output(filepath: str, rows: list[dict[str, str]], append: bool = False) -> None:
     if not rows:
         return
-    with open(filepath, 'w', newline='', encoding='utf-8') as output_file:
+    write_header = not append or not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+    with open(filepath, 'a' if append else 'w', newline='', encoding='utf-8') as output_file:
         dict_writer = csv.DictWriter(
             output_file, rows[0].keys(), delimiter=',', quotechar='"',
             quoting=csv.QUOTE_NONNUMERIC, escapechar='\\'
         )
-        dict_writer.writeheader()
+        if write_header:
+            dict_writer.writeheader()
         dict_writer.writerows(rows)
 
 
@@ -7,7 +7,6 @@ from typing import List, Tuple
 
 from bs4 import BeautifulSoup
 from oc_ds_converter.oc_idmanager import DOIManager, ORCIDManager
-from oc_ds_converter.lib.csvmanager import CSVManager
 
 from oc_ds_converter.ra_processor import RaProcessor
 
@@ -15,7 +14,6 @@ from oc_ds_converter.ra_processor import RaProcessor
 class MedraProcessing(RaProcessor):
     def __init__(self, orcid_index: str | None = None):
         super().__init__(orcid_index)
-        self.orcid_index = CSVManager(orcid_index)
         self._om = ORCIDManager()
     
     def csv_creator(self, xml_soup:BeautifulSoup) -> dict:
@@ -7,13 +7,13 @@
 
 
 from re import compile, match, search
-from time import sleep
 from urllib.parse import quote, unquote
 
 import xmltodict
 from oc_ds_converter.oc_idmanager import *
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
@@ -162,7 +162,7 @@ class ArXivManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(
+                        r = http_get(
                             api + quote(arxiv_full_norm),
                             headers=self._headers,
                             timeout=30,
@@ -200,8 +200,8 @@ class ArXivManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
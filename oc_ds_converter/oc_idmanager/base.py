@@ -4,7 +4,128 @@
 # SPDX-License-Identifier: ISC
 
 
+import os
+import threading
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import TypeVar
+
+# The environment variable holding the size of the memoization caches: spawned worker
+# processes inherit it, so they memoize like the process that enabled it
+MEMOIZE_ENV = "OC_DS_CONVERTER_MEMOIZE_IDS"
+MEMO_CACHE_SIZE = 100000
+
+_memo_size: int | None = int(os.environ[MEMOIZE_ENV]) if os.environ.get(MEMOIZE_ENV) else None
+_memo_caches: dict[tuple[type, str], "MemoCache"] = {}
+
+# Threads checking ids concurrently in ``check_many``
+CHECK_WORKERS = 8
+
+_check_executors: dict[int, ThreadPoolExecutor] = {}
+_check_executors_lock = threading.Lock()
+
+_Method = TypeVar("_Method", bound=Callable[..., object])
+
+
+class MemoCache:
+    """A bounded least recently used cache of the results of a method, shared by all the
+    instances of an identifier manager class in the process."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[object, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: object) -> tuple[bool, object]:
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._results.move_to_end(key)
+            return True, result
+
+    def store(self, key: object, result: object) -> None:
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def stats(self) -> dict[str, float]:
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._results),
+            "hit_rate": self.hits / calls if calls else 0.0,
+        }
+
+
+def memoized(method: _Method) -> _Method:
+    """Memoizes a method that only depends on its arguments, such as ``normalise``,
+    ``check_digit`` or ``syntax_ok``, once ``enable_memoization`` has been called."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: "IdentifierManager", *args: object, **kwargs: object) -> object:
+        if _memo_size is None:
+            return method(self, *args, **kwargs)
+        cache = _memo_caches.get((type(self), name))
+        if cache is None:
+            cache = _memo_caches[(type(self), name)] = MemoCache(_memo_size)
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        try:
+            found, result = cache.lookup(key)
+        except TypeError:
+            # Unhashable arguments
+            return method(self, *args, **kwargs)
+        if not found:
+            result = method(self, *args, **kwargs)
+            cache.store(key, result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def enable_memoization(maxsize: int = MEMO_CACHE_SIZE) -> None:
+    """Memoize the methods decorated with ``memoized``, keeping up to ``maxsize`` results
+    per method and manager class, in this process and in the worker processes it starts
+    afterwards."""
+    global _memo_size
+    _memo_size = maxsize
+    os.environ[MEMOIZE_ENV] = str(maxsize)
+    _memo_caches.clear()
+
+
+def disable_memoization() -> None:
+    global _memo_size
+    _memo_size = None
+    os.environ.pop(MEMOIZE_ENV, None)
+    _memo_caches.clear()
+
+
+def memoization_stats() -> dict[str, dict[str, float]]:
+    """The hits, misses, size and hit rate of each cache, keyed by ``<class>.<method>``."""
+    return {f"{cls.__name__}.{name}": cache.stats() for (cls, name), cache in _memo_caches.items()}
+
+
+def _get_check_executor(max_workers: int) -> ThreadPoolExecutor:
+    """The thread pool of ``max_workers`` threads shared by the managers of the process. Its
+    threads live as long as the process, and with them their pooled HTTP sessions."""
+    with _check_executors_lock:
+        executor = _check_executors.get(max_workers)
+        if executor is None:
+            executor = _check_executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="id-check"
+            )
+    return executor
 
 
 class IdentifierManager(metaclass=ABCMeta):
@@ -14,6 +135,10 @@ class IdentifierManager(metaclass=ABCMeta):
 
     _headers: dict[str, str]
 
+    # True in the subclasses whose ``_check_validity`` does not use the storage, so that
+    # ``is_valid_many`` can run it in several threads
+    _concurrent_checks = False
+
     def __init__(self, **params: object) -> None:
         """Identifier manager constructor."""
         for key in params:
@@ -42,6 +167,76 @@ class IdentifierManager(metaclass=ABCMeta):
     def validated_as_id(self, id_string: str) -> bool | None:
         return None
 
+    def is_valid_many(self, id_strings: Iterable[str], max_workers: int = CHECK_WORKERS) -> dict[str, bool]:
+        """Returns the validity of several ids, keyed by the given id strings.
+
+        Args:
+            id_strings (Iterable[str]): ids to check
+            max_workers (int, optional): maximum number of concurrent checks
+        Returns:
+            dict: the validity of each id string
+        """
+        return {id_string: valid for id_string, (valid, _) in self.check_many(id_strings, max_workers).items()}
+
+    def check_many(
+        self, id_strings: Iterable[str], max_workers: int = CHECK_WORKERS
+    ) -> dict[str, tuple[bool, str]]:
+        """Returns the validity of several ids and the id under which each validity is
+        stored, keyed by the given id strings: the stored id differs from the normalised
+        one when the manager repaired the id.
+
+        The ids without a stored validity are checked by up to ``max_workers`` threads of
+        a pool kept for the whole process, so that the HTTP session of each thread, with its
+        open connections, is reused across calls. The storage is read with a single
+        ``get_values_batch`` and written by the calling thread only.
+
+        Args:
+            id_strings (Iterable[str]): ids to check
+            max_workers (int, optional): maximum number of concurrent checks
+        Returns:
+            dict: the validity and the stored id of each id string
+        """
+        if not self._concurrent_checks:
+            result = {}
+            for id_string in id_strings:
+                norm_id = self.normalise(id_string, include_prefix=True)
+                result[id_string] = (bool(self.is_valid(id_string)), norm_id or id_string)
+            return result
+        storage_manager = getattr(self, "storage_manager", None)
+        result: dict[str, tuple[bool, str]] = {}
+        norm_ids: dict[str, str] = {}
+        for id_string in id_strings:
+            norm_id = self.normalise(id_string, include_prefix=True)
+            if norm_id is None:
+                result[id_string] = (False, id_string)
+            else:
+                norm_ids[id_string] = norm_id
+        unique_ids = list(dict.fromkeys(norm_ids.values()))
+        stored = storage_manager.get_values_batch(unique_ids) if storage_manager else {}
+        checked: dict[str, tuple[bool, str]] = {
+            norm_id: (value, norm_id) for norm_id, value in stored.items() if isinstance(value, bool)
+        }
+        to_check = [norm_id for norm_id in unique_ids if norm_id not in checked]
+        if len(to_check) > 1 and max_workers > 1:
+            checks = list(_get_check_executor(max_workers).map(self._check_validity, to_check))
+        else:
+            checks = [self._check_validity(norm_id) for norm_id in to_check]
+        for norm_id, (valid, stored_id) in zip(to_check, checks):
+            if storage_manager:
+                storage_manager.set_value(stored_id, valid)
+            checked[norm_id] = (valid, stored_id)
+        for id_string, norm_id in norm_ids.items():
+            result[id_string] = checked[norm_id]
+        return result
+
+    def _check_validity(self, norm_id: str) -> tuple[bool, str]:
+        """Checks a normalised id that has no stored validity, without using the storage.
+
+        Returns:
+            tuple: the validity and the id under which it must be stored
+        """
+        return bool(self.is_valid(norm_id)), norm_id
+
     @abstractmethod
     def normalise(self, id_string: str, include_prefix: bool = False) -> str | None:
         """Returns the id normalized.
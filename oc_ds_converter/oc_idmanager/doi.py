@@ -8,11 +8,10 @@
 from __future__ import annotations
 
 import re
-from re import match, sub
 from urllib.parse import quote, unquote
 
 from oc_ds_converter.metadata_manager import MetadataManager
-from oc_ds_converter.oc_idmanager.base import IdentifierManager
+from oc_ds_converter.oc_idmanager.base import IdentifierManager, memoized
 from oc_ds_converter.oc_idmanager.isbn import ISBNManager
 from oc_ds_converter.oc_idmanager.issn import ISSNManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
@@ -20,10 +19,16 @@ from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import Storage
 from oc_ds_converter.oc_idmanager.orcid import ORCIDManager
 from oc_ds_converter.oc_idmanager.support import call_api
 
+_SPACES = re.compile(r"\s+")
+_NULLS = re.compile(r"\0+")
+_DOI_SYNTAX = re.compile(r"^doi:10\.(\d{4,9}|[^\s/]+(\.[^\s/]+)*)/[^\s]+$", re.IGNORECASE)
+
 
 class DOIManager(IdentifierManager):
     """This class implements an identifier manager for doi identifier"""
 
+    _concurrent_checks = True
+
     def __init__(
         self,
         use_api_service: bool = True,
@@ -109,21 +114,24 @@ class DOIManager(IdentifierManager):
                     self.storage_manager.set_full_value(repaired_doi, repaired_info)
                     return repaired_valid, repaired_info
             return valid, extra_info
-        validity_check = self.syntax_ok(doi) and bool(self.exists(doi))
+        validity_check, stored_id = self._check_validity(doi)
+        self.storage_manager.set_value(stored_id, validity_check)
+        return validity_check
+
+    def _check_validity(self, norm_id: str) -> tuple[bool, str]:
+        validity_check = self.syntax_ok(norm_id) and bool(self.exists(norm_id))
         if not validity_check and self._use_api_service:
-            repaired = self.attempt_repair(doi.replace(self._p, ""))
+            repaired = self.attempt_repair(norm_id.replace(self._p, ""))
             if repaired:
-                repaired_doi = self._p + repaired
-                self.storage_manager.set_value(repaired_doi, True)
-                return True
-        self.storage_manager.set_value(doi, validity_check)
-        return validity_check
+                return True, self._p + repaired
+        return validity_check, norm_id
 
+    @memoized
     def normalise(self, id_string: str, include_prefix: bool = False) -> str | None:
         if "10." not in id_string:
             return None
-        doi = sub(
-            r"\0+", "", sub(r"\s+", "", unquote(id_string[id_string.index("10.") :]))
+        doi = _NULLS.sub(
+            "", _SPACES.sub("", unquote(id_string[id_string.index("10.") :]))
         )
         if not doi:
             return None
@@ -146,16 +154,11 @@ class DOIManager(IdentifierManager):
             return tmp_doi
         return None
 
+    @memoized
     def syntax_ok(self, id_string: str) -> bool:
         if not id_string.startswith(self._p):
             id_string = self._p + id_string
-        return bool(
-            match(
-                r"^doi:10\.(\d{4,9}|[^\s/]+(\.[^\s/]+)*)/[^\s]+$",
-                id_string,
-                re.IGNORECASE,
-            )
-        )
+        return bool(_DOI_SYNTAX.match(id_string))
 
     def exists(
         self,
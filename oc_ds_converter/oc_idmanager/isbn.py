@@ -5,9 +5,12 @@
 
 
 import re
-from re import match, sub
 
-from oc_ds_converter.oc_idmanager.base import IdentifierManager
+from oc_ds_converter.oc_idmanager.base import IdentifierManager, memoized
+
+_NOT_ISBN_CHAR = re.compile("[^X0-9]")
+_ISBN13_SYNTAX = re.compile("^isbn:97[89][0-9X]{10}$", re.IGNORECASE)
+_ISBN10_SYNTAX = re.compile("^isbn:[0-9X]{10}$", re.IGNORECASE)
 
 
 class ISBNManager(IdentifierManager):
@@ -31,13 +34,15 @@ class ISBNManager(IdentifierManager):
                 )
             return self._data[isbn].get("valid")
 
+    @memoized
     def normalise(self, id_string, include_prefix=False):
         try:
-            isbn_string = sub("[^X0-9]", "", id_string.upper())
+            isbn_string = _NOT_ISBN_CHAR.sub("", id_string.upper())
             return "%s%s" % (self._p if include_prefix else "", isbn_string)
         except:  # Any error in processing the ISBN will return None
             return None
 
+    @memoized
     def check_digit(self, isbn):
         if isbn.startswith(self._p):
             spl = isbn.find(self._p) + len(self._p)
@@ -69,15 +74,16 @@ class ISBNManager(IdentifierManager):
 
         return check_digit
 
+    @memoized
     def syntax_ok(self, id_string):
         id_string.replace(" ", "")
         id_string.replace("-", "")
         if not id_string.startswith(self._p):
             id_string = self._p+id_string
         if len(id_string) - len(self._p) == 13:
-            return True if match("^isbn:97[89][0-9X]{10}$", id_string, re.IGNORECASE) else False
+            return True if _ISBN13_SYNTAX.match(id_string) else False
         elif len(id_string) - len(self._p) == 10:
-            return True if match("^isbn:[0-9X]{10}$", id_string, re.IGNORECASE) else False
+            return True if _ISBN10_SYNTAX.match(id_string) else False
         else:
             return False
 
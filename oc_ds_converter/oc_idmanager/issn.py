@@ -5,9 +5,11 @@
 
 
 import re
-from re import match, sub
 
-from oc_ds_converter.oc_idmanager.base import IdentifierManager
+from oc_ds_converter.oc_idmanager.base import IdentifierManager, memoized
+
+_NOT_ISSN_CHAR = re.compile("[^X0-9]")
+_ISSN_SYNTAX = re.compile("^issn:[0-9]{4}-[0-9]{3}[0-9X]$", re.IGNORECASE)
 
 
 class ISSNManager(IdentifierManager):
@@ -32,9 +34,10 @@ class ISSNManager(IdentifierManager):
                 )
             return self._data[issn].get("valid")
 
+    @memoized
     def normalise(self, id_string, include_prefix=False):
         try:
-            issn_string = sub("[^X0-9]", "", id_string.upper())
+            issn_string = _NOT_ISSN_CHAR.sub("", id_string.upper())
             return "%s%s-%s" % (
                 self._p if include_prefix else "",
                 issn_string[:4],
@@ -43,11 +46,13 @@ class ISSNManager(IdentifierManager):
         except:  # Any error in processing the ISSN will return None
             return None
 
+    @memoized
     def syntax_ok(self, id_string):
         if not id_string.startswith(self._p):
             id_string = self._p+id_string
-        return True if match("^issn:[0-9]{4}-[0-9]{3}[0-9X]$", id_string, re.IGNORECASE) else False
+        return True if _ISSN_SYNTAX.match(id_string) else False
 
+    @memoized
     def check_digit(self,issn):
         if issn.startswith(self._p):
             spl = issn.find(self._p) + len(self._p)
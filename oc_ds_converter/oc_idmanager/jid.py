@@ -7,12 +7,12 @@
 
 import xml.etree.ElementTree as ET
 from re import match, sub
-from time import sleep
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 
@@ -111,7 +111,7 @@ class JIDManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(self._api+ "/do?service=2&cdjournal=" + quote(jid), headers=self._headers, timeout=30)
+                        r = http_get(self._api+ "/do?service=2&cdjournal=" + quote(jid), headers=self._headers, timeout=30)
                         #fromstring() parses XML from a string directly into an Element, which is the root element of the parsed tree
                         root = ET.fromstring(r.content)
                         status = root.find(".//{http://www.w3.org/2005/Atom}status").text
@@ -128,7 +128,7 @@ class JIDManager(IdentifierManager):
                             while tentative:
                                 tentative -=1
                                 try:
-                                    r = get(self._api+ "/do?service=2&cdjournal=" + quote(jid), headers=self._headers, timeout=30)
+                                    r = http_get(self._api+ "/do?service=2&cdjournal=" + quote(jid), headers=self._headers, timeout=30)
                                     # fromstring() parses XML from a string directly into an Element, which is the root element of the parsed tree
                                     root = ET.fromstring(r.content)
                                     status = root.find(".//{http://www.w3.org/2005/Atom}status").text
@@ -144,12 +144,12 @@ class JIDManager(IdentifierManager):
                                 # Do nothing, just try again
                                     pass
                                 except ConnectionError:
-                                # Sleep 5 seconds, then try again
-                                    sleep(5)
+                                    # http_get already backed off, just try again
+                                    pass
 
                             # call to the other API
                             try:
-                                r = get(self._api2 + quote(jid), headers=self._headers, timeout=30)
+                                r = http_get(self._api2 + quote(jid), headers=self._headers, timeout=30)
                                 if r.status_code == 404:
                                     if get_extra_info:
                                         return False, {"valid": False}
@@ -165,8 +165,8 @@ class JIDManager(IdentifierManager):
                                 # Do nothing, just try again
                                     pass
                             except ConnectionError:
-                            # Sleep 5 seconds, then try again
-                                sleep(5)
+                                # http_get already backed off, just try again
+                                pass
 
                             if get_extra_info:
                                 return False, {"valid": False}
@@ -175,8 +175,8 @@ class JIDManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
 
                 valid_bool=False
 
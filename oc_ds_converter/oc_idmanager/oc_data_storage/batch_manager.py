@@ -28,6 +28,13 @@ class BatchManager(StorageManager):
             return id_in_dict["valid"]
         return None
 
+    def get_values_batch(self, ids: list[str]) -> dict[str, bool | None]:
+        result: dict[str, bool | None] = {}
+        for id in ids:
+            id_in_dict = self._data.get(str(id))
+            result[str(id)] = id_in_dict["valid"] if id_in_dict else None
+        return result
+
     def get_validity_list_of_tuples(self) -> list[tuple[str, bool]]:
         return [(k, v["valid"]) for k, v in self._data.items()]
 
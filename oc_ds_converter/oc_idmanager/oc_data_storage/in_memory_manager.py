@@ -14,36 +14,90 @@ from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import Storage
 
 class InMemoryStorageManager(StorageManager):
     """A concrete implementation of the ``StorageManager`` interface that persistently stores
-    the IDs validity values within a in-memory dictionary, which is eventually saved in a json file."""
+    the IDs validity values within a in-memory dictionary, which is eventually saved in a json file.
+
+    Validity values are kept in a flat ``{id: bool}`` dict, and the additional information passed to
+    ``set_full_value`` only for the ids that have some. ``store_file`` appends the values changed since
+    its previous call to a journal next to the json file (``<json file>.log``, one ``[id, info]`` JSON
+    array per line) and folds the journal into the json file only once the journal holds more entries
+    than the json file, so that the cost of saving is proportional to the new values."""
 
     def __init__(self, json_file_path: str | None = None, **params: object) -> None:
         """
         Constructor of the ``InMemoryStorageManager`` class.
         """
         super().__init__(**params)
+        self._validity: dict[str, bool] = {}
+        self._extra_info: dict[str, dict[str, object]] = {}
+        self._unsaved: set[str] = set()
+        self._journal_entries = 0
         if json_file_path and os.path.exists(json_file_path):
             self.storage_filepath = json_file_path
-            o_jfp = open(self.storage_filepath, "r")
-            self.id_value_dict = json.load(o_jfp)
-            o_jfp.close()
+            self._load()
         elif json_file_path and not os.path.exists(json_file_path):
             if not os.path.exists(os.path.abspath(os.path.join(json_file_path, os.pardir))):
                 Path(os.path.abspath(os.path.join(json_file_path, os.pardir))).mkdir(parents=True, exist_ok=True)
             self.storage_filepath = json_file_path
-            self.id_value_dict = dict()
-            file = open(self.storage_filepath, "w", encoding='utf8')
-            json.dump(self.id_value_dict, file)
-            file.close()
+            self._write_snapshot()
         else:
             new_path_dir = os.path.join(os.getcwd(), "storage")
             if not os.path.exists(new_path_dir):
                 os.makedirs(new_path_dir)
-            filepath = os.path.join(new_path_dir, "id_value.json" )
-            self.id_value_dict = dict()
-            self.storage_filepath = filepath
-            file = open(self.storage_filepath, "w", encoding='utf8')
-            json.dump(self.id_value_dict, file)
-            file.close()
+            self.storage_filepath = os.path.join(new_path_dir, "id_value.json")
+            self._write_snapshot()
+
+    @property
+    def journal_filepath(self) -> str:
+        return self.storage_filepath + ".log"
+
+    def _set_info(self, id_name: str, info: object) -> None:
+        if isinstance(info, bool):
+            self._validity[id_name] = info
+        elif isinstance(info, dict):
+            extra = {k: v for k, v in info.items() if k != "valid"}
+            if isinstance(info.get("valid"), bool):
+                self._validity[id_name] = info["valid"]
+            if extra:
+                self._extra_info[id_name] = extra
+
+    def _get_info(self, id_name: str) -> dict[str, object]:
+        info: dict[str, object] = {}
+        if id_name in self._validity:
+            info["valid"] = self._validity[id_name]
+        info.update(self._extra_info.get(id_name, {}))
+        return info
+
+    def _load(self) -> None:
+        with open(self.storage_filepath, "r", encoding="utf8") as file:
+            for id_name, info in json.load(file).items():
+                self._set_info(id_name, info)
+        if os.path.exists(self.journal_filepath):
+            with open(self.journal_filepath, "r", encoding="utf8") as journal:
+                for line in journal:
+                    try:
+                        id_name, info = json.loads(line)
+                    except ValueError:
+                        # A line truncated by an interrupted run
+                        continue
+                    self._set_info(id_name, info)
+                    self._journal_entries += 1
+
+    def _write_snapshot(self) -> None:
+        tmp_filepath = self.storage_filepath + ".tmp"
+        with open(tmp_filepath, "w", encoding="utf8") as file:
+            file.write("{")
+            for i, id_name in enumerate(self.get_all_keys()):
+                if i:
+                    file.write(",\n")
+                file.write(json.dumps(id_name, ensure_ascii=False))
+                file.write(":")
+                file.write(json.dumps(self._get_info(id_name), ensure_ascii=False))
+            file.write("}")
+        os.replace(tmp_filepath, self.storage_filepath)
+        if os.path.exists(self.journal_filepath):
+            os.remove(self.journal_filepath)
+        self._journal_entries = 0
+        self._unsaved.clear()
 
     def set_full_value(self, id: str, value: dict[str, str | bool | object]) -> None:
         """
@@ -59,11 +113,12 @@ class InMemoryStorageManager(StorageManager):
         id_name = str(id)
         if not isinstance(value, dict):
             raise ValueError("value must be dict")
-        if id_name in self.id_value_dict:
-            new_info = {k: v for k, v in value.items() if k not in self.id_value_dict[id_name]}
-            self.id_value_dict[id_name].update(new_info)
-        else:
-            self.id_value_dict[id_name] = dict(value)
+        current = self._get_info(id_name)
+        new_info = {k: v for k, v in value.items() if k not in current}
+        if new_info:
+            current.update(new_info)
+            self._set_info(id_name, current)
+            self._unsaved.add(id_name)
 
     def set_value(self, id: str, value: bool) -> None:
         """
@@ -79,10 +134,19 @@ class InMemoryStorageManager(StorageManager):
         id_name = str(id)
         if not isinstance(value, bool):
             raise ValueError("value must be boolean")
-        if id_name in self.id_value_dict:
-            self.id_value_dict[id_name]["valid"] = value
-        else:
-            self.id_value_dict[id_name] = {"valid": value}
+        self._validity[id_name] = value
+        self._unsaved.add(id_name)
+
+    def set_multi_value(self, list_of_tuples: list[tuple[str, bool]]) -> None:
+        """
+        It allows to set the validity value of several ids.
+
+        :param list_of_tuples: a list of tuples of ids and booleans (id, value)
+        :type list_of_tuples: list
+        :return: None
+        """
+        for id, value in list_of_tuples:
+            self.set_value(id, value)
 
     def get_value(self, id: str) -> bool | None:
         """
@@ -92,29 +156,50 @@ class InMemoryStorageManager(StorageManager):
         :type id: str
         :return: The requested id value.
         """
-        id_name = str(id)
-        id_in_dict = self.id_value_dict.get(id_name)
-        if id_in_dict:
-            return id_in_dict["valid"]
-        return None
+        return self._validity.get(str(id))
+
+    def get_values_batch(self, ids: list[str]) -> dict[str, bool | None]:
+        """
+        It allows to read the value of the "valid" key of several identifiers' dicts.
+
+        :param ids: The id names
+        :type ids: list
+        :return: A dict mapping each id to its value.
+        """
+        return {str(id): self._validity.get(str(id)) for id in ids}
 
     def store_file(self) -> None:
         """
-        It stores in a file the dictionary with the validation results
+        It saves the validation results set since the previous call, appending them to the journal.
+        The journal is folded into the json file when it holds more entries than the json file.
         """
-        with open(self.storage_filepath, "w", encoding='utf8') as file:
-            json.dump(self.id_value_dict, file, indent=4)
+        if not self._unsaved:
+            return
+        self._journal_entries += len(self._unsaved)
+        if self._journal_entries > len(self._validity) - self._journal_entries:
+            self._write_snapshot()
+            return
+        with open(self.journal_filepath, "a", encoding="utf8") as journal:
+            for id_name in self._unsaved:
+                journal.write(json.dumps([id_name, self._get_info(id_name)], ensure_ascii=False) + "\n")
+        self._unsaved.clear()
 
     def delete_storage(self) -> None:
-        self.id_value_dict = {}
-        if os.path.exists(self.storage_filepath):
-            os.remove(self.storage_filepath)
+        self._validity = {}
+        self._extra_info = {}
+        self._unsaved = set()
+        self._journal_entries = 0
+        for filepath in (self.storage_filepath, self.journal_filepath):
+            if os.path.exists(filepath):
+                os.remove(filepath)
 
     def get_all_keys(self) -> list[str]:
-        return list(self.id_value_dict.keys())
+        keys = list(self._validity)
+        keys.extend(k for k in self._extra_info if k not in self._validity)
+        return keys
 
     def get_validity_dict(self) -> dict[str, bool]:
-        return {k: v["valid"] for k, v in self.id_value_dict.items()}
+        return dict(self._validity)
 
     def get_validity_list_of_tuples(self) -> list[tuple[str, bool]]:
-        return [(k, v["valid"]) for k, v in self.id_value_dict.items()]
+        return list(self._validity.items())
@@ -96,6 +96,26 @@ class RedisStorageManager(StorageManager):
             return True if result == 1 else False
         return None
 
+    def get_values_batch(self, ids: list) -> dict:
+        """
+        It allows to read the values of several identifiers with a single MGET.
+
+        :param ids: The id names
+        :type ids: list
+        :return: A dict mapping each id to its value (True if valid, False if invalid, None if not found).
+        """
+        id_names = [str(id) for id in ids]
+        if not id_names:
+            return {}
+        result = dict()
+        for id_name, value in zip(id_names, self.PROCESS_redis.mget(id_names)):
+            if value:
+                value = int(value.decode("utf-8")) if isinstance(value, bytes) else int(value)
+                result[id_name] = True if value == 1 else False
+            else:
+                result[id_name] = None
+        return result
+
     def del_value(self, id: str) -> None:
         """
         It allows to delete the identifier from the redis db.
@@ -8,47 +8,95 @@ from __future__ import annotations
 import os.path
 import pathlib
 import sqlite3
+import weakref
 
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 
+_UPSERT = "INSERT OR REPLACE INTO info VALUES (?,?)"
+# Stay below SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds (999)
+_MAX_QUERY_PARAMS = 900
+
+
+def _write_rows(con: sqlite3.Connection, rows: dict[str, int]) -> None:
+    """Write ``rows`` in a single transaction and empty the dict. The write lock is
+    taken up front, so that concurrent writers queue on the busy timeout instead of
+    failing when upgrading a read transaction."""
+    if not rows:
+        return
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        con.executemany(_UPSERT, rows.items())
+        con.execute("COMMIT")
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    rows.clear()
+
+
+def _flush_on_release(con: sqlite3.Connection, rows: dict[str, int]) -> None:
+    try:
+        _write_rows(con, rows)
+        # Closing the last connection checkpoints the WAL and removes its files
+        con.close()
+    except sqlite3.ProgrammingError:
+        # The connection was already closed by the caller
+        pass
+
 
 class SqliteStorageManager(StorageManager):
     """A concrete implementation of the ``StorageManager`` interface that persistently stores
-    the IDs validity values within a SQLite database."""
+    the IDs validity values within a SQLite database.
+
+    The database runs in WAL mode and single ``set_value`` calls are buffered, then written
+    in one transaction every ``write_batch_size`` values, when ``set_multi_value`` or
+    ``store_file`` are called, or when the manager is garbage collected. Buffered values
+    are visible to the reads of the same manager.
+
+    Several processes can open the same database: readers never block in WAL mode, while
+    each batch of writes waits up to ``timeout`` seconds for the other writers to commit."""
 
     con: sqlite3.Connection
     cur: sqlite3.Cursor
     storage_filepath: str
 
-    def __init__(self, database: str | None = None, **params: object) -> None:
+    def __init__(self, database: str | None = None, write_batch_size: int = 10000,
+                 timeout: float = 60.0, **params: object) -> None:
         """
         Constructor of the ``SqliteStorageManager`` class.
 
         :param database: The name of the database
         :type info_dir: str
+        :param write_batch_size: The number of values set with ``set_value`` kept in memory before being written
+        :type write_batch_size: int
+        :param timeout: Seconds a write waits for the database lock held by another process
+        :type timeout: float
         """
         super().__init__(**params)
         sqlite3.threadsafety = 3
         if database and os.path.exists(database):
-            self.con = sqlite3.connect(database=database)
             self.storage_filepath = database
         elif database and not os.path.exists(database):
             if not os.path.exists(os.path.abspath(os.path.join(database, os.pardir))):
                 pathlib.Path(os.path.abspath(os.path.join(database, os.pardir))).mkdir(parents=True, exist_ok=True)
-            self.con = sqlite3.connect(database=database)
             self.storage_filepath = database
         else:
             new_path_dir = os.path.join(os.getcwd(), "storage")
             if not os.path.exists(new_path_dir):
                 os.makedirs(new_path_dir)
-            new_path_db = os.path.join(new_path_dir, "id_valid_dict.db")
-            self.con = sqlite3.connect(database=new_path_db)
-            self.storage_filepath = new_path_db
+            self.storage_filepath = os.path.join(new_path_dir, "id_valid_dict.db")
 
+        # Autocommit mode: transactions are opened explicitly around batched writes
+        self.con = sqlite3.connect(database=self.storage_filepath, isolation_level=None, timeout=timeout)
+        self.con.execute("PRAGMA journal_mode=WAL")
+        self.con.execute("PRAGMA synchronous=NORMAL")
         self.cur = self.con.cursor()
         self.cur.execute("""CREATE TABLE IF NOT EXISTS info(
             id TEXT PRIMARY KEY,
-            value INTEGER)""")
+            value INTEGER) WITHOUT ROWID""")
+
+        self.write_batch_size = write_batch_size
+        self._pending: dict[str, int] = {}
+        self._finalizer = weakref.finalize(self, _flush_on_release, self.con, self._pending)
 
     def set_full_value(self, id: str, value: dict[str, str | bool | object]) -> None:
         """
@@ -83,10 +131,9 @@ class SqliteStorageManager(StorageManager):
         id_name = str(id)
         if not isinstance(value, bool):
             raise ValueError("value must be boolean")
-        validity = 1 if value else 0
-        id_val = (id_name, validity)
-        self.cur.execute("INSERT OR REPLACE INTO info VALUES (?,?)", id_val)
-        self.con.commit()
+        self._pending[id_name] = 1 if value else 0
+        if len(self._pending) >= self.write_batch_size:
+            _write_rows(self.con, self._pending)
 
     def set_multi_value(self, list_of_tuples: list[tuple[str, bool]]) -> None:
         """
@@ -99,14 +146,9 @@ class SqliteStorageManager(StorageManager):
         :raises ValueError: if ``value`` is neither 0 nor 1 (0 is False, 1 is True).
         :return: None
         """
-        sqlite_list_copy: list[tuple[str, int]] = []
         for t in list_of_tuples:
-            if t[1] is True:
-                sqlite_list_copy.append((t[0], 1))
-            else:
-                sqlite_list_copy.append((t[0], 0))
-        self.cur.executemany("INSERT OR REPLACE INTO info VALUES (?,?)", sqlite_list_copy)
-        self.con.commit()
+            self._pending[str(t[0])] = 1 if t[1] is True else 0
+        _write_rows(self.con, self._pending)
 
     def get_value(self, id: str) -> bool | None:
         """
@@ -117,24 +159,56 @@ class SqliteStorageManager(StorageManager):
         :return: The requested id value (True if valid, False if invalid, None if not found).
         """
         id_name = str(id)
-        result = self.cur.execute(f"SELECT value FROM info WHERE id='{id_name}'")
-        rows = result.fetchall()
-        if len(rows) == 1:
-            value = rows[0][0]
-            return value == 1
-        elif len(rows) == 0:
+        if id_name in self._pending:
+            return self._pending[id_name] == 1
+        row = self.cur.execute("SELECT value FROM info WHERE id = ?", (id_name,)).fetchone()
+        if row is None:
             return None
-        else:
-            raise Exception("There is more than one counter for this id. The database is broken")
+        return row[0] == 1
+
+    def get_values_batch(self, ids: list[str]) -> dict[str, bool | None]:
+        """
+        It allows to read the values of several identifiers with one query per
+        ``_MAX_QUERY_PARAMS`` ids.
+
+        :param ids: The id names
+        :type ids: list
+        :return: A dict mapping each id to its value (True if valid, False if invalid, None if not found).
+        """
+        result: dict[str, bool | None] = {}
+        to_query: list[str] = []
+        for id in ids:
+            id_name = str(id)
+            if id_name in self._pending:
+                result[id_name] = self._pending[id_name] == 1
+            elif id_name not in result:
+                result[id_name] = None
+                to_query.append(id_name)
+        for start in range(0, len(to_query), _MAX_QUERY_PARAMS):
+            chunk = to_query[start:start + _MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for id_name, value in self.cur.execute(f"SELECT id, value FROM info WHERE id IN ({placeholders})", chunk):
+                result[id_name] = value == 1
+        return result
+
+    def store_file(self) -> None:
+        """
+        It writes the buffered values to the database.
+        """
+        _write_rows(self.con, self._pending)
 
     def delete_storage(self) -> None:
-        if os.path.exists(self.storage_filepath):
-            try:
-                self.con.close()
-                os.remove(self.storage_filepath)
-            except Exception:
-                os.remove(self.storage_filepath)
+        self._pending.clear()
+        self._finalizer.detach()
+        try:
+            self.con.close()
+        except Exception:
+            pass
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.storage_filepath + suffix):
+                os.remove(self.storage_filepath + suffix)
 
     def get_all_keys(self) -> list[str]:
+        _write_rows(self.con, self._pending)
         ids = [row[0] for row in self.cur.execute("SELECT id FROM info")]
         return ids
@@ -33,6 +33,9 @@ class StorageManager(metaclass=ABCMeta):
     def get_value(self, id: str) -> bool | None:
         pass
 
+    def get_values_batch(self, ids: list[str]) -> dict[str, bool | None]:
+        return {str(id): self.get_value(id) for id in ids}
+
     def set_multi_value(self, list_of_tuples: list[tuple[str, bool]]) -> None:
         pass
 
@@ -7,7 +7,8 @@ from oc_ds_converter.oc_idmanager.base import IdentifierManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 from re import sub, match
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 from json import loads
 from time import sleep
@@ -93,7 +94,7 @@ class OpenAlexManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(self._api + oal_id, headers=self._headers, timeout=30)
+                        r = http_get(self._api + oal_id, headers=self._headers, timeout=30)
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -120,8 +121,8 @@ class OpenAlexManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
@@ -5,21 +5,25 @@
 # SPDX-License-Identifier: ISC
 import re
 from json import loads
-from re import match, sub
-from time import sleep
 from urllib.parse import quote
 import datetime
 
-from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from oc_ds_converter.oc_idmanager.base import IdentifierManager, memoized
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 
+_NOT_ORCID_CHAR = re.compile("[^X0-9]")
+_ORCID_SYNTAX = re.compile("^orcid:([0-9]{4}-){3}[0-9]{3}[0-9X]$", re.IGNORECASE)
+
 # POSSIBLE EXTENSION: adding a new parameter in order to directly use the input orcid - doi map in the orcid manager
 class ORCIDManager(IdentifierManager):
     """This class implements an identifier manager for orcid identifier."""
 
+    _concurrent_checks = True
+
     def __init__(self, use_api_service: bool = True, storage_manager: StorageManager | None = None, testing: bool = True) -> None:
         """Orcid Manager constructor."""
         super(ORCIDManager, self).__init__()
@@ -57,14 +61,18 @@ class ORCIDManager(IdentifierManager):
                     info = self.exists(orcid, get_extra_info=True)
                     self.storage_manager.set_full_value(orcid,info[1])
                     return (info[0] and self.check_digit(orcid) and self.syntax_ok(orcid)), info[1]
-                validity_check = self.syntax_ok(orcid) and self.check_digit(orcid) and self.exists(orcid) 
+                validity_check, _ = self._check_validity(orcid)
                 self.storage_manager.set_value(orcid, validity_check)
                 return validity_check
 
+    def _check_validity(self, norm_id):
+        return bool(self.syntax_ok(norm_id) and self.check_digit(norm_id) and self.exists(norm_id)), norm_id
 
+
+    @memoized
     def normalise(self, id_string, include_prefix=False):
         try:
-            orcid_string = sub("[^X0-9]", "", id_string.upper())
+            orcid_string = _NOT_ORCID_CHAR.sub("", id_string.upper())
 
             return "%s%s-%s-%s-%s" % (
                 self._p if (include_prefix and not orcid_string.startswith(self._p)) else "",
@@ -76,22 +84,24 @@ class ORCIDManager(IdentifierManager):
         except:  # Any error in processing the id will return None
             return None
 
+    @memoized
     def check_digit(self, orcid):
         if orcid.startswith(self._p):
             spl = orcid.find(self._p) + len(self._p)
             orcid = orcid[spl:]
         total = 0
-        for d in sub("[^X0-9]", "", orcid.upper())[:-1]:
+        for d in _NOT_ORCID_CHAR.sub("", orcid.upper())[:-1]:
             i = 10 if d == "X" else int(d)
             total = (total + i) * 2
         reminder = total % 11
         result = (12 - reminder) % 11
         return (str(result) == orcid[-1]) or (result == 10 and orcid[-1] == "X")
 
+    @memoized
     def syntax_ok(self, id_string):
         if not id_string.startswith(self._p):
             id_string = self._p+id_string
-        return True if match("^orcid:([0-9]{4}-){3}[0-9]{3}[0-9X]$", id_string, re.IGNORECASE) else False
+        return True if _ORCID_SYNTAX.match(id_string) else False
 
 
     def exists(self, orcid, get_extra_info=False, allow_extra_api=None):
@@ -106,7 +116,7 @@ class ORCIDManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(self._api + quote(orcid), headers=self._headers, timeout=30)
+                        r = http_get(self._api + quote(orcid), headers=self._headers, timeout=30)
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -119,8 +129,8 @@ class ORCIDManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
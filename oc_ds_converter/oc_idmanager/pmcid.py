@@ -7,11 +7,11 @@
 
 from json import loads
 from re import match, sub
-from time import sleep
 from urllib.parse import quote, unquote
 
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
@@ -104,7 +104,7 @@ class PMCIDManager(IdentifierManager):
                             'idtype': 'pmcid'
                         }
 
-                        r = get(self._api, params=parameters, headers=self._headers, timeout=30)
+                        r = http_get(self._api, params=parameters, headers=self._headers, timeout=30)
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -133,8 +133,8 @@ class PMCIDManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
@@ -8,13 +8,13 @@
 import re
 from datetime import datetime
 from re import match, sub
-from time import sleep
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup
 from oc_ds_converter.oc_idmanager import *
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
@@ -106,7 +106,7 @@ class PMIDManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(
+                        r = http_get(
                             self._api + quote(pmid) + "/?format=pubmed",
                             headers=self._headers,
                             timeout=30,
@@ -133,8 +133,8 @@ class PMIDManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+# The environment variable holding the path of the cache database: spawned worker
+# processes inherit it, so they share the cache of the process that enabled it
+HTTP_CACHE_ENV = "OC_DS_CONVERTER_HTTP_CACHE"
+
+DAY = 24 * 60 * 60
+# Seconds a response is reused, per API host
+RESPONSE_CACHE_TTL: dict[str, float] = {
+    "doi.org": 30 * DAY,
+    "api.crossref.org": 30 * DAY,
+    "api.datacite.org": 30 * DAY,
+    "api.japanlinkcenter.org": 30 * DAY,
+    "api.medra.org": 30 * DAY,
+    "pub.orcid.org": 7 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+# Ids that do not exist yet may be registered soon
+NOT_FOUND_TTL = DAY
+DEFAULT_MAX_SIZE = 2 * 1024 ** 3
+# Access times are refreshed at most this often, to avoid a write for every hit
+_TOUCH_INTERVAL = 60 * 60
+
+_CACHEABLE_STATUS = (200, 404)
+
+
+class ResponseCache:
+    """An on-disk cache of API responses, keyed by URL and ``Accept`` header, stored in a
+    SQLite database that several processes can share. Responses expire after the TTL of
+    their host, and the least recently used ones are evicted when the cached bodies
+    exceed ``max_size`` bytes."""
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE, timeout: float = 60.0) -> None:
+        parent_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent_dir, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self._timeout = timeout
+        self._local = threading.local()
+        self._stored_since_check = 0
+        con = self._connection()
+        con.execute("""CREATE TABLE IF NOT EXISTS responses(
+            key TEXT PRIMARY KEY,
+            status INTEGER,
+            headers TEXT,
+            body BLOB,
+            expires REAL,
+            accessed REAL,
+            size INTEGER) WITHOUT ROWID""")
+        con.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        con: sqlite3.Connection | None = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, isolation_level=None, timeout=self._timeout)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            self._local.con = con
+        return con
+
+    @staticmethod
+    def key(url: str, params: object = None, headers: dict[str, str] | None = None) -> str:
+        request = PreparedRequest()
+        request.prepare_url(url, params)
+        accept = (headers or {}).get("Accept", "")
+        return f"{request.url} {accept}" if accept else str(request.url)
+
+    def get(self, key: str) -> Response | None:
+        con = self._connection()
+        row = con.execute(
+            "SELECT status, headers, body, expires, accessed FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, expires, accessed = row
+        now = time.time()
+        if expires < now:
+            con.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        if now - accessed > _TOUCH_INTERVAL:
+            con.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = body
+        response.url = key.split(" ", 1)[0]
+        return response
+
+    def put(self, key: str, host: str, response: Response) -> None:
+        if response.status_code not in _CACHEABLE_STATUS:
+            return
+        ttl = RESPONSE_CACHE_TTL.get(host, DEFAULT_TTL) if response.status_code == 200 else NOT_FOUND_TTL
+        body = response.content
+        headers = {k: v for k, v in response.headers.items() if k.lower() in ("content-type", "content-encoding")}
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses VALUES (?,?,?,?,?,?,?)",
+            (key, response.status_code, json.dumps(headers), body, now + ttl, now, len(body)),
+        )
+        self._stored_since_check += 1
+        if self._stored_since_check >= 1000:
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop the expired responses, then the least recently used ones until the cached
+        bodies take at most 90% of ``max_size``."""
+        self._stored_since_check = 0
+        con = self._connection()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+            total = con.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_size:
+                to_free = total - int(self.max_size * 0.9)
+                freed = 0
+                keys: list[str] = []
+                for key, size in con.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                    keys.append(key)
+                    freed += size
+                    if freed >= to_free:
+                        break
+                con.executemany("DELETE FROM responses WHERE key = ?", ((k,) for k in keys))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+
+_caches: dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def enable_response_cache(path: str) -> ResponseCache:
+    """Cache the API responses in the database at ``path``, in this process and in the
+    worker processes it starts afterwards."""
+    path = os.path.abspath(path)
+    os.environ[HTTP_CACHE_ENV] = path
+    return _open_cache(path)
+
+
+def disable_response_cache() -> None:
+    os.environ.pop(HTTP_CACHE_ENV, None)
+
+
+def get_response_cache() -> ResponseCache | None:
+    path = os.environ.get(HTTP_CACHE_ENV)
+    return _open_cache(path) if path else None
+
+
+def _open_cache(path: str) -> ResponseCache:
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = ResponseCache(path)
+    return cache
@@ -7,14 +7,14 @@
 
 from json import loads
 from re import match, sub
-from time import sleep
 from typing import Optional
 from urllib.parse import quote, unquote
 
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 
 
@@ -95,7 +95,7 @@ class RORManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(self._api + ror_id, headers=self._headers, timeout=30)
+                        r = http_get(self._api + ror_id, headers=self._headers, timeout=30)
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -121,8 +121,8 @@ class RORManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
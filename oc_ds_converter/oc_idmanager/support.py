@@ -5,13 +5,266 @@
 
 from __future__ import annotations
 
+import getpass
+import os
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from json import loads
-from time import sleep
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
-from requests import ReadTimeout, get
+from filelock import FileLock
+from requests import ReadTimeout, Response, Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 
+from oc_ds_converter.oc_idmanager.response_cache import ResponseCache, get_response_cache
+
+# Connections kept alive per host by each thread's session
+HTTP_POOL_SIZE = 16
+
+# Default requests per second and burst size allowed by each API, shared by all the
+# processes of the machine that use the same state directory. Hosts not listed here are
+# not rate limited. They are overridden by enable_rate_limits.
+API_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "doi.org": (20.0, 20),
+    "pub.orcid.org": (24.0, 40),
+    "pubmed.ncbi.nlm.nih.gov": (3.0, 3),
+    "eutils.ncbi.nlm.nih.gov": (3.0, 3),
+    "www.ncbi.nlm.nih.gov": (3.0, 3),
+    "api.crossref.org": (5.0, 5),
+    "api.datacite.org": (10.0, 10),
+    "api.ror.org": (6.0, 10),
+    "api.openalex.org": (10.0, 10),
+    "export.arxiv.org": (1.0, 1),
+}
+# The environment variables holding the limits that override API_RATE_LIMITS and the
+# directory of the shared state: spawned worker processes inherit them
+RATE_LIMITS_ENV = "OC_DS_CONVERTER_RATE_LIMITS"
+RATE_LIMIT_DIR_ENV = "OC_DS_CONVERTER_RATE_LIMIT_DIR"
+
+
+def _default_state_dir() -> str:
+    # One directory per user, so that the state files of another user are never opened
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = "default"
+    return os.path.join(tempfile.gettempdir(), f"oc_ds_converter_rate_limits_{user}")
+
+
+RATE_LIMIT_STATE_DIR = _default_state_dir()
+
+# Attempts for a request answered with 429 or 503, and bounds of the exponential backoff
+HTTP_THROTTLED_TRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+_local = threading.local()
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_failures: dict[str, int] = {}
+_failures_lock = threading.Lock()
+
+
+class RateLimiter:
+    """A token bucket whose state lives in a small file guarded by a file lock, so that
+    every thread and process of the machine calling the same host draws from it."""
+
+    def __init__(self, host: str, rate: float, burst: int, state_dir: str = RATE_LIMIT_STATE_DIR) -> None:
+        os.makedirs(state_dir, exist_ok=True)
+        self.rate = rate
+        self.burst = burst
+        self.state_dir = state_dir
+        self._state_path = os.path.join(state_dir, host)
+        self._file_lock = FileLock(self._state_path + ".lock")
+        self._thread_lock = threading.Lock()
+
+    def _read_state(self, now: float) -> tuple[float, float, float]:
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                tokens, updated, blocked_until = (float(x) for x in f.read().split())
+        except (OSError, ValueError):
+            return float(self.burst), now, 0.0
+        return min(self.burst, tokens + max(0.0, now - updated) * self.rate), now, blocked_until
+
+    def _write_state(self, tokens: float, now: float, blocked_until: float) -> None:
+        with open(self._state_path, "w", encoding="utf-8") as f:
+            f.write(f"{tokens} {now} {blocked_until}")
+
+    def acquire(self) -> None:
+        """Wait until a request to the host is allowed."""
+        while True:
+            with self._thread_lock, self._file_lock:
+                now = time.time()
+                tokens, now, blocked_until = self._read_state(now)
+                wait = blocked_until - now
+                if wait <= 0 and tokens >= 1:
+                    self._write_state(tokens - 1, now, blocked_until)
+                    return
+                if wait <= 0:
+                    wait = (1 - tokens) / self.rate
+                self._write_state(tokens, now, blocked_until)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop every caller from sending requests to the host for ``seconds``."""
+        with self._thread_lock, self._file_lock:
+            now = time.time()
+            tokens, now, blocked_until = self._read_state(now)
+            self._write_state(tokens, now, max(blocked_until, now + seconds))
+
+
+@lru_cache(maxsize=None)
+def parse_rate_limits(limits: str) -> dict[str, tuple[float, int] | None]:
+    """Parse limits given as comma separated ``host=rate`` or ``host=rate/burst`` pairs,
+    where ``host=off`` lifts the limit of a host and the host ``*`` stands for all the
+    hosts not listed; ``off`` alone is short for ``*=off``. The burst defaults to the
+    rate, and to at least one request."""
+    if limits.strip().lower() == "off":
+        return {"*": None}
+    parsed: dict[str, tuple[float, int] | None] = {}
+    for item in limits.split(","):
+        if not item.strip():
+            continue
+        host, sep, value = item.partition("=")
+        host, value = host.strip().lower(), value.strip().lower()
+        if not sep or not host or not value:
+            raise ValueError(f"Invalid rate limit {item.strip()!r}: expected host=rate[/burst] or host=off")
+        if value == "off":
+            parsed[host] = None
+            continue
+        rate_str, _, burst_str = value.partition("/")
+        try:
+            rate = float(rate_str)
+            burst = int(burst_str) if burst_str else max(1, int(rate))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit {item.strip()!r}: expected host=rate[/burst] or host=off") from None
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate limit {item.strip()!r}: the rate and the burst must be positive")
+        parsed[host] = (rate, burst)
+    return parsed
+
+
+def enable_rate_limits(limits: str | None = None, state_dir: str | None = None) -> None:
+    """Override the default rate limits with ``limits``, in the format read by
+    ``parse_rate_limits``, and keep their shared state in ``state_dir``, in this process
+    and in the worker processes it starts afterwards."""
+    if limits is not None:
+        parse_rate_limits(limits)
+        os.environ[RATE_LIMITS_ENV] = limits
+    if state_dir is not None:
+        os.environ[RATE_LIMIT_DIR_ENV] = os.path.abspath(state_dir)
+
+
+def disable_rate_limit_overrides() -> None:
+    os.environ.pop(RATE_LIMITS_ENV, None)
+    os.environ.pop(RATE_LIMIT_DIR_ENV, None)
+
+
+def get_rate_limit(host: str) -> tuple[float, int] | None:
+    """The rate and burst allowed for ``host``, or None if it is not rate limited."""
+    overrides = parse_rate_limits(os.environ.get(RATE_LIMITS_ENV, ""))
+    if host in overrides:
+        return overrides[host]
+    if "*" in overrides:
+        return overrides["*"]
+    return API_RATE_LIMITS.get(host)
+
+
+def get_rate_limiter(url: str) -> RateLimiter | None:
+    host = urlsplit(url).hostname or ""
+    limit = get_rate_limit(host)
+    if limit is None:
+        return None
+    state_dir = os.environ.get(RATE_LIMIT_DIR_ENV, RATE_LIMIT_STATE_DIR)
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None or (limiter.rate, limiter.burst, limiter.state_dir) != (*limit, state_dir):
+            limiter = _limiters[host] = RateLimiter(host, *limit, state_dir=state_dir)
+    return limiter
+
+
+def backoff(host: str) -> float:
+    """Record a failed request to ``host`` and return the exponential backoff to wait before the next one."""
+    with _failures_lock:
+        failures = _failures[host] = _failures.get(host, 0) + 1
+    # The exponent is capped so that a host failing for long does not overflow the float
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** min(failures - 1, 32))
+
+
+def retry_after_seconds(response: Response) -> float | None:
+    """The delay asked by the ``Retry-After`` header, given either in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_session() -> Session:
+    """Return the ``requests.Session`` of the calling thread, creating it on first use.
+    The session keeps the connections alive and reuses them across calls, so that
+    consecutive checks against the same API do not pay a new TCP/TLS handshake."""
+    session: Session | None = getattr(_local, "session", None)
+    if session is None:
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+def http_get(url: str, **kwargs: object) -> Response:
+    """GET ``url`` with the thread's pooled session, within the rate limit of its host.
+
+    Responses with status 429 or 503 are retried after the delay in their ``Retry-After``
+    header or, without one, after an exponential backoff, during which every caller of the
+    host waits. A connection error is raised after the backoff, so that the caller's retry
+    does not hit the host straight away. When a response cache is enabled, successful and
+    not found responses are served from it until they expire."""
+    host = urlsplit(url).hostname or ""
+    cache = get_response_cache()
+    if cache:
+        key = ResponseCache.key(url, kwargs.get("params"), kwargs.get("headers"))  # type: ignore[arg-type]
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    limiter = get_rate_limiter(url)
+    tries = HTTP_THROTTLED_TRIES
+    while True:
+        tries -= 1
+        if limiter:
+            limiter.acquire()
+        try:
+            r = get_session().get(url, **kwargs)  # type: ignore[arg-type]
+        except ConnectionError:
+            time.sleep(backoff(host))
+            raise
+        if r.status_code not in (429, 503) or not tries:
+            with _failures_lock:
+                _failures.pop(host, None)
+            if cache:
+                cache.put(key, host, r)
+            return r
+        delay = retry_after_seconds(r)
+        if delay is None:
+            delay = backoff(host)
+        if limiter:
+            limiter.pause(delay)
+        else:
+            time.sleep(delay)
+
 
 def call_api(
     url: str, headers: dict[str, str], r_format: str = "json"
@@ -20,7 +273,7 @@ def call_api(
     while tentative:
         tentative -= 1
         try:
-            r = get(url, headers=headers, timeout=30)
+            r = http_get(url, headers=headers, timeout=30)
             if r.status_code == 200:
                 r.encoding = "utf-8"
                 if r_format == "json":
@@ -31,7 +284,8 @@ def call_api(
         except ReadTimeout:
             pass
         except ConnectionError:
-            sleep(5)
+            # http_get already waited before raising
+            pass
     return None
 
 
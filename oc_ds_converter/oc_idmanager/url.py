@@ -4,12 +4,12 @@
 
 
 import urllib.parse
-from time import sleep
 
 import validators
 from oc_ds_converter.oc_idmanager import *
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 
 
@@ -85,7 +85,7 @@ class URLManager(IdentifierManager):
                     while tentative:
                         tentative -= 1
                         try:
-                            r = get(variation,
+                            r = http_get(variation,
                                 headers=self._headers,
                                 timeout=30,
                             )
@@ -102,8 +102,8 @@ class URLManager(IdentifierManager):
                             # Do nothing, just try again
                             pass
                         except ConnectionError:
-                            # Sleep 5 seconds, then try again
-                            sleep(5)
+                            # http_get already backed off, just try again
+                            pass
 
                 valid_bool = False
 
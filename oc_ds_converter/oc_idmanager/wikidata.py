@@ -6,11 +6,11 @@
 
 from json import loads
 from re import match, sub
-from time import sleep
 from urllib.parse import quote, unquote
 
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 from typing import Type, Optional
 from oc_ds_converter.oc_idmanager.oc_data_storage.storage_manager import StorageManager
@@ -92,7 +92,7 @@ class WikidataManager(IdentifierManager):
                 while tentative:
                     tentative -= 1
                     try:
-                        r = get(self._api + quote(wikidata_id), headers=self._headers, timeout=30)
+                        r = http_get(self._api + quote(wikidata_id), headers=self._headers, timeout=30)
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -120,8 +120,8 @@ class WikidataManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool = False
             else:
                 if get_extra_info:
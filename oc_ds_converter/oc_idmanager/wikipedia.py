@@ -5,11 +5,11 @@
 
 from json import loads
 from re import match, sub
-from time import sleep
 from urllib.parse import unquote
 
 from oc_ds_converter.oc_idmanager.base import IdentifierManager
-from requests import ReadTimeout, get
+from requests import ReadTimeout
+from oc_ds_converter.oc_idmanager.support import http_get
 from requests.exceptions import ConnectionError
 
 
@@ -81,7 +81,7 @@ class WikipediaManager(IdentifierManager):
                             "formatversion": "1",  # format of json output (current version 1; might be replaced w/ v.2)
                         }
 
-                        r = get(self._api, params=query_params, headers=self._headers, timeout=30)  # controlla
+                        r = http_get(self._api, params=query_params, headers=self._headers, timeout=30)  # controlla
                         if r.status_code == 200:
                             r.encoding = "utf-8"
                             json_res = loads(r.text)
@@ -107,8 +107,8 @@ class WikipediaManager(IdentifierManager):
                         # Do nothing, just try again
                         pass
                     except ConnectionError:
-                        # Sleep 5 seconds, then try again
-                        sleep(5)
+                        # http_get already backed off, just try again
+                        pass
                 valid_bool=False
             else:
                 if get_extra_info:
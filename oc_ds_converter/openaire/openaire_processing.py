@@ -16,9 +16,9 @@ from os.path import exists
 from pathlib import Path
 from re import search
 
-from bs4 import BeautifulSoup
-
+from oc_ds_converter.datasource.meta_filter import meta_filtered
 from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
+from oc_ds_converter.lib.markup import strip_markup
 from oc_ds_converter.oc_idmanager.arxiv import ArXivManager
 from oc_ds_converter.oc_idmanager.doi import DOIManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
@@ -137,11 +137,11 @@ class OpenaireProcessing(RaProcessor):
             self.BR_redis = FakeRedisWrapper()
             self.RA_redis = FakeRedisWrapper()
         else:
-            self.BR_redis = RedisDataSource("DB-META-BR")
-            self.RA_redis = RedisDataSource("DB-META-RA")
+            self.BR_redis = meta_filtered(RedisDataSource("DB-META-BR"), "DB-META-BR")
+            self.RA_redis = meta_filtered(RedisDataSource("DB-META-RA"), "DB-META-RA")
 
-        self._redis_values_ra = []
-        self._redis_values_br = []
+        self._redis_values_ra = set()
+        self._redis_values_br = set()
 
 
         if not publishers_filepath_openaire:
@@ -176,8 +176,8 @@ class OpenaireProcessing(RaProcessor):
                 json.dump({}, fdp, ensure_ascii=False, indent=4)
 
     def update_redis_values(self, br, ra):
-        self._redis_values_br = br
-        self._redis_values_ra = ra
+        self._redis_values_br = set(br or [])
+        self._redis_values_ra = set(ra or [])
 
     def validated_as(self, id_dict):
         # Check if the validity was already retrieved and thus
@@ -298,8 +298,7 @@ class OpenaireProcessing(RaProcessor):
         att_title = attributes.get("title")
         if att_title:
             p_title = att_title
-            soup = BeautifulSoup(p_title, 'html.parser')
-            title_soup = soup.get_text().replace('\n', '')
+            title_soup = strip_markup(p_title).replace('\n', '')
             title_soup_space_replaced = ' '.join(title_soup.split())
             title_soup_strip = title_soup_space_replaced.strip()
             clean_tit = html.unescape(title_soup_strip)
@@ -664,6 +663,7 @@ class OpenaireProcessing(RaProcessor):
         kv_in_memory = self.temporary_manager.get_validity_list_of_tuples()
         self.storage_manager.set_multi_value(kv_in_memory)
         self.temporary_manager.delete_storage()
+        self._meta_existence = {}
 
     def extract_all_ids(self, citation):
         all_br = set()
@@ -707,7 +707,7 @@ class OpenaireProcessing(RaProcessor):
             validity = self.RA_redis.mexists_as_set(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         elif redis_db == "br":
-            validity = self.BR_redis.mexists_as_set(ids)
+            validity = self.check_meta_existence(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         else:
             raise ValueError("redis_db must be either 'ra' or 'br'")
@@ -12,10 +12,10 @@ import warnings
 from os.path import exists
 from typing import List, Tuple
 
-from bs4 import BeautifulSoup
-
+from oc_ds_converter.datasource.meta_filter import meta_filtered
 from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
 from oc_ds_converter.lib.cleaner import Cleaner
+from oc_ds_converter.lib.markup import strip_markup
 from oc_ds_converter.oc_idmanager.doi import DOIManager
 from oc_ds_converter.oc_idmanager.orcid import ORCIDManager
 from oc_ds_converter.oc_idmanager.pmid import PMIDManager
@@ -37,8 +37,8 @@ class PubmedProcessing(RaProcessor):
             self.BR_redis = FakeRedisWrapper()
             self.RA_redis = FakeRedisWrapper()
         else:
-            self.BR_redis = RedisDataSource("DB-META-BR")
-            self.RA_redis = RedisDataSource("DB-META-RA")
+            self.BR_redis = meta_filtered(RedisDataSource("DB-META-BR"), "DB-META-BR")
+            self.RA_redis = meta_filtered(RedisDataSource("DB-META-RA"), "DB-META-RA")
 
         if not journals_filepath:
             if not exists(os.path.join(pathlib.Path(__file__).parent.resolve(), "support_files")):
@@ -131,8 +131,7 @@ class PubmedProcessing(RaProcessor):
             pub_title = ""
             if attributes.get("title"):
                 p_title = attributes.get("title")
-                soup = BeautifulSoup(p_title, 'html.parser')
-                title_soup = soup.get_text().replace('\n', '')
+                title_soup = strip_markup(p_title).replace('\n', '')
                 title_soup_space_replaced = ' '.join(title_soup.split())
                 title_soup_strip = title_soup_space_replaced.strip()
                 clean_tit = html.unescape(title_soup_strip)
@@ -261,8 +260,7 @@ class PubmedProcessing(RaProcessor):
 
         # use abbreviated journal title if no mapping was provided
         cont_title = cont_title.replace('\n', '')
-        ven_soup = BeautifulSoup(cont_title, 'html.parser')
-        ventit = html.unescape(ven_soup.get_text())
+        ventit = html.unescape(strip_markup(cont_title))
         ambiguous_brackets = re.search('\[\s*((?:[^\s]+:[^\s]+)?(?:\s+[^\s]+:[^\s]+)*)\s*\]', ventit)
         if ambiguous_brackets:
             match = ambiguous_brackets.group(1)
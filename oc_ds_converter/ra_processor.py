@@ -12,12 +12,17 @@ from zipfile import ZipFile
 
 from oc_ds_converter.oc_idmanager import ISBNManager, ISSNManager, ORCIDManager
 
-from oc_ds_converter.datasource.orcid_index import OrcidIndexInterface
+from oc_ds_converter.datasource.orcid_index import OrcidIndexInterface, open_orcid_index
 from oc_ds_converter.lib.cleaner import Cleaner
 from oc_ds_converter.lib.csvmanager import CSVManager
 from oc_ds_converter.lib.master_of_regex import orcid_pattern
 
 
+# Publishers mappings already loaded by this process and their prefix index, keyed by the
+# path, modification time and size of the publishers file
+_publishers_cache: dict[tuple[str, int, int], tuple[dict[str, dict[str, str | set[str]]], dict[str, tuple[str, str]]]] = {}
+
+
 def families_match(a: str, b: str) -> bool:
     tokens_a = {t for t in re.split(r"\s+", (a or "").strip().lower()) if t}
     tokens_b = {t for t in re.split(r"\s+", (b or "").strip().lower()) if t}
@@ -33,16 +38,44 @@ class RaProcessor(object):
         publishers_filepath: str | None = None,
         citing_entities: str | None = None,
     ):
-        self.publishers_mapping = self.load_publishers_mapping(publishers_filepath) if publishers_filepath else None
+        self.publishers_mapping: dict[str, dict[str, str | set[str]]] | None = None
+        self.publishers_prefix_index: dict[str, tuple[str, str]] = {}
+        if publishers_filepath:
+            self.publishers_mapping, self.publishers_prefix_index = self.load_publishers(publishers_filepath)
         if orcid_index is None:
             self.orcid_index: OrcidIndexInterface = CSVManager(None)
         elif isinstance(orcid_index, str):
-            self.orcid_index = CSVManager(orcid_index)
+            self.orcid_index = open_orcid_index(orcid_index)
         else:
             self.orcid_index = orcid_index
         if citing_entities:
             self.unzip_citing_entities(citing_entities)
             self.citing_entities_set = CSVManager.load_csv_column_as_set(citing_entities, 'id') if citing_entities else None
+        self._meta_existence: dict[str, bool] = {}
+
+    def check_meta_existence(self, ids: list[str]) -> list[bool]:
+        '''
+        It checks with a single pipelined call which ids are already in Meta (DB-META-BR).
+        The answers replace those of the previous batch and are reused by exists_in_meta.
+        '''
+        existence = self.BR_redis.mexists_as_set(ids)
+        self._meta_existence = dict(zip(ids, existence))
+        return existence
+
+    def prefetch_meta_existence(self, ids: list[str]) -> None:
+        '''
+        It adds to the answers of the current batch those for the ids it does not cover yet,
+        e.g. the citing entities, with a single pipelined call.
+        '''
+        missing = [x for x in dict.fromkeys(ids) if x not in self._meta_existence]
+        if missing:
+            self._meta_existence.update(zip(missing, self.BR_redis.mexists_as_set(missing)))
+
+    def exists_in_meta(self, norm_id: str) -> bool:
+        exists = self._meta_existence.get(norm_id)
+        if exists is None:
+            exists = self._meta_existence[norm_id] = self.BR_redis.exists_as_set(norm_id)
+        return exists
 
     def get_agents_strings_list(self, doi: str, agents_list: List[dict]) -> Tuple[list, list]:
         authors_strings_list = list()
@@ -204,6 +237,26 @@ class RaProcessor(object):
             id = str(field)
             func(id, ids)
 
+    @staticmethod
+    def load_publishers(
+        publishers_filepath: str,
+    ) -> tuple[dict[str, dict[str, str | set[str]]], dict[str, tuple[str, str]]]:
+        '''
+        It returns the publishers mapping of load_publishers_mapping and an index from each
+        DOI prefix to the name and member id of its publisher. Both are built once per process
+        and file version and shared by all the processors, which must not modify them.
+        '''
+        stat = os.stat(publishers_filepath)
+        key = (os.path.abspath(publishers_filepath), stat.st_mtime_ns, stat.st_size)
+        if key not in _publishers_cache:
+            publishers_mapping = RaProcessor.load_publishers_mapping(publishers_filepath)
+            prefix_index: dict[str, tuple[str, str]] = {}
+            for member, data in publishers_mapping.items():
+                for prefix in data['prefixes']:
+                    prefix_index.setdefault(prefix, (str(data['name']), member))
+            _publishers_cache[key] = (publishers_mapping, prefix_index)
+        return _publishers_cache[key]
+
     @staticmethod
     def load_publishers_mapping(publishers_filepath: str) -> dict[str, dict[str, str | set[str]]]:
         publishers_mapping: dict[str, dict[str, str | set[str]]] = {}
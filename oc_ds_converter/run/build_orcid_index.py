@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+from argparse import ArgumentParser
+
+from oc_ds_converter.datasource.orcid_index import build_orcid_index_db
+from oc_ds_converter.lib.console import console
+from oc_ds_converter.lib.file_manager import normalize_path
+
+if __name__ == '__main__':  # pragma: no cover
+    arg_parser = ArgumentParser('build_orcid_index.py',
+                                description='Compile a directory of DOI-ORCID index CSV files into a single '
+                                            'index file. Passed to the converters with -o, the file is shared '
+                                            'by all the worker processes instead of being loaded by each of them.')
+    arg_parser.add_argument('-i', '--input', dest='orcid_index_dir', required=True,
+                            help='Directory containing the DOI-ORCID index CSV files')
+    arg_parser.add_argument('-o', '--output', dest='db_path', required=True,
+                            help='Path of the compiled index file')
+    arg_parser.add_argument('-m', '--max_workers', dest='max_workers', required=False, default=None, type=int,
+                            help='Number of processes reading the CSV files (default: one per CPU)')
+    args = arg_parser.parse_args()
+    db_path = normalize_path(args.db_path)
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    count = build_orcid_index_db(normalize_path(args.orcid_index_dir), db_path, args.max_workers)
+    console.print(f'[green]{count} DOIs written to {db_path}[/green]')
@@ -5,41 +5,85 @@
 #
 # SPDX-License-Identifier: ISC
 
-import csv
 import os
 import sys
 import tarfile
+from collections.abc import Iterator
 from argparse import ArgumentParser
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
 from multiprocessing import get_context
 from pathlib import Path
 from tarfile import TarInfo
 
 import yaml
-from filelock import BaseFileLock, FileLock
+from filelock import FileLock
 
 from oc_ds_converter.crossref.crossref_processing import CrossrefProcessing
 from oc_ds_converter.crossref.extract_crossref_publishers import is_stale as publishers_is_stale
 from oc_ds_converter.crossref.extract_crossref_publishers import process as extract_publishers
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.datasource.orcid_index import (
     OrcidIndexRedis,
     PublishersRedis,
+    is_orcid_index_db,
     load_orcid_index_to_redis,
     load_publishers_to_redis,
 )
 from oc_ds_converter.lib.console import advance_progress, console, create_progress
 from oc_ds_converter.lib.file_manager import normalize_path, pathoo
-from oc_ds_converter.lib.jsonmanager import get_all_files_by_type, load_json
+from oc_ds_converter.lib.jsonmanager import batched, get_all_files_by_type, iter_json_items, read_tar_member
 from oc_ds_converter.lib.process_utils import (
+    CitedWorkWriter,
     cleanup_storage,
     delete_cache_files,
     get_storage_manager,
+    has_cited_work,
     init_process_cache,
     is_file_in_cache,
+    iter_cited_work,
     mark_file_completed,
     normalize_cache_path,
+    write_csv_output,
 )
+from oc_ds_converter.oc_idmanager.base import MEMO_CACHE_SIZE, enable_memoization
+from oc_ds_converter.oc_idmanager.response_cache import enable_response_cache
+from oc_ds_converter.oc_idmanager.support import enable_rate_limits
 
+# Number of Crossref items parsed, prefetched and converted together: peak memory per worker
+# depends on this value rather than on the size of the input file.
+ITEMS_BATCH_SIZE = 1000
+# Members of a tar.gz input extracted ahead of time for each worker when processing in parallel
+TAR_MEMBERS_PER_WORKER = 2
+
+# Processor of the current worker process, built once by _init_worker
+_worker_processor: CrossrefProcessing | None = None
+
+
+def _create_processor(
+    orcid_index: str | None,
+    publishers_filepath: str | None,
+    testing: bool,
+    processing_citing: bool,
+    use_orcid_api: bool,
+    use_redis: bool,
+    exclude_existing: bool,
+    storage_path: str | None,
+) -> CrossrefProcessing:
+    storage_manager = get_storage_manager(storage_path, testing)
+    return CrossrefProcessing(
+        orcid_index=orcid_index, publishers_filepath=publishers_filepath,
+        storage_manager=storage_manager,
+        testing=testing, citing=processing_citing, use_orcid_api=use_orcid_api,
+        use_redis_orcid_index=use_redis, use_redis_publishers=use_redis,
+        exclude_existing=exclude_existing
+    )
+
+
+def _init_worker(*processor_args: object) -> None:
+    """``ProcessPoolExecutor`` initializer: id managers, storage and Redis connections and the
+    publishers mapping are set up once per worker instead of once per file."""
+    global _worker_processor
+    _worker_processor = _create_processor(*processor_args)  # type: ignore[arg-type]
 
 
 def _run_iteration(
@@ -57,6 +101,8 @@ def _run_iteration(
     use_redis: bool = False,
     exclude_existing: bool = False,
     storage_path: str | None = None,
+    items_batch_size: int = ITEMS_BATCH_SIZE,
+    single_pass: bool = False,
 ) -> None:
     iteration_label = "citing entities" if processing_citing else "cited entities"
     iteration_num = "First" if processing_citing else "Second"
@@ -64,34 +110,64 @@ def _run_iteration(
     with create_progress() as progress:
         task = progress.add_task(f"[green]{iteration_num} iteration ({iteration_label})", total=len(all_files))
 
+        processor_args = (
+            orcid_doi_filepath, publishers_filepath, testing, processing_citing, use_orcid_api,
+            use_redis, exclude_existing, storage_path
+        )
         if max_workers == 1:
+            processor = _create_processor(*processor_args)
             for filename in all_files:
                 was_processed = get_citations_and_metadata(
                     filename, targz_fd, preprocessed_citations_dir, csv_dir, orcid_doi_filepath,
                     publishers_filepath,
                     testing, cache, processing_citing=processing_citing, use_orcid_api=use_orcid_api,
                     use_redis=use_redis, exclude_existing=exclude_existing,
-                    storage_path=storage_path
+                    storage_path=storage_path, items_batch_size=items_batch_size,
+                    single_pass=single_pass, processor=processor
                 )
                 advance_progress(progress, task, processed=was_processed)
         else:
-            with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context('spawn')) as executor:
-                futures = []
+            # With a tar.gz input the archive is read here, sequentially, and each worker receives
+            # the bytes of one member: the tar file descriptor cannot be shared with spawned
+            # processes. Submissions are throttled so that only a few members are held in memory.
+            cache_path = normalize_cache_path(cache)
+            if targz_fd is not None:
+                cache_dict = init_process_cache(cache_path, FileLock(cache_path + ".lock"))
+            max_pending = max_workers * TAR_MEMBERS_PER_WORKER
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=get_context('spawn'),
+                initializer=_init_worker, initargs=processor_args
+            ) as executor:
+                pending: set[Future[bool]] = set()
                 for filename in all_files:
                     if isinstance(filename, str) and filename.startswith("._"):
                         advance_progress(progress, task, processed=False)
                         continue
+                    file_content = None
+                    if targz_fd is not None and isinstance(filename, TarInfo):
+                        if is_file_in_cache(cache_dict, filename.name, processing_citing):
+                            advance_progress(progress, task, processed=False)
+                            continue
+                        reads_spill = (
+                            single_pass and not processing_citing and has_cited_work(cache_path, filename.name)
+                        )
+                        if not reads_spill:
+                            file_content = read_tar_member(targz_fd, filename)
+                        filename = filename.name
                     future = executor.submit(
                         get_citations_and_metadata,
-                        filename, targz_fd, preprocessed_citations_dir, csv_dir, orcid_doi_filepath,
+                        filename, None, preprocessed_citations_dir, csv_dir, orcid_doi_filepath,
                         publishers_filepath,
                         testing, cache, processing_citing, use_orcid_api, use_redis,
-                        exclude_existing, storage_path
+                        exclude_existing, storage_path, items_batch_size, file_content, single_pass
                     )
-                    futures.append(future)
-                for future in futures:
-                    was_processed = future.result()
-                    advance_progress(progress, task, processed=was_processed)
+                    pending.add(future)
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            advance_progress(progress, task, processed=future.result())
+                for future in as_completed(pending):
+                    advance_progress(progress, task, processed=future.result())
             console.print(f'[green]{iteration_num} iteration complete[/green]')
 
 
@@ -117,9 +193,27 @@ def _extract_redis_ids_and_update(
                     all_ra.extend(ent_all_ra)
 
     processor.prefetch_doi_orcid_index(all_dois_for_orcid_index)
+    citing_ids = [
+        norm for doi in all_dois_for_orcid_index
+        if (norm := processor.doi_m.normalise(doi, include_prefix=True))
+    ] if processing_citing else []
+    processor.prefetch_storage_values(citing_ids + all_br + all_ra)
     redis_validity_values_br = processor.get_redis_validity_list(all_br, "br")
     redis_validity_values_ra = processor.get_redis_validity_list(all_ra, "ra")
     processor.update_redis_values(redis_validity_values_br, redis_validity_values_ra)
+    if processor.exclude_existing and processing_citing:
+        processor.prefetch_meta_existence(citing_ids)
+    if not processing_citing:
+        processor.prevalidate_dois(all_br)
+
+
+def _reduce_to_cited_work(entity_list: list[dict]) -> Iterator[dict]:
+    """Keep only what ``_process_cited_entities`` reads: the DOI and the DOI references."""
+    for entity in entity_list:
+        if entity and entity.get("DOI"):
+            references = [{"DOI": x["DOI"]} for x in entity.get("reference", []) if x.get("DOI")]
+            if references:
+                yield {"DOI": entity["DOI"], "reference": references}
 
 
 def _save_output_files(
@@ -129,34 +223,12 @@ def _save_output_files(
     citation_links_output_base: str,
     processor: CrossrefProcessing,
     processing_citing: bool,
-    cache_path: str,
-    lock: BaseFileLock,
-    filename: str,
 ) -> None:
-    if entity_rows:
-        suffix = "_citing.csv" if processing_citing else "_cited.csv"
-        filepath = metadata_output_base + suffix
-        with open(filepath, 'w', newline='', encoding='utf-8') as output_file:
-            dict_writer = csv.DictWriter(
-                output_file, entity_rows[0].keys(), delimiter=',', quotechar='"',
-                quoting=csv.QUOTE_NONNUMERIC, escapechar='\\'
-            )
-            dict_writer.writeheader()
-            dict_writer.writerows(entity_rows)
-    processor.memory_to_storage()
-
-    if not processing_citing and citation_rows:
-        filepath = citation_links_output_base + ".csv"
-        with open(filepath, 'w', newline='', encoding='utf-8') as output_file:
-            dict_writer = csv.DictWriter(
-                output_file, citation_rows[0].keys(), delimiter=',', quotechar='"',
-                quoting=csv.QUOTE_NONNUMERIC, escapechar='\\'
-            )
-            dict_writer.writeheader()
-            dict_writer.writerows(citation_rows)
-
+    suffix = "_citing.csv" if processing_citing else "_cited.csv"
+    write_csv_output(metadata_output_base + suffix, entity_rows, append=True)
+    if not processing_citing:
+        write_csv_output(citation_links_output_base + ".csv", citation_rows, append=True)
     processor.memory_to_storage()
-    mark_file_completed(cache_path, lock, filename, processing_citing)
 
 
 def _process_citing_entities(
@@ -175,13 +247,12 @@ def _process_citing_entities(
                 continue
 
             # If the id is not in the storage, it means it was not processed and is not in the csv output tables yet
-            in_storage = processor.doi_m.storage_manager.get_value(norm_source_id)
+            in_storage = processor.stored_validity(norm_source_id)
 
             if not in_storage:
                 # If exclude_existing is enabled, skip entities that already exist in Meta
                 if processor.exclude_existing:
-                    exists_in_meta = processor.BR_redis.exists_as_set(norm_source_id)
-                    if exists_in_meta:
+                    if processor.exists_in_meta(norm_source_id):
                         processor.tmp_doi_m.storage_manager.set_value(norm_source_id, True)
                         continue
 
@@ -229,8 +300,7 @@ def _process_cited_entities(
                                     valid_target_ids.append(norm_id)
                                     # If exclude_existing is enabled, skip metadata creation for entities already in Meta
                                     if processor.exclude_existing:
-                                        exists_in_meta = processor.BR_redis.exists_as_set(norm_id)
-                                        if exists_in_meta:
+                                        if processor.exists_in_meta(norm_id):
                                             continue
 
                                     cited_entity_dict = {"DOI": norm_id}
@@ -263,6 +333,8 @@ def preprocess(
     publishers_max_age: int = 30,
     exclude_existing: bool = False,
     storage_path: str | None = None,
+    items_batch_size: int = ITEMS_BATCH_SIZE,
+    single_pass: bool = False,
 ) -> None:
 
     # create output dir if does not exist
@@ -294,18 +366,21 @@ def preprocess(
     if not os.path.exists(publishers_filepath) if publishers_filepath else False:
         publishers_filepath = None
 
-    if use_redis:
+    orcid_index_for_processor: str | None
+    if is_orcid_index_db(orcid_doi_filepath):
+        console.print('[cyan]Using the compiled DOI-ORCID index file[/cyan]')
+        orcid_index_for_processor = orcid_doi_filepath
+    elif use_redis:
         orcid_index_redis = OrcidIndexRedis(testing=testing)
         if orcid_doi_filepath:
             console.print('[cyan]Updating DOI-ORCID index in Redis...[/cyan]')
-            orcid_index_redis.clear()
-            load_orcid_index_to_redis(
+            loaded = load_orcid_index_to_redis(
                 orcid_doi_filepath, orcid_index_redis, max_workers=redis_workers
             )
-            console.print('[green]DOI-ORCID index updated in Redis[/green]')
+            console.print(f'[green]DOI-ORCID index updated in Redis ({loaded} new or changed files)[/green]')
         else:
             console.print('[cyan]Using existing DOI-ORCID index from Redis[/cyan]')
-        orcid_index_for_processor: str | None = None
+        orcid_index_for_processor = None
     else:
         orcid_index_for_processor = orcid_doi_filepath
 
@@ -324,8 +399,8 @@ def preprocess(
         publishers_filepath, testing, cache
     )
 
-    _run_iteration(*iteration_args, processing_citing=True, use_orcid_api=use_orcid_api, max_workers=max_workers, use_redis=use_redis, exclude_existing=exclude_existing, storage_path=storage_path)
-    _run_iteration(*iteration_args, processing_citing=False, use_orcid_api=use_orcid_api, max_workers=max_workers, use_redis=use_redis, exclude_existing=exclude_existing, storage_path=storage_path)
+    _run_iteration(*iteration_args, processing_citing=True, use_orcid_api=use_orcid_api, max_workers=max_workers, use_redis=use_redis, exclude_existing=exclude_existing, storage_path=storage_path, items_batch_size=items_batch_size, single_pass=single_pass)
+    _run_iteration(*iteration_args, processing_citing=False, use_orcid_api=use_orcid_api, max_workers=max_workers, use_redis=use_redis, exclude_existing=exclude_existing, storage_path=storage_path, items_batch_size=items_batch_size, single_pass=single_pass)
 
     cache_path = cache if cache else os.path.join(os.getcwd(), "cache.json")
     delete_cache_files(cache_path)
@@ -337,7 +412,11 @@ def get_citations_and_metadata(file_name, targz_fd, preprocessed_citations_dir:
                                publishers_filepath: str | None,
                                testing: bool, cache: str | None, processing_citing: bool, use_orcid_api: bool,
                                use_redis: bool = False, exclude_existing: bool = False,
-                               storage_path: str | None = None) -> bool:
+                               storage_path: str | None = None,
+                               items_batch_size: int = ITEMS_BATCH_SIZE,
+                               file_content: bytes | None = None,
+                               single_pass: bool = False,
+                               processor: CrossrefProcessing | None = None) -> bool:
     if isinstance(file_name, tarfile.TarInfo):
         file_name = file_name.name
     cache_path = normalize_cache_path(cache)
@@ -348,19 +427,13 @@ def get_citations_and_metadata(file_name, targz_fd, preprocessed_citations_dir:
     if is_file_in_cache(cache_dict, file_basename, processing_citing):
         return False
 
-    storage_manager = get_storage_manager(storage_path, testing)
-    crossref_csv = CrossrefProcessing(
-        orcid_index=orcid_index, publishers_filepath=publishers_filepath,
-        storage_manager=storage_manager,
-        testing=testing, citing=processing_citing, use_orcid_api=use_orcid_api,
-        use_redis_orcid_index=use_redis, use_redis_publishers=use_redis,
-        exclude_existing=exclude_existing
-    )
-
-    source_data = load_json(file_name, targz_fd)
-    if source_data is None:
-        return False
-    source_dict = source_data['items']
+    crossref_csv = processor or _worker_processor
+    if crossref_csv is None:
+        crossref_csv = _create_processor(
+            orcid_index, publishers_filepath, testing, processing_citing, use_orcid_api,
+            use_redis, exclude_existing, storage_path
+        )
+    crossref_csv.reset_file_state()
 
     filename_without_ext = file_basename.replace('.json', '').replace('.tar', '').replace('.gz', '')
     filepath = os.path.join(csv_dir, f'{filename_without_ext}.csv')
@@ -372,21 +445,41 @@ def get_citations_and_metadata(file_name, targz_fd, preprocessed_citations_dir:
     filepath_citations = os.path.join(preprocessed_citations_dir, f'{filename_without_ext}.csv')
     pathoo(filepath_citations)
 
-    _extract_redis_ids_and_update(crossref_csv, source_dict, processing_citing)
-
-    if processing_citing:
-        citing_entity_rows = _process_citing_entities(crossref_csv, source_dict)
-        _save_output_files(
-            citing_entity_rows, [], metadata_output_base, citation_links_output_base,
-            crossref_csv, True, cache_path, lock, file_basename
-        )
-    else:
-        cited_entity_rows, citation_rows = _process_cited_entities(crossref_csv, source_dict)
-        _save_output_files(
-            cited_entity_rows, citation_rows, metadata_output_base, citation_links_output_base,
-            crossref_csv, False, cache_path, lock, file_basename
-        )
+    # Rows are appended batch by batch: drop leftovers of an interrupted run on this file
+    stale_outputs = [metadata_output_base + ("_citing.csv" if processing_citing else "_cited.csv")]
+    if not processing_citing:
+        stale_outputs.append(citation_links_output_base + ".csv")
+    for stale_output in stale_outputs:
+        if os.path.exists(stale_output):
+            os.remove(stale_output)
+
+    # In single-pass mode the first iteration spills the references of each file, so that the
+    # second one does not need to decompress and parse the Crossref file again
+    work_writer = CitedWorkWriter(cache_path, file_basename) if single_pass and processing_citing else None
+    items = iter_cited_work(cache_path, file_basename) if single_pass and not processing_citing else None
+    if items is None:
+        items = iter_json_items(file_name, targz_fd, content=file_content)
+    for source_dict in batched(items, items_batch_size):
+        _extract_redis_ids_and_update(crossref_csv, source_dict, processing_citing)
+
+        if processing_citing:
+            if work_writer is not None:
+                work_writer.write(_reduce_to_cited_work(source_dict))
+            citing_entity_rows = _process_citing_entities(crossref_csv, source_dict)
+            _save_output_files(
+                citing_entity_rows, [], metadata_output_base, citation_links_output_base,
+                crossref_csv, True
+            )
+        else:
+            cited_entity_rows, citation_rows = _process_cited_entities(crossref_csv, source_dict)
+            _save_output_files(
+                cited_entity_rows, citation_rows, metadata_output_base, citation_links_output_base,
+                crossref_csv, False
+            )
 
+    if work_writer is not None:
+        work_writer.commit()
+    mark_file_completed(cache_path, lock, file_basename, processing_citing)
     return True
 
 
@@ -400,8 +493,9 @@ if __name__ == '__main__':  # pragma: no cover
     arg_parser.add_argument('-out', '--output', dest='csv_dir', required=required,
                             help='Directory where CSV will be stored')
     arg_parser.add_argument('-o', '--orcid', dest='orcid_doi_filepath', required=False,
-                            help='Directory containing DOI-ORCID index CSV files. If specified, updates the Redis '
-                                 'DOI-ORCID index database. If not specified, uses the existing index in Redis.')
+                            help='Directory containing DOI-ORCID index CSV files. If specified, loads the new or '
+                                 'changed files into the Redis DOI-ORCID index database. If not specified, uses the existing index in Redis. '
+                                 'An index file compiled by build_orcid_index.py is used as it is, with or without Redis.')
     arg_parser.add_argument('-ca', '--cache', dest='cache', required=False,
                             help='Path to a JSON file for caching processed files. Tracks which files have been '
                                  'processed to allow resuming. Deleted at the end of successful processing.')
@@ -411,6 +505,14 @@ if __name__ == '__main__':  # pragma: no cover
                                  'Use this flag for tests only, not for production runs.')
     arg_parser.add_argument('-m', '--max_workers', dest='max_workers', required=False, default=1, type=int,
                             help='Workers number')
+    arg_parser.add_argument('--batch-size', dest='items_batch_size', required=False, default=ITEMS_BATCH_SIZE,
+                            type=int,
+                            help='Number of Crossref items of a file loaded and processed at once (default: '
+                                 f'{ITEMS_BATCH_SIZE}). Lower values reduce the memory used by each worker.')
+    arg_parser.add_argument('--single-pass', dest='single_pass', action='store_true', required=False,
+                            help='Parse each input file only once: the first iteration stores the references '
+                                 'of each file next to the cache, and the second iteration reads them from '
+                                 'there instead of the original files.')
     arg_parser.add_argument('--redis-workers', dest='redis_workers', required=False, default=None, type=int,
                             help='Number of parallel workers for loading DOI-ORCID index to Redis. '
                                  'Defaults to CPU count if not specified.')
@@ -425,10 +527,29 @@ if __name__ == '__main__':  # pragma: no cover
                                  'not citations). When enabled, checks DB-META-BR before creating metadata rows.')
     arg_parser.add_argument('-s', '--storage_path', dest='storage_path', required=False,
                             help='Path for ID validation storage. Use .db extension for SQLite or .json for '
-                                 'in-memory JSON storage. If not specified, uses in-memory storage.')
+                                 'in-memory JSON storage. If not specified, uses in-memory storage. SQLite storage '
+                                 'can be shared by multiple workers.')
     arg_parser.add_argument('-r', '--use-redis', dest='use_redis', action='store_true', required=False,
-                            help='Use Redis for DOI-ORCID index and publishers lookup. Required for multiprocessing. '
+                            help='Use Redis for DOI-ORCID index and publishers lookup. Multiprocessing requires either '
+                                 'this option or a .db storage path. '
                                  'By default, in-memory storage is used.')
+    arg_parser.add_argument('--http-cache', dest='http_cache', required=False,
+                            help='Path of a SQLite database where the responses of the identifier APIs are '
+                                 'cached, so that later runs and other converters reuse them.')
+    arg_parser.add_argument('--memoize-ids', dest='memoize_ids', nargs='?', const=MEMO_CACHE_SIZE, type=int,
+                            required=False,
+                            help='Memoize the normalisation and syntax checks of DOIs, ORCIDs, ISSNs and ISBNs, '
+                                 f'keeping the given number of results per check (default: {MEMO_CACHE_SIZE}).')
+    arg_parser.add_argument('--rate-limits', dest='rate_limits', required=False,
+                            help='Requests per second allowed to the identifier APIs, as comma separated '
+                                 'host=rate[/burst] pairs overriding the defaults (e.g. doi.org=20/20,'
+                                 'pub.orcid.org=24/40), where host=off lifts a limit and off alone lifts them all.')
+    arg_parser.add_argument('--rate-limit-dir', dest='rate_limit_dir', required=False,
+                            help='Directory of the state shared by the processes drawing from the same rate limits '
+                                 '(default: a directory of the current user in the system temporary directory).')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
 
     args = arg_parser.parse_args()
     config = args.config
@@ -455,22 +576,31 @@ if __name__ == '__main__':  # pragma: no cover
     storage_path = normalize_path(storage_path) if storage_path else None
     use_redis = settings.get('use_redis', args.use_redis) if settings else args.use_redis
     redis_workers = settings.get('redis_workers', args.redis_workers) if settings else args.redis_workers
-
-    # SQLite and InMemory don't support concurrent access
-    if storage_path and max_workers > 1:
-        console.print('[yellow]Warning: SQLite/JSON storage requires single-threaded mode. Setting max_workers=1[/yellow]')
+    items_batch_size = settings.get('items_batch_size', args.items_batch_size) if settings else args.items_batch_size
+    single_pass = settings.get('single_pass', args.single_pass) if settings else args.single_pass
+    http_cache = settings.get('http_cache', args.http_cache) if settings else args.http_cache
+    if http_cache:
+        enable_response_cache(normalize_path(http_cache))
+    memoize_ids = settings.get('memoize_ids', args.memoize_ids) if settings else args.memoize_ids
+    if memoize_ids:
+        enable_memoization(memoize_ids)
+    rate_limits = settings.get('rate_limits', args.rate_limits) if settings else args.rate_limits
+    rate_limit_dir = settings.get('rate_limit_dir', args.rate_limit_dir) if settings else args.rate_limit_dir
+    if rate_limits or rate_limit_dir:
+        enable_rate_limits(rate_limits, normalize_path(rate_limit_dir) if rate_limit_dir else None)
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
+
+    # InMemory storage is not shared across processes, SQLite storage is
+    if storage_path and not storage_path.endswith('.db') and max_workers > 1:
+        console.print('[yellow]Warning: JSON storage requires single-threaded mode. Setting max_workers=1[/yellow]')
         max_workers = 1
 
-    if max_workers > 1 and not use_redis:
-        console.print('[yellow]Warning: Multiprocessing requires Redis. Setting max_workers=1[/yellow]')
+    if max_workers > 1 and not use_redis and not storage_path:
+        console.print('[yellow]Warning: Multiprocessing requires Redis or SQLite storage. Setting max_workers=1[/yellow]')
         max_workers = 1
 
-    if max_workers > 1 and crossref_json_dir.endswith('.tar.gz'):
-        arg_parser.error(
-            'Multiprocessing (--max_workers > 1) is incompatible with tar.gz input. '
-            'Either extract the archive first or use --max_workers 1.'
-        )
-
     preprocess(
         crossref_json_dir=crossref_json_dir,
         orcid_doi_filepath=orcid_doi_filepath,
@@ -485,4 +615,6 @@ if __name__ == '__main__':  # pragma: no cover
         publishers_max_age=publishers_max_age,
         exclude_existing=exclude_existing,
         storage_path=storage_path,
+        items_batch_size=items_batch_size,
+        single_pass=single_pass,
     )
@@ -10,14 +10,14 @@ import json
 import os
 import sys
 from argparse import ArgumentParser
-from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from json import JSONDecodeError
 from multiprocessing import get_context
 from pathlib import Path
 
 import yaml
 from filelock import FileLock
-from tqdm import tqdm
 
 from oc_ds_converter.datasource.orcid_index import (
     OrcidIndexRedis,
@@ -25,14 +25,76 @@ from oc_ds_converter.datasource.orcid_index import (
 )
 
 from oc_ds_converter.datacite.datacite_processing import DataciteProcessing
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.lib.console import advance_progress, console, create_progress
-from oc_ds_converter.lib.csvmanager import CSVManager
 from oc_ds_converter.lib.file_manager import normalize_path
-from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
+from oc_ds_converter.lib.jsonmanager import batched, get_all_files_by_type
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.sqlite_manager import SqliteStorageManager
 
+# Number of DataCite records whose ids are prefetched and converted together: JSON Lines
+# files are streamed, so at most this many parsed records are held in memory at a time
+RECORDS_BATCH_SIZE = 1000
+
+# Processor of the current worker process, built once by _init_worker
+_worker_processor: DataciteProcessing | None = None
+
+
+def _create_processor(orcid_index: str | None, doi_csv: str | None, publishers_filepath: str | None,
+                      storage_path: str | None, redis_storage_manager: bool, testing: bool,
+                      use_orcid_api: bool, use_ror_api: bool, use_viaf_api: bool,
+                      use_wikidata_api: bool) -> DataciteProcessing:
+    if redis_storage_manager:
+        storage_manager = RedisStorageManager(testing=testing)
+    else:
+        storage_manager = SqliteStorageManager(storage_path) if storage_path else InMemoryStorageManager()
+    return DataciteProcessing(orcid_index=orcid_index, doi_csv=doi_csv,
+                              publishers_filepath_dc=publishers_filepath,
+                              storage_manager=storage_manager, testing=testing, use_orcid_api=use_orcid_api,
+                              use_ror_api=use_ror_api, use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
+
+
+def _init_worker(*processor_args: object) -> None:
+    """``ProcessPoolExecutor`` initializer: the DOI-ORCID index, the publishers mapping, the id
+    managers and the storage are loaded once per worker instead of being sent with every file."""
+    global _worker_processor
+    _worker_processor = _create_processor(*processor_args)  # type: ignore[arg-type]
+
+
+def _run_iteration(json_files: list[str], preprocessed_citations_dir: str, csv_dir: str, bad_dir: str,
+                   cache: str | None, is_first_iteration: bool, processor_args: tuple,
+                   max_workers: int = 1) -> None:
+    iteration_label = "citing entities" if is_first_iteration else "cited entities"
+    iteration_num = "First" if is_first_iteration else "Second"
+    (orcid_index, doi_csv, publishers_filepath, storage_path, redis_storage_manager, testing,
+     use_orcid_api, use_ror_api, use_viaf_api, use_wikidata_api) = processor_args
+    task_args = (preprocessed_citations_dir, csv_dir, orcid_index, doi_csv, publishers_filepath, storage_path,
+                 redis_storage_manager, testing, cache, is_first_iteration, use_orcid_api, use_ror_api,
+                 use_viaf_api, use_wikidata_api, bad_dir)
+
+    with create_progress() as progress:
+        task = progress.add_task(f"[green]{iteration_num} iteration ({iteration_label})", total=len(json_files))
+        if max_workers == 1:
+            processor = _create_processor(*processor_args)
+            for json_file in json_files:
+                was_processed = get_citations_and_metadata(json_file, *task_args, processor=processor)
+                advance_progress(progress, task, processed=was_processed)
+        else:
+            # Workers only receive the path of each file: they read and parse it themselves
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=get_context('spawn'),
+                initializer=_init_worker, initargs=processor_args
+            ) as executor:
+                futures = [executor.submit(get_citations_and_metadata, json_file, *task_args)
+                           for json_file in json_files]
+                for future in as_completed(futures):
+                    try:
+                        was_processed = future.result()
+                    except Exception as e:
+                        print(f"Task failed: {e}")
+                        was_processed = False
+                    advance_progress(progress, task, processed=was_processed)
 
 
 def preprocess(datacite_json_dir:str, publishers_filepath:str|None, orcid_doi_filepath:str|None,
@@ -59,8 +121,6 @@ def preprocess(datacite_json_dir:str, publishers_filepath:str|None, orcid_doi_fi
             log = '[INFO: datacite_process] Processing: ' + '; '.join(what)
             print(log)
 
-    orcid_doi_filepath = CSVManager(orcid_doi_filepath)
-
     if verbose:
         console.print(f'[cyan]Getting all files from {datacite_json_dir}[/cyan]')
 
@@ -73,80 +133,20 @@ def preprocess(datacite_json_dir:str, publishers_filepath:str|None, orcid_doi_fi
     # dedup e ordine stabile
     all_input_json = sorted(list(dict.fromkeys(all_input_json)))
 
+    # The DOI-ORCID index is passed as a path and loaded by each processor
+    processor_args = (
+        orcid_doi_filepath, wanted_doi_filepath, publishers_filepath, storage_path, redis_storage_manager,
+        testing, use_orcid_api, use_ror_api, use_viaf_api, use_wikidata_api
+    )
     if not redis_storage_manager or max_workers == 1:
-        bad_list = []
-        with create_progress() as progress:
-            task = progress.add_task(f"[green]First iteration (citing entities)", total=len(all_input_json))
-            for json_file in all_input_json:
-                chunk = read_json(json_file, bad_dir)
-                if chunk:
-                    was_processed = get_citations_and_metadata(json_file, chunk, preprocessed_citations_dir, csv_dir, orcid_doi_filepath,
-                                       wanted_doi_filepath, publishers_filepath, storage_path,
-                                       redis_storage_manager,
-                                       testing, cache, is_first_iteration=True, use_orcid_api=use_orcid_api, use_ror_api=use_ror_api,
-                                        use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
-                    advance_progress(progress, task, processed=was_processed)
-                else:
-                    bad_list.append(json_file)
-                    advance_progress(progress, task, processed=False)
-
-        with create_progress() as progress:
-            task = progress.add_task(f"[green]Second iteration (cited entities)", total=len(all_input_json))
-            for json_file in all_input_json:
-                if json_file not in bad_list:
-                    chunk = read_json(json_file, bad_dir)
-                    if chunk:
-                        was_processed = get_citations_and_metadata(json_file, chunk, preprocessed_citations_dir, csv_dir, orcid_doi_filepath,
-                                        wanted_doi_filepath, publishers_filepath, storage_path,
-                                        redis_storage_manager,
-                                        testing, cache, is_first_iteration=False, use_orcid_api=use_orcid_api, use_ror_api=use_ror_api,
-                                            use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
-                        advance_progress(progress, task, processed=was_processed)
-                    else:
-                        advance_progress(progress, task, processed=False)
-                else:
-                    advance_progress(progress, task, processed=False)
-
-    elif redis_storage_manager or max_workers > 1:
-        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context('spawn')) as executor:
-            # Pass 1: is_first_iteration=True
-            futures_pass1 = []
-            for json_file in tqdm(all_input_json):
-                chunk = read_json(json_file, bad_dir)
-                if chunk:
-                    future = executor.submit(
-                        get_citations_and_metadata,
-                        json_file, chunk, preprocessed_citations_dir, csv_dir,
-                        orcid_doi_filepath, wanted_doi_filepath,
-                        publishers_filepath, storage_path, redis_storage_manager,
-                        testing, cache, True, use_orcid_api, use_ror_api, use_viaf_api, use_wikidata_api)
-                    futures_pass1.append(future)
-
-            for future in futures_pass1:
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Task failed: {e}")
-
-        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context('spawn')) as executor:
-            # Pass 2: is_first_iteration=False
-            futures_pass2 = []
-            for json_file in tqdm(all_input_json):
-                chunk = read_json(json_file, bad_dir)
-                if chunk:
-                    future = executor.submit(
-                        get_citations_and_metadata,
-                        json_file, chunk, preprocessed_citations_dir, csv_dir,
-                        orcid_doi_filepath, wanted_doi_filepath,
-                        publishers_filepath, storage_path, redis_storage_manager,
-                        testing, cache, False, use_orcid_api, use_ror_api, use_viaf_api, use_wikidata_api)
-                    futures_pass2.append(future)
-
-            for future in futures_pass2:
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Task failed: {e}")
+        max_workers = 1
+
+    _run_iteration(all_input_json, preprocessed_citations_dir, csv_dir, bad_dir, cache,
+                   True, processor_args, max_workers)
+    # The files moved to _bad during the first iteration are not read again
+    all_input_json = [json_file for json_file in all_input_json if os.path.exists(json_file)]
+    _run_iteration(all_input_json, preprocessed_citations_dir, csv_dir, bad_dir, cache,
+                   False, processor_args, max_workers)
 
     if cache:
         if os.path.exists(cache):
@@ -168,17 +168,13 @@ def preprocess(datacite_json_dir:str, publishers_filepath:str|None, orcid_doi_fi
         storage_manager.delete_storage()
 
 
-def get_citations_and_metadata(json_file:str, chunk: list, preprocessed_citations_dir: str, csv_dir: str,
-                               orcid_index: str | CSVManager,
+def get_citations_and_metadata(json_file:str, preprocessed_citations_dir: str, csv_dir: str,
+                               orcid_index: str | None,
                                doi_csv: str, publishers_filepath: str, storage_path: str,
                                redis_storage_manager: bool,
                                testing: bool, cache: str, is_first_iteration:bool, use_orcid_api: bool, use_ror_api: bool,
-                               use_viaf_api: bool, use_wikidata_api: bool):
-    if redis_storage_manager:
-        storage_manager = RedisStorageManager(testing=testing)
-    else:
-        storage_manager = SqliteStorageManager(storage_path) if storage_path else InMemoryStorageManager()
-
+                               use_viaf_api: bool, use_wikidata_api: bool, bad_dir: str = None,
+                               processor: DataciteProcessing | None = None) -> bool:
     if cache:
         if not cache.endswith(".json"):
             cache = os.path.join(os.getcwd(), "cache.json")
@@ -211,22 +207,21 @@ def get_citations_and_metadata(json_file:str, chunk: list, preprocessed_citation
 
     if cache_dict.get("first_iteration"):
         if is_first_iteration and json_to_save in cache_dict["first_iteration"]:
-            return
+            return False
 
     if cache_dict.get("second_iteration"):
         if not is_first_iteration and json_to_save in cache_dict["second_iteration"]:
-            return
+            return False
 
-    if is_first_iteration:
-        dc_csv = DataciteProcessing(orcid_index=orcid_index, doi_csv=doi_csv,
-                                      publishers_filepath_dc=publishers_filepath,
-                                      storage_manager=storage_manager, testing=testing, use_orcid_api=use_orcid_api,
-                                    use_ror_api=use_ror_api, use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
-    elif not is_first_iteration:
-        dc_csv = DataciteProcessing(orcid_index=orcid_index, doi_csv=doi_csv,
-                                  publishers_filepath_dc=publishers_filepath,
-                                  storage_manager=storage_manager, testing=testing, use_orcid_api=use_orcid_api, use_ror_api=use_ror_api,
-                                  use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
+    records = read_json(json_file, bad_dir)
+    if records is None:
+        return False
+
+    dc_csv = processor or _worker_processor
+    if dc_csv is None:
+        dc_csv = _create_processor(orcid_index, doi_csv, publishers_filepath, storage_path, redis_storage_manager,
+                                   testing, use_orcid_api, use_ror_api, use_viaf_api, use_wikidata_api)
+    dc_csv.reset_file_state()
 
     index_citations_to_csv = []
     data_subject = []
@@ -360,141 +355,206 @@ def get_citations_and_metadata(json_file:str, chunk: list, preprocessed_citation
             print(e)
 
     if is_first_iteration:
-        get_all_redis_ids_and_save_updates(chunk, is_first_iteration_par=True)
-        for entity in tqdm(chunk):
-            try:
-                if entity:
-                    attributes = entity.get("attributes")
-                    subject_id = attributes.get("doi")
+        for chunk in batched(records, RECORDS_BATCH_SIZE):
+            get_all_redis_ids_and_save_updates(chunk, is_first_iteration_par=True)
+            for entity in chunk:
+                try:
+                    if entity:
+                        attributes = entity.get("attributes")
+                        subject_id = attributes.get("doi")
 
-                    #identificativo della bibliographic resource primaria
-                    #normalizzo l'ID ricevuto in input e verifico se è già stato elaborato in precedenza consultando lo storage principale.
-                    #Se l'ID risulta nuovo (non presente), viene aggiunto a uno storage temporaneo per una successiva validazione o elaborazione batch.
+                        #identificativo della bibliographic resource primaria
+                        #normalizzo l'ID ricevuto in input e verifico se è già stato elaborato in precedenza consultando lo storage principale.
+                        #Se l'ID risulta nuovo (non presente), viene aggiunto a uno storage temporaneo per una successiva validazione o elaborazione batch.
 
-                    norm_subject_id = dc_csv.doi_m.normalise(subject_id, include_prefix=True)
+                        norm_subject_id = dc_csv.doi_m.normalise(subject_id, include_prefix=True)
 
-                    if not dc_csv.doi_m.storage_manager.get_value(norm_subject_id):
-                        dc_csv.tmp_doi_m.storage_manager.set_value(norm_subject_id, True)
+                        if not dc_csv.doi_m.storage_manager.get_value(norm_subject_id):
+                            dc_csv.tmp_doi_m.storage_manager.set_value(norm_subject_id, True)
 
-                        if norm_subject_id:
-                            #creo la riga per meta
-                            source_tab_data = dc_csv.csv_creator(entity)
-                            if source_tab_data:
-                                processed_source_id = source_tab_data["id"]
-                                if processed_source_id:
-                                    data_subject.append(source_tab_data)
+                            if norm_subject_id:
+                                #creo la riga per meta
+                                source_tab_data = dc_csv.csv_creator(entity)
+                                if source_tab_data:
+                                    processed_source_id = source_tab_data["id"]
+                                    if processed_source_id:
+                                        data_subject.append(source_tab_data)
 
-            except Exception as e:
-                print("[PROCESS ERROR] during subject processing. Entity preview:")
-                try:
-                    print(json.dumps(entity, ensure_ascii=False)[:500] + "...")
-                except Exception:
-                    print(str(entity)[:500] + "...")
-                print(f"Details: {e}")
-                continue
+                except Exception as e:
+                    print("[PROCESS ERROR] during subject processing. Entity preview:")
+                    try:
+                        print(json.dumps(entity, ensure_ascii=False)[:500] + "...")
+                    except Exception:
+                        print(str(entity)[:500] + "...")
+                    print(f"Details: {e}")
+                    continue
         save_files(data_subject, index_citations_to_csv, True)
 
     if not is_first_iteration:
-        get_all_redis_ids_and_save_updates(chunk, is_first_iteration_par=False)
-        for entity in tqdm(chunk):
-            try:
-                if entity:
-                    attributes = entity.get("attributes")
-                    rel_ids = attributes.get("relatedIdentifiers")
-                    if attributes.get("doi"):
-                        norm_subject_id = dc_csv.doi_m.normalise(attributes["doi"], include_prefix=True)
-                        if norm_subject_id and rel_ids:
-                            valid_target_ids = []
-                            for ref in rel_ids:
-                                if all(elem in ref for elem in dc_csv.needed_info):
-                                    relatedIdentifierType = (str(ref["relatedIdentifierType"])).lower()
-                                    relationType = (str(ref["relationType"])).lower()
-                                    if relatedIdentifierType == "doi":
-                                        if relationType in dc_csv.filter:
-                                            norm_object_id = dc_csv.doi_m.normalise(ref["relatedIdentifier"], include_prefix=True)
-                                            #controllo che l'identificativo dell'entità primaria sia diverso da quello related (non creo la citazione per self-citations)
-                                            if norm_object_id and norm_object_id != norm_subject_id:
-                                                norm_id_dict_to_val = {"schema": "doi"}
-                                                norm_id_dict_to_val["identifier"] = norm_object_id
-
-                                                stored_validity = dc_csv.validated_as(norm_id_dict_to_val)
-                                                #se non ho informazioni di validità su questo identificativo
-                                                if stored_validity is None:
-                                                    norm_id_dict = {"id": norm_object_id, "schema": "doi"}
-                                                    # valido l'identificativo
-                                                    if norm_object_id in dc_csv.to_validated_id_list(norm_id_dict):
-                                                        if dc_csv.exclude_existing and dc_csv.BR_redis.exists_as_set(norm_object_id):
-                                                            if relationType in ["cites", "references"]:
-                                                                rel_dict = {"rel_type": "cites", "object_id": norm_object_id}
-                                                                valid_target_ids.append(rel_dict)
-                                                            elif relationType in ["iscitedby", "isreferencedby"]:
-                                                                rel_dict = {"rel_type": "iscitedby", "object_id": norm_object_id}
-                                                                valid_target_ids.append(rel_dict)
-                                                            continue
-                                                        target_tab_data = dc_csv.csv_creator({"id": norm_object_id, "type": "dois", "attributes": {"doi": norm_object_id}})
-                                                        if target_tab_data:
-                                                            processed_target_id = target_tab_data.get("id")
-                                                            if processed_target_id:
-                                                                data_object.append(target_tab_data)
-
+        for chunk in batched(records, RECORDS_BATCH_SIZE):
+            get_all_redis_ids_and_save_updates(chunk, is_first_iteration_par=False)
+            for entity in chunk:
+                try:
+                    if entity:
+                        attributes = entity.get("attributes")
+                        rel_ids = attributes.get("relatedIdentifiers")
+                        if attributes.get("doi"):
+                            norm_subject_id = dc_csv.doi_m.normalise(attributes["doi"], include_prefix=True)
+                            if norm_subject_id and rel_ids:
+                                valid_target_ids = []
+                                for ref in rel_ids:
+                                    if all(elem in ref for elem in dc_csv.needed_info):
+                                        relatedIdentifierType = (str(ref["relatedIdentifierType"])).lower()
+                                        relationType = (str(ref["relationType"])).lower()
+                                        if relatedIdentifierType == "doi":
+                                            if relationType in dc_csv.filter:
+                                                norm_object_id = dc_csv.doi_m.normalise(ref["relatedIdentifier"], include_prefix=True)
+                                                #controllo che l'identificativo dell'entità primaria sia diverso da quello related (non creo la citazione per self-citations)
+                                                if norm_object_id and norm_object_id != norm_subject_id:
+                                                    norm_id_dict_to_val = {"schema": "doi"}
+                                                    norm_id_dict_to_val["identifier"] = norm_object_id
+
+                                                    stored_validity = dc_csv.validated_as(norm_id_dict_to_val)
+                                                    #se non ho informazioni di validità su questo identificativo
+                                                    if stored_validity is None:
+                                                        norm_id_dict = {"id": norm_object_id, "schema": "doi"}
+                                                        # valido l'identificativo
+                                                        if norm_object_id in dc_csv.to_validated_id_list(norm_id_dict):
+                                                            if dc_csv.exclude_existing and dc_csv.exists_in_meta(norm_object_id):
                                                                 if relationType in ["cites", "references"]:
                                                                     rel_dict = {"rel_type": "cites", "object_id": norm_object_id}
                                                                     valid_target_ids.append(rel_dict)
                                                                 elif relationType in ["iscitedby", "isreferencedby"]:
                                                                     rel_dict = {"rel_type": "iscitedby", "object_id": norm_object_id}
                                                                     valid_target_ids.append(rel_dict)
-                                                elif stored_validity is True:
-                                                    if relationType in ["cites", "references"]:
-                                                        rel_dict = {"rel_type": "cites", "object_id": norm_object_id}
-                                                        valid_target_ids.append(rel_dict)
-                                                    elif relationType in ["iscitedby", "isreferencedby"]:
-                                                        rel_dict = {"rel_type": "iscitedby", "object_id": norm_object_id}
-                                                        valid_target_ids.append(rel_dict)
-
-                            unique_dicts = [dict(t) for t in {tuple(sorted(d.items())) for d in valid_target_ids}]
-                            for rel_type_dict in unique_dicts:
-                                citation = dict()
-                                if rel_type_dict["rel_type"] == "cites":
-                                    citation["citing"] = norm_subject_id
-                                    citation["cited"] = rel_type_dict["object_id"]
-                                elif rel_type_dict["rel_type"] == "iscitedby":
-                                    citation["citing"] = rel_type_dict["object_id"]
-                                    citation["cited"] = norm_subject_id
-                                index_citations_to_csv.append(citation)
-            except Exception as e:
-                print("[PROCESS ERROR] during object processing. Entity preview:")
-                try:
-                    print(json.dumps(entity, ensure_ascii=False)[:500] + "...")
-                except Exception:
-                    print(str(entity)[:500] + "...")
-                print(f"Details: {e}")
-                continue
+                                                                continue
+                                                            target_tab_data = dc_csv.csv_creator({"id": norm_object_id, "type": "dois", "attributes": {"doi": norm_object_id}})
+                                                            if target_tab_data:
+                                                                processed_target_id = target_tab_data.get("id")
+                                                                if processed_target_id:
+                                                                    data_object.append(target_tab_data)
+
+                                                                    if relationType in ["cites", "references"]:
+                                                                        rel_dict = {"rel_type": "cites", "object_id": norm_object_id}
+                                                                        valid_target_ids.append(rel_dict)
+                                                                    elif relationType in ["iscitedby", "isreferencedby"]:
+                                                                        rel_dict = {"rel_type": "iscitedby", "object_id": norm_object_id}
+                                                                        valid_target_ids.append(rel_dict)
+                                                    elif stored_validity is True:
+                                                        if relationType in ["cites", "references"]:
+                                                            rel_dict = {"rel_type": "cites", "object_id": norm_object_id}
+                                                            valid_target_ids.append(rel_dict)
+                                                        elif relationType in ["iscitedby", "isreferencedby"]:
+                                                            rel_dict = {"rel_type": "iscitedby", "object_id": norm_object_id}
+                                                            valid_target_ids.append(rel_dict)
+
+                                unique_dicts = [dict(t) for t in {tuple(sorted(d.items())) for d in valid_target_ids}]
+                                for rel_type_dict in unique_dicts:
+                                    citation = dict()
+                                    if rel_type_dict["rel_type"] == "cites":
+                                        citation["citing"] = norm_subject_id
+                                        citation["cited"] = rel_type_dict["object_id"]
+                                    elif rel_type_dict["rel_type"] == "iscitedby":
+                                        citation["citing"] = rel_type_dict["object_id"]
+                                        citation["cited"] = norm_subject_id
+                                    index_citations_to_csv.append(citation)
+                except Exception as e:
+                    print("[PROCESS ERROR] during object processing. Entity preview:")
+                    try:
+                        print(json.dumps(entity, ensure_ascii=False)[:500] + "...")
+                    except Exception:
+                        print(str(entity)[:500] + "...")
+                    print(f"Details: {e}")
+                    continue
         save_files(data_object, index_citations_to_csv, False)
+    return True
 
 def pathoo(path:str) -> None:
     if not os.path.exists(os.path.dirname(path)):
         os.makedirs(os.path.dirname(path))
 
-def read_json(json_path, bad_dir: str = None, preview_chars: int = 100):
+def _first_lines(json_path: str, n: int = 2) -> list[str]:
+    """The first ``n`` non-blank lines of a file, stripped, reading nothing past them."""
+    lines = []
+    with open(json_path, 'r', encoding='utf-8') as json_object:
+        for line in json_object:
+            line = line.strip()
+            if line:
+                lines.append(line)
+                if len(lines) == n:
+                    break
+    return lines
+
+
+def _is_json_object(line: str) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except JSONDecodeError:
+        return False
+
+
+def _is_json_lines(first_lines: list[str]) -> bool:
+    """Tells a JSON Lines file from a single JSON document by its first lines: the first line
+    of a JSON Lines file holds a whole record. A broken first record is told apart from the
+    opening of a document, such as ``{"data": [``, by the whole record on the next line."""
+    if _is_json_object(first_lines[0]):
+        return True
+    return (
+        len(first_lines) > 1
+        and first_lines[0].startswith('{')
+        and not first_lines[0].endswith(('{', '['))
+        and _is_json_object(first_lines[1])
+    )
+
+
+def iter_json_lines(json_path: str, bad_dir: str = None) -> Iterator[dict]:
+    """Lazily yields the records of a JSON Lines file, parsing one line at a time.
+
+    The lines that are not a JSON object are reported and copied to
+    ``<bad_dir>/<file name>.bad.jsonl``, while the other records of the file are processed.
+    """
+    bad_file = None
     try:
         with open(json_path, 'r', encoding='utf-8') as json_object:
-            content = json_object.read()
-
-        try:
-            # try JSONL first
-            print(f"JSON/JSONL file: {json_path}")
-            lines = [l.strip() for l in content.splitlines() if l.strip()]
-            if len(lines) > 0:
-                json.loads(lines[0])  # if first line parses as complete JSON, it's JSONL
-                data = [json.loads(line) for line in lines]
-                return data
-            else:
-                return None
-        except JSONDecodeError:
-            pass  # not JSONL, fall through to single JSON parsing
+            for line_number, line in enumerate(json_object, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError(f"expected a JSON object, found {type(record).__name__}")
+                except ValueError as e:
+                    print(f"[JSON ERROR] file={json_path} line={line_number}: {e}")
+                    if bad_dir:
+                        if bad_file is None:
+                            os.makedirs(bad_dir, exist_ok=True)
+                            bad_fp = os.path.join(bad_dir, Path(json_path).name + '.bad.jsonl')
+                            bad_file = open(bad_fp, 'w', encoding='utf-8')
+                        bad_file.write(line if line.endswith('\n') else line + '\n')
+                    continue
+                yield record
+    finally:
+        if bad_file is not None:
+            bad_file.close()
+
+
+def read_json(json_path, bad_dir: str = None, preview_chars: int = 100) -> Iterable[dict] | None:
+    """The records of a DataCite file, or None if it is empty or not valid JSON.
+
+    JSON Lines files are streamed by ``iter_json_lines``, which sets their malformed lines
+    aside; a single JSON document that cannot be parsed is moved to ``bad_dir`` as a whole.
+    """
+    try:
+        print(f"JSON/JSONL file: {json_path}")
+        first_lines = _first_lines(json_path)
+        if not first_lines:
+            return None
+        if _is_json_lines(first_lines):
+            return iter_json_lines(json_path, bad_dir)
 
         # single JSON object
-        chunk = json.loads(content)
+        with open(json_path, 'r', encoding='utf-8') as json_object:
+            chunk = json.load(json_object)
         data = chunk.get('data')
         if isinstance(data, list):
             return data
@@ -565,6 +625,9 @@ if __name__ == '__main__':
                             help='Disable Wikidata API validation for publisher ids')
     arg_parser.add_argument('--no-crossref-api', dest='no_crossref_api', action='store_true', required=False,
                             help='Disable Crossref API validation for publisher ids')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
 
     args = arg_parser.parse_args()
     config = args.config
@@ -601,5 +664,9 @@ if __name__ == '__main__':
         print('[Warning] SQLite/JSON storage requires single-threaded mode. Setting max_workers=1')
         max_workers = 1
 
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
+
     preprocess(datacite_json_dir=datacite_json_dir, publishers_filepath=publishers_filepath, orcid_doi_filepath=orcid_doi_filepath, csv_dir=csv_dir, wanted_doi_filepath=wanted_doi_filepath, cache=cache, verbose=verbose, storage_path=storage_path, testing=testing,
                redis_storage_manager=use_redis_storage_manager, max_workers=max_workers, use_orcid_api=use_orcid_api, use_ror_api=use_ror_api, use_viaf_api=use_viaf_api, use_wikidata_api=use_wikidata_api)
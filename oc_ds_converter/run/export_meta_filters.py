@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+from argparse import ArgumentParser
+
+from oc_ds_converter.datasource.meta_filter import (
+    DEFAULT_ERROR_RATE,
+    META_SERVICES,
+    export_meta_filter,
+    meta_filter_path,
+)
+from oc_ds_converter.datasource.redis import RedisDataSource
+from oc_ds_converter.lib.console import console
+from oc_ds_converter.lib.file_manager import normalize_path
+
+
+def export_meta_filters(output_dir: str, error_rate: float = DEFAULT_ERROR_RATE,
+                        config_filepath: str = 'config.ini') -> dict[str, int]:
+    os.makedirs(output_dir, exist_ok=True)
+    exported = dict()
+    for service in META_SERVICES:
+        datasource = RedisDataSource(service, config_filepath)
+        exported[service] = export_meta_filter(datasource, meta_filter_path(output_dir, service),
+                                               error_rate=error_rate)
+    return exported
+
+
+if __name__ == '__main__':  # pragma: no cover
+    arg_parser = ArgumentParser('export_meta_filters.py',
+                                description='Export the ids of the Meta Redis databases (DB-META-BR and DB-META-RA) '
+                                            'to Bloom filter files. The converters started with --meta-filters '
+                                            'pointing to the output directory look up in Redis only the ids the '
+                                            'filters may contain. Export them again after Meta is updated.')
+    arg_parser.add_argument('-o', '--output', dest='output_dir', required=True,
+                            help='Directory where the filter files are written')
+    arg_parser.add_argument('-e', '--error-rate', dest='error_rate', required=False, default=DEFAULT_ERROR_RATE,
+                            type=float, help=f'False positive rate of the filters (default: {DEFAULT_ERROR_RATE})')
+    arg_parser.add_argument('--redis-config', dest='redis_config', required=False, default='config.ini',
+                            help='Path of the Redis configuration file (default: the one of the package)')
+    args = arg_parser.parse_args()
+    for service, count in export_meta_filters(normalize_path(args.output_dir), args.error_rate,
+                                              args.redis_config).items():
+        console.print(f'{service}: {count} ids exported')
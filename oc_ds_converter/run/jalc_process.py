@@ -21,8 +21,10 @@ from typing import Callable
 import yaml
 from filelock import BaseFileLock, FileLock
 
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.datasource.orcid_index import (
     OrcidIndexRedis,
+    is_orcid_index_db,
     load_orcid_index_to_redis,
 )
 from oc_ds_converter.jalc.jalc_processing import JalcProcessing
@@ -30,16 +32,21 @@ from oc_ds_converter.lib.console import advance_progress, console, create_progre
 from oc_ds_converter.lib.file_manager import normalize_path, pathoo
 from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
 from oc_ds_converter.lib.process_utils import (
+    CitedWorkWriter,
     cleanup_storage,
     create_output_dirs,
     delete_cache_files,
     get_storage_manager,
     init_process_cache,
     is_file_in_cache,
+    iter_cited_work,
     mark_file_completed,
     normalize_cache_path,
     write_csv_output,
 )
+from oc_ds_converter.oc_idmanager.base import MEMO_CACHE_SIZE, enable_memoization
+from oc_ds_converter.oc_idmanager.response_cache import enable_response_cache
+from oc_ds_converter.oc_idmanager.support import enable_rate_limits
 
 
 def _count_json_files(
@@ -78,6 +85,7 @@ def _run_iteration(
     exclude_existing: bool = False,
     storage_path: str | None = None,
     use_redis: bool = False,
+    single_pass: bool = False,
 ) -> None:
     iteration_label = "citing entities" if processing_citing else "cited entities"
     iteration_num = "First" if processing_citing else "Second"
@@ -97,6 +105,7 @@ def _run_iteration(
                     exclude_existing=exclude_existing,
                     storage_path=storage_path,
                     use_redis=use_redis,
+                    single_pass=single_pass,
                 )
                 advance_progress(progress, task, processed=was_processed)
     else:
@@ -143,6 +152,7 @@ def _run_iteration(
                         exclude_existing=exclude_existing,
                         storage_path=storage_path,
                         use_redis=use_redis,
+                        single_pass=single_pass,
                         entity_counter=entity_counter,
                         counter_lock=counter_lock,
                     )
@@ -184,9 +194,32 @@ def _extract_redis_ids_and_update(
                     all_ra.extend(ent_all_ra)
 
     processor.prefetch_doi_orcid_index(all_dois_for_orcid_index)
+    citing_ids = [
+        norm for doi in all_dois_for_orcid_index
+        if (norm := processor.doi_m.normalise(doi, include_prefix=True))
+    ] if processing_citing else []
+    processor.prefetch_storage_values(citing_ids + all_br + all_ra)
     redis_validity_values_br = processor.get_redis_validity_list(all_br, "br")
     redis_validity_values_ra = processor.get_redis_validity_list(all_ra, "ra")
     processor.update_redis_values(redis_validity_values_br, redis_validity_values_ra)
+    if processor.exclude_existing and processing_citing:
+        processor.prefetch_meta_existence(citing_ids)
+    if not processing_citing:
+        processor.prevalidate_dois(all_br)
+
+
+def _reduce_to_cited_work(entity_list: list[dict]) -> list[dict]:
+    """Keep only what ``_process_cited_entities`` reads: the DOI and the cited entities with a
+    DOI. Entities without citations become empty placeholders so progress counts still match."""
+    reduced: list[dict] = []
+    for entity in entity_list:
+        d = entity.get("data") if entity else None
+        cit_list = [x for x in d.get("citation_list", []) if x.get("doi")] if d else []
+        if d and d.get("doi") and cit_list:
+            reduced.append({"data": {"doi": d["doi"], "citation_list": cit_list}})
+        else:
+            reduced.append({})
+    return reduced
 
 
 def _save_output_files(
@@ -230,8 +263,8 @@ def _process_citing_entities(
                 continue
             norm_source_id = processor.doi_m.normalise(d['doi'], include_prefix=True)
 
-            if norm_source_id and not processor.doi_m.storage_manager.get_value(norm_source_id):
-                if processor.exclude_existing and processor.BR_redis.exists_as_set(norm_source_id):
+            if norm_source_id and not processor.stored_validity(norm_source_id):
+                if processor.exclude_existing and processor.exists_in_meta(norm_source_id):
                     processor.tmp_doi_m.storage_manager.set_value(norm_source_id, True)
                 else:
                     processor.tmp_doi_m.storage_manager.set_value(norm_source_id, True)
@@ -284,7 +317,7 @@ def _process_cited_entities(
                 if stored_validity is None:
                     if norm_id in processor.to_validated_id_list({"id": norm_id, "schema": "doi"}):
                         valid_target_ids.append(norm_id)
-                        if processor.exclude_existing and processor.BR_redis.exists_as_set(norm_id):
+                        if processor.exclude_existing and processor.exists_in_meta(norm_id):
                             continue
                         target_tab_data = processor.csv_creator(cited_entity)
                         if target_tab_data:
@@ -312,19 +345,23 @@ def preprocess(
     max_workers: int = 1,
     exclude_existing: bool = False,
     storage_path: str | None = None,
+    single_pass: bool = False,
 ) -> None:
     preprocessed_citations_dir = create_output_dirs(csv_dir)
 
-    if use_redis:
+    orcid_index_for_processor: str | None
+    if is_orcid_index_db(orcid_doi_filepath):
+        console.print('[cyan]Using the compiled DOI-ORCID index file[/cyan]')
+        orcid_index_for_processor = orcid_doi_filepath
+    elif use_redis:
         orcid_index_redis = OrcidIndexRedis(testing=testing)
         if orcid_doi_filepath:
             console.print('[cyan]Updating DOI-ORCID index in Redis...[/cyan]')
-            orcid_index_redis.clear()
-            load_orcid_index_to_redis(orcid_doi_filepath, orcid_index_redis)
-            console.print('[green]DOI-ORCID index updated in Redis[/green]')
+            loaded = load_orcid_index_to_redis(orcid_doi_filepath, orcid_index_redis)
+            console.print(f'[green]DOI-ORCID index updated in Redis ({loaded} new or changed files)[/green]')
         else:
             console.print('[cyan]Using existing DOI-ORCID index from Redis[/cyan]')
-        orcid_index_for_processor: str | None = None
+        orcid_index_for_processor = None
     else:
         orcid_index_for_processor = orcid_doi_filepath
 
@@ -340,10 +377,10 @@ def preprocess(
 
     _run_iteration(*iteration_args, processing_citing=True, max_workers=max_workers,
                    exclude_existing=exclude_existing, storage_path=storage_path,
-                   use_redis=use_redis)
+                   use_redis=use_redis, single_pass=single_pass)
     _run_iteration(*iteration_args, processing_citing=False, max_workers=max_workers,
                    exclude_existing=exclude_existing, storage_path=storage_path,
-                   use_redis=use_redis)
+                   use_redis=use_redis, single_pass=single_pass)
 
     cache_path = cache if cache else os.path.join(os.getcwd(), "cache.json")
     delete_cache_files(cache_path)
@@ -361,6 +398,7 @@ def get_citations_and_metadata(
     exclude_existing: bool = False,
     storage_path: str | None = None,
     use_redis: bool = False,
+    single_pass: bool = False,
     entity_counter: ValueProxy[int] | None = None,
     counter_lock: AbstractContextManager[bool] | None = None,
 ) -> bool:
@@ -382,13 +420,19 @@ def get_citations_and_metadata(
         use_redis_orcid_index=use_redis,
     )
 
-    zip_f = zipfile.ZipFile(zip_file)
-    source_data = [x for x in zip_f.namelist() if "doiList" not in x and not x.endswith("/")]
-    source_dict: list[dict] = []
-    for json_file in source_data:
-        f = zip_f.open(json_file, 'r')
-        my_dict = json.load(f)
-        source_dict.append(my_dict)
+    # In single-pass mode the first iteration spills the citations of each ZIP file, so that
+    # the second one does not need to decompress and parse the JSON files again
+    cited_work = iter_cited_work(cache_path, filename) if single_pass and not processing_citing else None
+    if cited_work is not None:
+        source_dict = list(cited_work)
+    else:
+        zip_f = zipfile.ZipFile(zip_file)
+        source_data = [x for x in zip_f.namelist() if "doiList" not in x and not x.endswith("/")]
+        source_dict = []
+        for json_file in source_data:
+            f = zip_f.open(json_file, 'r')
+            my_dict = json.load(f)
+            source_dict.append(my_dict)
 
     filename_without_ext = filename.replace('.zip', '')
     filepath = os.path.join(csv_dir, f'{filename_without_ext}.csv')
@@ -408,6 +452,10 @@ def get_citations_and_metadata(
                 entity_counter.value += 1
 
     if processing_citing:
+        if single_pass:
+            work_writer = CitedWorkWriter(cache_path, filename)
+            work_writer.write(_reduce_to_cited_work(source_dict))
+            work_writer.commit()
         citing_entity_rows = _process_citing_entities(jalc_csv, source_dict, increment_counter)
         _save_output_files(
             citing_entity_rows, [], metadata_output_base, citation_links_output_base,
@@ -437,7 +485,8 @@ if __name__ == '__main__':  # pragma: no cover
     arg_parser.add_argument('-out', '--output', dest='csv_dir', required=required,
                             help='Directory where CSV will be stored')
     arg_parser.add_argument('-o', '--orcid', dest='orcid_doi_filepath', required=False,
-                            help='DOI-ORCID index filepath, to enrich data')
+                            help='DOI-ORCID index filepath, to enrich data: a directory of CSV files or '
+                                 'an index file compiled by build_orcid_index.py')
     arg_parser.add_argument('-ca', '--cache', dest='cache', required=False,
                             help='Path to a JSON file for caching processed files. Tracks which files have been '
                                  'processed to allow resuming. Deleted at the end of successful processing.')
@@ -450,10 +499,33 @@ if __name__ == '__main__':  # pragma: no cover
                             help='Exclude entities that already exist in Meta from the output CSV')
     arg_parser.add_argument('-s', '--storage_path', dest='storage_path', required=False,
                             help='Path for ID validation storage. Use .db extension for SQLite or .json for '
-                                 'in-memory JSON storage. If not specified, uses in-memory storage.')
+                                 'in-memory JSON storage. If not specified, uses in-memory storage. SQLite storage '
+                                 'can be shared by multiple workers.')
     arg_parser.add_argument('-r', '--use-redis', dest='use_redis', action='store_true', required=False,
-                            help='Use Redis for DOI-ORCID index and publishers lookup. Required for multiprocessing. '
+                            help='Use Redis for DOI-ORCID index and publishers lookup. Multiprocessing requires either '
+                                 'this option or a .db storage path. '
                                  'By default, in-memory storage is used.')
+    arg_parser.add_argument('--http-cache', dest='http_cache', required=False,
+                            help='Path of a SQLite database where the responses of the identifier APIs are '
+                                 'cached, so that later runs and other converters reuse them.')
+    arg_parser.add_argument('--memoize-ids', dest='memoize_ids', nargs='?', const=MEMO_CACHE_SIZE, type=int,
+                            required=False,
+                            help='Memoize the normalisation and syntax checks of DOIs, ORCIDs, ISSNs and ISBNs, '
+                                 f'keeping the given number of results per check (default: {MEMO_CACHE_SIZE}).')
+    arg_parser.add_argument('--rate-limits', dest='rate_limits', required=False,
+                            help='Requests per second allowed to the identifier APIs, as comma separated '
+                                 'host=rate[/burst] pairs overriding the defaults (e.g. doi.org=20/20,'
+                                 'pub.orcid.org=24/40), where host=off lifts a limit and off alone lifts them all.')
+    arg_parser.add_argument('--rate-limit-dir', dest='rate_limit_dir', required=False,
+                            help='Directory of the state shared by the processes drawing from the same rate limits '
+                                 '(default: a directory of the current user in the system temporary directory).')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
+    arg_parser.add_argument('--single-pass', dest='single_pass', action='store_true', required=False,
+                            help='Parse each input file only once: the first iteration stores the citations '
+                                 'of each file next to the cache, and the second iteration reads them from '
+                                 'there instead of the original files.')
     args = arg_parser.parse_args()
     config = args.config
     settings = None
@@ -474,13 +546,28 @@ if __name__ == '__main__':  # pragma: no cover
     storage_path = settings.get('storage_path', args.storage_path) if settings else args.storage_path
     storage_path = normalize_path(storage_path) if storage_path else None
     use_redis = settings.get('use_redis', args.use_redis) if settings else args.use_redis
-
-    if storage_path and max_workers > 1:
-        console.print('[yellow]Warning: SQLite/JSON storage requires single-threaded mode. Setting max_workers=1[/yellow]')
+    single_pass = settings.get('single_pass', args.single_pass) if settings else args.single_pass
+    http_cache = settings.get('http_cache', args.http_cache) if settings else args.http_cache
+    if http_cache:
+        enable_response_cache(normalize_path(http_cache))
+    memoize_ids = settings.get('memoize_ids', args.memoize_ids) if settings else args.memoize_ids
+    if memoize_ids:
+        enable_memoization(memoize_ids)
+    rate_limits = settings.get('rate_limits', args.rate_limits) if settings else args.rate_limits
+    rate_limit_dir = settings.get('rate_limit_dir', args.rate_limit_dir) if settings else args.rate_limit_dir
+    if rate_limits or rate_limit_dir:
+        enable_rate_limits(rate_limits, normalize_path(rate_limit_dir) if rate_limit_dir else None)
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
+
+    # InMemory storage is not shared across processes, SQLite storage is
+    if storage_path and not storage_path.endswith('.db') and max_workers > 1:
+        console.print('[yellow]Warning: JSON storage requires single-threaded mode. Setting max_workers=1[/yellow]')
         max_workers = 1
 
-    if max_workers > 1 and not use_redis:
-        console.print('[yellow]Warning: Multiprocessing requires Redis. Setting max_workers=1[/yellow]')
+    if max_workers > 1 and not use_redis and not storage_path:
+        console.print('[yellow]Warning: Multiprocessing requires Redis or SQLite storage. Setting max_workers=1[/yellow]')
         max_workers = 1
 
     preprocess(
@@ -493,4 +580,5 @@ if __name__ == '__main__':  # pragma: no cover
         max_workers=max_workers,
         exclude_existing=exclude_existing,
         storage_path=storage_path,
+        single_pass=single_pass,
     )
@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: ISC
 
 import csv
-import gzip
 import json
 import os
 import os.path
@@ -20,8 +19,9 @@ from filelock import FileLock
 from multiprocessing import get_context
 from tqdm import tqdm
 
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.lib.file_manager import normalize_path
-from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
+from oc_ds_converter.lib.jsonmanager import GzipJsonLines, batched, get_all_files_by_type
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.sqlite_manager import SqliteStorageManager
@@ -112,6 +112,8 @@ def preprocess(
     if cache:
         if os.path.exists(cache):
             os.remove(cache)
+        if os.path.exists(resume_index_path(cache)):
+            os.remove(resume_index_path(cache))
         lock_file = cache + ".lock"
         if os.path.exists(lock_file):
             os.remove(lock_file)
@@ -122,6 +124,40 @@ def preprocess(
         storage_manager.delete_storage()
 
 
+def resume_index_path(cache: str) -> str:
+    return cache + ".offsets"
+
+
+def _file_version(filename: str) -> list[int]:
+    stat = os.stat(filename)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_resume_offset(cache: str, lock: FileLock, filename: str, part_number: int) -> int | None:
+    """The position in the decompressed file after the last line of the part ``part_number``
+    of ``filename``, if it was recorded for the current version of the file."""
+    with lock:
+        if not os.path.exists(resume_index_path(cache)):
+            return None
+        with open(resume_index_path(cache), 'r', encoding='utf-8') as f:
+            resume_index = json.load(f)
+    entry = resume_index.get(filename)
+    if entry and entry["part"] == part_number and entry["version"] == _file_version(filename):
+        return entry["offset"]
+    return None
+
+
+def store_resume_offset(cache: str, lock: FileLock, filename: str, part_number: int, offset: int) -> None:
+    with lock:
+        resume_index = dict()
+        if os.path.exists(resume_index_path(cache)):
+            with open(resume_index_path(cache), 'r', encoding='utf-8') as f:
+                resume_index = json.load(f)
+        resume_index[filename] = {"part": part_number, "offset": offset, "version": _file_version(filename)}
+        with open(resume_index_path(cache), 'w', encoding='utf-8') as f:
+            json.dump(resume_index, f)
+
+
 def get_citations_and_metadata(tar: str, preprocessed_citations_dir: str, csv_dir: str, filename: str, orcid_index: str | None, publishers_filepath_openaire: str | None, testing: bool, cache: str | None, target: int = 50000, exclude_existing: bool = False, storage_path: str | None = None):
 
     if cache:
@@ -183,10 +219,17 @@ def get_citations_and_metadata(tar: str, preprocessed_citations_dir: str, csv_di
 
     skip_rows = target * last_part_processed
 
-    f = gzip.open(filename, 'rb')
-    source_data = f.readlines()
-    pbar = tqdm(total=len(source_data))
-    f.close()
+    # When resuming, jump to the end of the last completed part if its position was recorded,
+    # otherwise skip its rows
+    resume_offset = load_resume_offset(cache, lock, filename, last_part_processed) if last_part_processed else None
+    if resume_offset is not None:
+        reader = GzipJsonLines(filename, offset=resume_offset)
+    else:
+        reader = GzipJsonLines(filename, skip_lines=skip_rows)
+    source_path = filename
+    # Only the <target> records of the current part are held in memory
+    parts = batched(reader, target)
+    pbar = tqdm()
     filename = filename.name if isinstance(filename, TarInfo) else filename
     filename_without_ext = filename.replace('.json', '').replace('.tar', '').replace('.gz', '')
     filepath_ne = os.path.join(csv_dir, f'{os.path.basename(filename_without_ext)}')
@@ -198,16 +241,15 @@ def get_citations_and_metadata(tar: str, preprocessed_citations_dir: str, csv_di
     def get_all_redis_ids_and_save_updates(sli_da):
         all_br = []
         all_ra = []
-        for entity in sli_da:
+        for d in sli_da:
 
             # start check: if line is processable
-            if entity:
-                d = json.loads(entity.decode('utf-8'))
+            if d:
                 if d.get("relationship"):
                     if d.get("relationship").get("name") == "Cites":
                         # end check: if line is processable
 
-                        ent_all_br, ent_all_ra = openaire_csv.extract_all_ids(json.loads(entity))
+                        ent_all_br, ent_all_ra = openaire_csv.extract_all_ids(d)
                         all_br.extend(ent_all_br)
                         all_ra.extend(ent_all_ra)
 
@@ -237,6 +279,8 @@ def get_citations_and_metadata(tar: str, preprocessed_citations_dir: str, csv_di
         openaire_csv.memory_to_storage()
 
         task_done(nf, is_last=is_last_sf)
+        if not is_last_sf:
+            store_resume_offset(cache, lock, source_path, nf, part_end_offset)
 
         return ent_list, citation_list
 
@@ -287,132 +331,117 @@ def get_citations_and_metadata(tar: str, preprocessed_citations_dir: str, csv_di
             print(e)
 
 
-    start = skip_rows
-    cnt = skip_rows
-    end = start + target
+    for part_number, source_data_slice in enumerate(parts):
 
-    if len(source_data[start:]) > target:
-        source_data_slice = source_data[start: end]
-    else:
-        source_data_slice = source_data[start:]
+        # the previous part is complete
+        if part_number:
+            last_part_processed += 1
+            data, index_citations_to_csv = save_files(data, index_citations_to_csv, last_part_processed)
 
-    get_all_redis_ids_and_save_updates(source_data_slice)
+        part_end_offset = reader.offset
 
-    for entity in source_data:
+        # update redis validated id list
+        get_all_redis_ids_and_save_updates(source_data_slice)
 
-        # in case the current entity is the <target>nth entity
-        if cnt == end:
-            start = cnt
-            end = start + target
-            if len(source_data[start:]) > target:
-                source_data_slice = source_data[start: end]
-            else:
-                source_data_slice = source_data[start:]
+        for d in source_data_slice:
 
-            # update redis validated id list + save citation and meta file
-            get_all_redis_ids_and_save_updates(source_data_slice)
-            last_part_processed += 1
-            data, index_citations_to_csv = save_files(data, index_citations_to_csv, last_part_processed)
+            # real entity process
+            if d:
+                if d.get("relationship"):
+                    if d.get("relationship").get("name") == "Cites":
 
-        # real entity process
-        if entity:
-            d = json.loads(entity.decode('utf-8'))
-            if d.get("relationship"):
-                if d.get("relationship").get("name") == "Cites":
-
-                    norm_source_ids = []
-                    norm_target_ids = []
-
-                    any_source_id = ""
-                    any_target_id = ""
-
-                    source_entity = d.get("source")
-                    if source_entity:
-                        norm_source_ids = openaire_csv.get_norm_ids(source_entity['identifier'])
-                        if norm_source_ids:
-                            for e, nsi in enumerate(norm_source_ids):
-                                stored_validity = openaire_csv.validated_as(nsi)
-                                norm_source_ids[e]["valid"] = stored_validity
-
-
-                    target_entity = d.get("target")
-                    if target_entity:
-                        norm_target_ids = openaire_csv.get_norm_ids(target_entity['identifier'])
-                        if norm_target_ids:
-                            for i, nti in enumerate(norm_target_ids):
-                                stored_validity_t = openaire_csv.validated_as(nti)
-                                norm_target_ids[i]["valid"] = stored_validity_t
-
-                    # check that there is a citation we can handle (i.e.: expressed with ids we actually manage)
-                    if norm_source_ids and norm_target_ids:
-
-                        source_entity_upd_ids = {k:v for k,v in source_entity.items() if k != "identifier"}
-                        source_valid_ids = [x for x in norm_source_ids if x["valid"] is True]
-                        source_invalid_ids = [x for x in norm_source_ids if x["valid"] is False]
-                        source_to_be_val_ids = [x for x in norm_source_ids if x["valid"] is None]
-                        source_identifier = {}
-                        source_identifier["valid"] = source_valid_ids
-                        source_identifier["not_valid"] = source_invalid_ids
-                        source_identifier["to_be_val"] = source_to_be_val_ids
-                        source_entity_upd_ids["identifier"] = source_identifier
-                        #source_entity_upd_ids["redis_validity_lists"] = [redis_validity_values_br, redis_validity_values_ra]
-
-                        target_entity_upd_ids = {k:v for k,v in target_entity.items() if k != "identifier"}
-                        target_valid_ids = [x for x in norm_target_ids if x["valid"] is True]
-                        target_invalid_ids = [x for x in norm_target_ids if x["valid"] is False]
-                        target_to_be_val_ids = [x for x in norm_target_ids if x["valid"] is None]
-                        target_identifier = {}
-                        target_identifier["valid"] = target_valid_ids
-                        target_identifier["not_valid"] = target_invalid_ids
-                        target_identifier["to_be_val"] = target_to_be_val_ids
-                        target_entity_upd_ids["identifier"] = target_identifier
-                        #target_entity_upd_ids["redis_validity_lists"] = [redis_validity_values_br, redis_validity_values_ra]
-
-                        # creation of a new row in meta table because there are new ids to be validated.
-                        # "any_source_id" will be chosen among the valid source entity ids, if any
-                        if source_identifier["to_be_val"]:
-                            source_tab_data = openaire_csv.csv_creator(source_entity_upd_ids) #valid_citation_ids_s --> evitare rivalidazione ?
-                            if source_tab_data:
-                                processed_source_ids = source_tab_data["id"].split(" ")
-                                all_citing_valid = processed_source_ids
-                                if all_citing_valid: # It meanst that there is at least one valid id for the citing entity
-                                    any_source_id = all_citing_valid[0]
-                                    if not (openaire_csv.exclude_existing and openaire_csv.BR_redis.exists_as_set(any_source_id)):
-                                        data.append(source_tab_data) # Otherwise the row should not be included in meta tables
-
-
-                        # skip creation of a new row in meta table because there is no new id to be validated
-                        # "any_source_id" will be chosen among the valid source entity ids, if any
-                        elif source_identifier["valid"]:
-                            all_citing_valid = source_identifier["valid"]
-                            any_source_id = all_citing_valid[0]["identifier"]
-
-                        # creation of a new row in meta table because there are new ids to be validated.
-                        # "any_target_id" will be chosen among the valid target entity ids, if any
-                        if target_identifier["to_be_val"]:
-                            target_tab_data = openaire_csv.csv_creator(target_entity_upd_ids)
-                            if target_tab_data:
-                                processed_target_ids = target_tab_data["id"].split(" ")
-                                all_cited_valid = processed_target_ids
-                                if all_cited_valid:
-                                    any_target_id = all_cited_valid[0]
-                                    if not (openaire_csv.exclude_existing and openaire_csv.BR_redis.exists_as_set(any_target_id)):
-                                        data.append(target_tab_data) # otherwise the row should not be included in meta tables
-
-                        # skip creation of a new row in meta table because there is no new id to be validated
-                        # "any_target_id" will be chosen among the valid source entity ids, if any
-                        elif target_identifier["valid"]:
-                            all_cited_valid = target_identifier["valid"]
-                            any_target_id = all_cited_valid[0]["identifier"]
-
-
-                    if any_source_id and any_target_id:
-                        citation = dict()
-                        citation["citing"] = any_source_id
-                        citation["referenced"] = any_target_id
-                        index_citations_to_csv.append(citation)
-        pbar.update()
-        cnt += 1
+                        norm_source_ids = []
+                        norm_target_ids = []
+
+                        any_source_id = ""
+                        any_target_id = ""
+
+                        source_entity = d.get("source")
+                        if source_entity:
+                            norm_source_ids = openaire_csv.get_norm_ids(source_entity['identifier'])
+                            if norm_source_ids:
+                                for e, nsi in enumerate(norm_source_ids):
+                                    stored_validity = openaire_csv.validated_as(nsi)
+                                    norm_source_ids[e]["valid"] = stored_validity
+
+
+                        target_entity = d.get("target")
+                        if target_entity:
+                            norm_target_ids = openaire_csv.get_norm_ids(target_entity['identifier'])
+                            if norm_target_ids:
+                                for i, nti in enumerate(norm_target_ids):
+                                    stored_validity_t = openaire_csv.validated_as(nti)
+                                    norm_target_ids[i]["valid"] = stored_validity_t
+
+                        # check that there is a citation we can handle (i.e.: expressed with ids we actually manage)
+                        if norm_source_ids and norm_target_ids:
+
+                            source_entity_upd_ids = {k:v for k,v in source_entity.items() if k != "identifier"}
+                            source_valid_ids = [x for x in norm_source_ids if x["valid"] is True]
+                            source_invalid_ids = [x for x in norm_source_ids if x["valid"] is False]
+                            source_to_be_val_ids = [x for x in norm_source_ids if x["valid"] is None]
+                            source_identifier = {}
+                            source_identifier["valid"] = source_valid_ids
+                            source_identifier["not_valid"] = source_invalid_ids
+                            source_identifier["to_be_val"] = source_to_be_val_ids
+                            source_entity_upd_ids["identifier"] = source_identifier
+                            #source_entity_upd_ids["redis_validity_lists"] = [redis_validity_values_br, redis_validity_values_ra]
+
+                            target_entity_upd_ids = {k:v for k,v in target_entity.items() if k != "identifier"}
+                            target_valid_ids = [x for x in norm_target_ids if x["valid"] is True]
+                            target_invalid_ids = [x for x in norm_target_ids if x["valid"] is False]
+                            target_to_be_val_ids = [x for x in norm_target_ids if x["valid"] is None]
+                            target_identifier = {}
+                            target_identifier["valid"] = target_valid_ids
+                            target_identifier["not_valid"] = target_invalid_ids
+                            target_identifier["to_be_val"] = target_to_be_val_ids
+                            target_entity_upd_ids["identifier"] = target_identifier
+                            #target_entity_upd_ids["redis_validity_lists"] = [redis_validity_values_br, redis_validity_values_ra]
+
+                            # creation of a new row in meta table because there are new ids to be validated.
+                            # "any_source_id" will be chosen among the valid source entity ids, if any
+                            if source_identifier["to_be_val"]:
+                                source_tab_data = openaire_csv.csv_creator(source_entity_upd_ids) #valid_citation_ids_s --> evitare rivalidazione ?
+                                if source_tab_data:
+                                    processed_source_ids = source_tab_data["id"].split(" ")
+                                    all_citing_valid = processed_source_ids
+                                    if all_citing_valid: # It meanst that there is at least one valid id for the citing entity
+                                        any_source_id = all_citing_valid[0]
+                                        if not (openaire_csv.exclude_existing and openaire_csv.exists_in_meta(any_source_id)):
+                                            data.append(source_tab_data) # Otherwise the row should not be included in meta tables
+
+
+                            # skip creation of a new row in meta table because there is no new id to be validated
+                            # "any_source_id" will be chosen among the valid source entity ids, if any
+                            elif source_identifier["valid"]:
+                                all_citing_valid = source_identifier["valid"]
+                                any_source_id = all_citing_valid[0]["identifier"]
+
+                            # creation of a new row in meta table because there are new ids to be validated.
+                            # "any_target_id" will be chosen among the valid target entity ids, if any
+                            if target_identifier["to_be_val"]:
+                                target_tab_data = openaire_csv.csv_creator(target_entity_upd_ids)
+                                if target_tab_data:
+                                    processed_target_ids = target_tab_data["id"].split(" ")
+                                    all_cited_valid = processed_target_ids
+                                    if all_cited_valid:
+                                        any_target_id = all_cited_valid[0]
+                                        if not (openaire_csv.exclude_existing and openaire_csv.exists_in_meta(any_target_id)):
+                                            data.append(target_tab_data) # otherwise the row should not be included in meta tables
+
+                            # skip creation of a new row in meta table because there is no new id to be validated
+                            # "any_target_id" will be chosen among the valid source entity ids, if any
+                            elif target_identifier["valid"]:
+                                all_cited_valid = target_identifier["valid"]
+                                any_target_id = all_cited_valid[0]["identifier"]
+
+
+                        if any_source_id and any_target_id:
+                            citation = dict()
+                            citation["citing"] = any_source_id
+                            citation["referenced"] = any_target_id
+                            index_citations_to_csv.append(citation)
+            pbar.update()
     last_part_processed += 1
     data, index_citations_to_csv = save_files(data, index_citations_to_csv, last_part_processed, is_last_sf=True)
     pbar.close()
@@ -450,6 +479,9 @@ if __name__ == '__main__':
                             help='Path for ID validation storage. Use .db extension for SQLite or .json for '
                                  'in-memory JSON storage. If not specified, uses Redis (default). '
                                  'Note: SQLite and JSON storage are single-threaded (--max_workers is ignored).')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
     args = arg_parser.parse_args()
     config = args.config
     settings = None
@@ -477,6 +509,10 @@ if __name__ == '__main__':
         print('[Warning] SQLite/JSON storage requires single-threaded mode. Setting max_workers=1')
         max_workers = 1
 
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
+
     preprocess(openaire_json_dir=openaire_json_dir, publishers_filepath=publishers_filepath,
                orcid_doi_filepath=orcid_doi_filepath, csv_dir=csv_dir,
                cache=cache, verbose=verbose, testing=testing, max_workers=max_workers, exclude_existing=exclude_existing,
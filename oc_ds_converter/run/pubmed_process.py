@@ -12,6 +12,7 @@ from os.path import exists
 
 import pandas as pd
 import yaml
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.lib.file_manager import normalize_path
 from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
 from tqdm import tqdm
@@ -94,11 +95,14 @@ def preprocess(pubmed_csv_dir: str, publishers_filepath: str | None, orcid_doi_f
                 chunk.fillna("", inplace=True)
                 df_dict_list = chunk.to_dict("records")
                 filt_values = [d for d in df_dict_list if (d.get("cited_by") or d.get("references"))]
+                if pubmed_csv.exclude_existing:
+                    pmids = [pubmed_csv.pmid_m.normalise(str(item['pmid']), include_prefix=True) for item in filt_values]
+                    pubmed_csv.check_meta_existence([pmid for pmid in pmids if pmid])
 
                 for item in filt_values:
                     if pubmed_csv.exclude_existing:
                         pmid = pubmed_csv.pmid_m.normalise(str(item['pmid']), include_prefix=True)
-                        if pmid and pubmed_csv.BR_redis.exists_as_set(pmid):
+                        if pmid and pubmed_csv.exists_in_meta(pmid):
                             continue
                     tabular_data = pubmed_csv.csv_creator(item)
                     if tabular_data:
@@ -150,6 +154,9 @@ if __name__ == '__main__':
                             help='cache txt filepath')
     arg_parser.add_argument('--exclude-existing', dest='exclude_existing', action='store_true', required=False,
                             help='Exclude entities that already exist in Meta from the output CSV')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
     args = arg_parser.parse_args()
     config = args.config
     settings = None
@@ -170,6 +177,9 @@ if __name__ == '__main__':
     verbose = settings['verbose'] if settings else args.verbose
     testing = settings['testing'] if settings else args.testing
     exclude_existing = settings.get('exclude_existing', False) if settings else args.exclude_existing
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
     print("Data Preprocessing Phase: started")
     preprocess(pubmed_csv_dir=pubmed_csv_dir, publishers_filepath=publishers_filepath,
                journals_filepath=journals_filepath, orcid_doi_filepath=orcid_doi_filepath, csv_dir=csv_dir,
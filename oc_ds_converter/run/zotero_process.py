@@ -16,6 +16,7 @@ import yaml
 from filelock import FileLock
 from tqdm import tqdm
 
+from oc_ds_converter.datasource.meta_filter import enable_meta_filters
 from oc_ds_converter.lib.file_manager import normalize_path
 from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
@@ -168,6 +169,10 @@ def get_citations_and_metadata(file_name, csv_dir: str,
         redis_validity_values_br = zotero_csv.get_redis_validity_list(all_br, "br")
         redis_validity_values_ra = zotero_csv.get_redis_validity_list(all_ra, "ra") # sarà vuoto
         zotero_csv.update_redis_values(redis_validity_values_br, redis_validity_values_ra)
+        if zotero_csv.exclude_existing:
+            source_dois = [entity['DOI'] for entity in sli_da if entity and entity.get('DOI')]
+            zotero_csv.prefetch_meta_existence(
+                [x for x in (zotero_csv.tmp_doi_m.normalise(doi, include_prefix=True) for doi in source_dois) if x])
 
     def save_files(ent_list):
         if ent_list:
@@ -246,7 +251,7 @@ def get_citations_and_metadata(file_name, csv_dir: str,
             if norm_source_doi:
                 # if the id is not in the redis database, it means that it was not processed and that it is not in the csv output tables yet.
                 if not zotero_csv.doi_m.storage_manager.get_value(norm_source_doi):
-                    if zotero_csv.exclude_existing and zotero_csv.BR_redis.exists_as_set(norm_source_doi):
+                    if zotero_csv.exclude_existing and zotero_csv.exists_in_meta(norm_source_doi):
                         zotero_csv.tmp_doi_m.storage_manager.set_value(norm_source_doi, True)
                         continue
                     # add the id as valid to the temporary storage manager (whose values will be transferred to the redis storage manager at the
@@ -312,6 +317,9 @@ if __name__ == '__main__':
     arg_parser.add_argument('-s', '--storage_path', dest='storage_path', required=False,
                             help='Path for ID validation storage. Use .db extension for SQLite or .json for '
                                  'in-memory JSON storage. If not specified, uses Redis (default).')
+    arg_parser.add_argument('--meta-filters', dest='meta_filters', required=False,
+                            help='Directory of the Bloom filters written by export_meta_filters.py: ids the filters '
+                                 'do not contain are treated as absent from Meta without querying Redis.')
     args = arg_parser.parse_args()
     config = args.config
     settings = None
@@ -335,6 +343,10 @@ if __name__ == '__main__':
     storage_path = settings.get('storage_path', args.storage_path) if settings else args.storage_path
     storage_path = normalize_path(storage_path) if storage_path else None
 
+    meta_filters = settings.get('meta_filters', args.meta_filters) if settings else args.meta_filters
+    if meta_filters:
+        enable_meta_filters(normalize_path(meta_filters))
+
     preprocess(zotero_json_dir=zotero_json_dir, publishers_filepath=publishers_filepath, orcid_doi_filepath=orcid_doi_filepath, csv_dir=csv_dir, cache=cache, verbose=verbose, testing=testing,
                max_workers=max_workers, exclude_existing=exclude_existing, storage_path=storage_path)
 
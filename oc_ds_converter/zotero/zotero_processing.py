@@ -13,11 +13,11 @@ import warnings
 from pathlib import Path
 from typing import List, Tuple
 
-from bs4 import BeautifulSoup
-
 from oc_ds_converter.crossref.crossref_processing import CrossrefProcessing
+from oc_ds_converter.datasource.meta_filter import meta_filtered
 from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
 from oc_ds_converter.lib.cleaner import Cleaner
+from oc_ds_converter.lib.markup import strip_markup
 from oc_ds_converter.lib.master_of_regex import ids_inside_square_brackets, pages_separator
 from oc_ds_converter.oc_idmanager import DOIManager, ISBNManager, ISSNManager, ORCIDManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
@@ -110,16 +110,16 @@ class ZoteroProcessing(RaProcessor):
             self.BR_redis = FakeRedisWrapper()
             self.RA_redis = FakeRedisWrapper()
         else:
-            self.BR_redis = RedisDataSource("DB-META-BR")
-            self.RA_redis = RedisDataSource("DB-META-RA")
+            self.BR_redis = meta_filtered(RedisDataSource("DB-META-BR"), "DB-META-BR")
+            self.RA_redis = meta_filtered(RedisDataSource("DB-META-RA"), "DB-META-RA")
 
-        self._redis_values_br = []
-        self._redis_values_ra = []
+        self._redis_values_br = set()
+        self._redis_values_ra = set()
         self.crossref_processor = CrossrefProcessing()
 
     def update_redis_values(self, br, ra):
-        self._redis_values_br = br
-        self._redis_values_ra = ra
+        self._redis_values_br = set(br or [])
+        self._redis_values_ra = set(ra or [])
 
     def to_validated_id_list(self, norm_id_dict):
         """returns a list containing the validated id if it is valid, and an empty list otheriwse.
@@ -179,6 +179,7 @@ class ZoteroProcessing(RaProcessor):
         if kv_in_memory:
             self.storage_manager.set_multi_value(kv_in_memory)
             self.temporary_manager.delete_storage()
+        self._meta_existence = {}
 
     def validated_as(self, id_dict):
         # Check if the validity was already retrieved and thus
@@ -276,8 +277,7 @@ class ZoteroProcessing(RaProcessor):
                 text_title = item['title'][0]
             else:
                 text_title = item['title']
-            soup = BeautifulSoup(text_title, 'html.parser')
-            title_soup = soup.get_text().replace('\n', '')
+            title_soup = strip_markup(text_title).replace('\n', '')
             title = html.unescape(title_soup)
             row['title'] = title
 
@@ -373,12 +373,10 @@ class ZoteroProcessing(RaProcessor):
                 name = self.publishers_mapping[member]['name']
                 name_and_id = f'{name} [crossref:{member}]'
             else:
-                member_dict = next(
-                    ({member: data} for member, data in self.publishers_mapping.items() if prefix in data['prefixes']),
-                    None)
-                if member_dict:
-                    member = list(member_dict.keys())[0]
-                    name_and_id = f"{member_dict[member]['name']} [crossref:{member}]"
+                name_and_member = self.publishers_prefix_index.get(prefix)
+                if name_and_member:
+                    name, member = name_and_member
+                    name_and_id = f"{name} [crossref:{member}]"
                 else:
                     name_and_id = publisher
         else:
@@ -404,8 +402,7 @@ class ZoteroProcessing(RaProcessor):
                     ventit = str(item['container-title'][0]).replace('\n', '')
                 else:
                     ventit = str(item['container-title']).replace('\n', '')
-                ven_soup = BeautifulSoup(ventit, 'html.parser')
-                ventit = html.unescape(ven_soup.get_text())
+                ventit = html.unescape(strip_markup(ventit))
                 ambiguous_brackets = re.search(ids_inside_square_brackets, ventit)
                 if ambiguous_brackets:
                     match = ambiguous_brackets.group(1)
@@ -485,7 +482,7 @@ class ZoteroProcessing(RaProcessor):
             validity = self.RA_redis.mexists_as_set(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         elif redis_db == "br":
-            validity = self.BR_redis.mexists_as_set(ids)
+            validity = self.check_meta_existence(ids)
             return [ids[i] for i, v in enumerate(validity) if v]
         else:
             raise ValueError("redis_db must be either 'ra' or 'br'")
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import unittest
+
+from oc_ds_converter.lib.cleaner import Cleaner
+
+
+class TestCleanVolumeAndIssue(unittest.TestCase):
+    def test_clean_volume_and_issue(self):
+        # The rows produced before the patterns were precompiled and plain numbers skipped
+        cases = [
+            (('3', '4'), {'volume': '3', 'issue': '4', 'pub_date': ''}),
+            (('12', ''), {'volume': '12', 'issue': '', 'pub_date': ''}),
+            (('vol. 3', 'issue 4'), {'volume': 'vol. 3', 'issue': 'issue 4', 'pub_date': ''}),
+            (('n/a', 'n/a'), {'volume': '', 'issue': '', 'pub_date': ''}),
+            (('&na;', '7'), {'volume': '', 'issue': '7', 'pub_date': ''}),
+            (('1-2', '3'), {'volume': '1-2', 'issue': '3', 'pub_date': ''}),
+            (('4', 'special issue'), {'volume': '4', 'issue': 'special issue', 'pub_date': ''}),
+            (('Vol. 12, No. 3', ''), {'volume': '12', 'issue': '3', 'pub_date': ''}),
+            (('', 'Suppl 2'), {'volume': '', 'issue': 'Suppl 2', 'pub_date': ''}),
+        ]
+        for (volume, issue), expected in cases:
+            with self.subTest(volume=volume, issue=issue):
+                row = {'volume': volume, 'issue': issue, 'pub_date': ''}
+                Cleaner.clean_volume_and_issue(row)
+                self.assertEqual(row, expected)
+
+
+class TestCleanDate(unittest.TestCase):
+    def test_clean_date(self):
+        # Plain ISO dates take the fast path, the other strings are still parsed by dateutil
+        cases = {
+            '2020-02-03': '2020-02-03',
+            '2020-1-2': '2020-01-02',
+            '2020-02-30': '2020-02',
+            '2020-13-01': '2020',
+            '2020-05': '2020-05',
+            '2020': '2020',
+            '0999': '999',
+            'March 5, 2019': '2019-03-05',
+            '5 March 2019': '2019-03-05',
+            '2019-03-05T10:00:00Z': '2019-03-05',
+            'not a date': '',
+            '': '',
+        }
+        for date, expected in cases.items():
+            with self.subTest(date=date):
+                self.assertEqual(Cleaner(date).clean_date(), expected)
+                # A second call is answered by the cache of parsed dates
+                self.assertEqual(Cleaner(date).clean_date(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ from urllib.parse import unquote
 import pytest
 import responses
 
+from oc_ds_converter.oc_idmanager import support
 from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.redis_manager import RedisStorageManager
 from oc_ds_converter.oc_idmanager.oc_data_storage.sqlite_manager import SqliteStorageManager
@@ -28,7 +29,9 @@ def storage_manager(request: pytest.FixtureRequest, tmp_path):
 
 
 @pytest.fixture(autouse=True)
-def mock_http_requests(request):
+def mock_http_requests(request, monkeypatch):
+    # Mocked APIs answer instantly, throttling them only slows the suite down
+    monkeypatch.setattr(support, "API_RATE_LIMITS", {})
     with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
         _register_doi_ra_mocks(rsps)
         _register_doi_mocks(rsps)
@@ -6,6 +6,7 @@
 # SPDX-License-Identifier: ISC
 
 import csv
+import io
 import json
 import os.path
 import shutil
@@ -13,8 +14,11 @@ import tarfile
 import unittest
 from os.path import basename, join
 from pathlib import Path
+from unittest.mock import patch
 
-from oc_ds_converter.run.crossref_process import preprocess
+from oc_ds_converter.lib.jsonmanager import get_all_files_by_type
+from oc_ds_converter.run import crossref_process
+from oc_ds_converter.run.crossref_process import _run_iteration, preprocess
 
 
 class CrossrefProcessTest(unittest.TestCase):
@@ -384,6 +388,99 @@ class CrossrefProcessTest(unittest.TestCase):
         shutil.rmtree(citations_output_path)
         shutil.rmtree(self.output)
 
+    def test_preprocess_single_pass(self):
+        """Single-pass mode produces the same output as the default two-pass mode"""
+        outputs = []
+        for single_pass in (False, True):
+            if os.path.exists(self.output):
+                shutil.rmtree(self.output)
+            citations_output_path = self.output + "_citations"
+            if os.path.exists(citations_output_path):
+                shutil.rmtree(citations_output_path)
+
+            preprocess(crossref_json_dir=self.targz_cited_input, orcid_doi_filepath=self.iod,
+                       csv_dir=self.output, cache=self.cache, single_pass=single_pass)
+
+            output = {}
+            for out_dir in (self.output, citations_output_path):
+                for fname in os.listdir(out_dir):
+                    with open(os.path.join(out_dir, fname), encoding='utf-8') as f:
+                        output[fname] = list(csv.DictReader(f))
+            outputs.append(output)
+            self.assertFalse(os.path.exists(os.path.splitext(self.cache)[0] + '_cited_work'))
+
+            shutil.rmtree(self.output)
+            shutil.rmtree(citations_output_path)
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(sum(len(rows) for rows in outputs[1].values()), 17 + 16)
+
+    def test_processor_built_once_per_iteration(self):
+        """The processor is reused across the files of an iteration"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_processor_reuse')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        input_dir = os.path.join(tmp_dir, 'input')
+        os.makedirs(input_dir)
+        source = os.path.join(self.test_dir, 'reference_filter_test', 'test_filter.json')
+        shutil.copy(source, os.path.join(input_dir, '1.json'))
+        shutil.copy(source, os.path.join(input_dir, '2.json'))
+        output = os.path.join(tmp_dir, 'output')
+
+        with patch.object(
+            crossref_process, '_create_processor', wraps=crossref_process._create_processor
+        ) as create_processor:
+            preprocess(crossref_json_dir=input_dir, orcid_doi_filepath=None, csv_dir=output,
+                       cache=os.path.join(tmp_dir, 'cache.json'), use_orcid_api=False)
+
+        # One processor for the citing iteration and one for the cited iteration
+        self.assertEqual(create_processor.call_count, 2)
+        # The second copy of the file is skipped, its citing entity being already in storage
+        self.assertEqual(sorted(os.listdir(output)), ['1_citing.csv'])
+
+        shutil.rmtree(tmp_dir)
+
+    def test_parallel_targz_citing_iteration(self):
+        """With max_workers > 1, tar.gz members are read by the parent and processed by the workers"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_parallel_targz')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+        archive = os.path.join(tmp_dir, 'dump.tar.gz')
+        source = os.path.join(self.test_dir, 'reference_filter_test', 'test_filter.json')
+        with open(source, encoding='utf-8') as f:
+            content = f.read()
+        # Distinct DOIs in each member: a worker that processes both members does not write
+        # again an entity it already stored
+        with tarfile.open(archive, 'w:gz') as tar:
+            for n in (1, 2):
+                member_content = content.replace('10.1234/reference-with-doi', f'10.1234/reference-with-doi-{n}')
+                data = member_content.encode('utf-8')
+                member = tarfile.TarInfo(f'dump/{n}.json')
+                member.size = len(data)
+                tar.addfile(member, io.BytesIO(data))
+        output = os.path.join(tmp_dir, 'output')
+        citations_output = output + '_citations'
+        os.makedirs(citations_output)
+        cache = os.path.join(tmp_dir, 'cache.json')
+
+        all_files, targz_fd = get_all_files_by_type(archive, ".json", cache)
+        _run_iteration(
+            all_files, targz_fd, citations_output, output, None, None, True, cache,
+            processing_citing=True, use_orcid_api=False, max_workers=2
+        )
+        targz_fd.close()
+
+        self.assertEqual(sorted(os.listdir(output)), ['1_citing.csv', '2_citing.csv'])
+        for n in (1, 2):
+            with open(os.path.join(output, f'{n}_citing.csv'), encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([row['id'] for row in rows], [f'doi:10.1234/reference-with-doi-{n}'])
+        with open(cache, encoding='utf-8') as f:
+            self.assertEqual(sorted(json.load(f)['citing']), ['1.json', '2.json'])
+
+        shutil.rmtree(tmp_dir)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,11 +7,14 @@
 import json
 import os
 import unittest
+import time
+from unittest.mock import patch
 
 from oc_ds_converter.crossref.crossref_processing import CrossrefProcessing
 from oc_ds_converter.datasource.orcid_index import PublishersRedis
 from oc_ds_converter.lib.csvmanager import CSVManager
 from oc_ds_converter.lib.jsonmanager import load_json
+from oc_ds_converter.oc_idmanager.doi import DOIManager
 
 TEST_DIR = os.path.join("test", "crossref_processing")
 JSON_FILE = os.path.join(TEST_DIR, "0.json")
@@ -356,6 +359,16 @@ class TestCrossrefProcessing(unittest.TestCase):
         pages = crossref_processor.get_crossref_pages(item)
         self.assertEqual(pages, '')
 
+    def test_publishers_prefix_index(self):
+        first = CrossrefProcessing(orcid_index=None, publishers_filepath=PUBLISHERS_MAPPING)
+        second = CrossrefProcessing(orcid_index=None, publishers_filepath=PUBLISHERS_MAPPING)
+        self.assertIs(first.publishers_mapping, second.publishers_mapping)
+        for member, data in first.publishers_mapping.items():
+            for prefix in data['prefixes']:
+                self.assertIn(prefix, first.publishers_prefix_index)
+        self.assertEqual(first.get_publisher_by_prefix('10.1370'), ('Annals of Family Medicine', '1'))
+        self.assertIsNone(first.get_publisher_by_prefix('10.0000000'))
+
     def test_load_publishers_mapping(self):
         output = CrossrefProcessing.load_publishers_mapping(publishers_filepath=PUBLISHERS_MAPPING)
         expected_output = {
@@ -772,7 +785,7 @@ class TestCrossrefProcessing(unittest.TestCase):
         cp = CrossrefProcessing(testing=True)
         #CASE_4: invalid doi in self._redis_values_br
         inp_4 = {'id': 'doi:10.1089/bsp.2008.002', 'schema': 'doi'}
-        cp._redis_values_br.append(inp_4['id'])
+        cp._redis_values_br.add(inp_4['id'])
         out_4 = cp.to_validated_id_list(inp_4)
         exp_4 = ['doi:10.1089/bsp.2008.002']
         self.assertEqual(out_4, exp_4)
@@ -808,7 +821,7 @@ class TestCrossrefProcessing(unittest.TestCase):
         cp = CrossrefProcessing(testing=True)
         # CASE_4: invalid doi in self._redis_values_br
         inp_4 = {'id': 'doi:10.1089/bsp.2008.002', 'schema': 'doi'}
-        cp._redis_values_br.append(inp_4['id'])
+        cp._redis_values_br.add(inp_4['id'])
         out_4 = cp.to_validated_id_list(inp_4)
         exp_4 = ['doi:10.1089/bsp.2008.002']
         self.assertEqual(out_4, exp_4)
@@ -1002,6 +1015,20 @@ class TestCrossrefProcessing(unittest.TestCase):
         self.assertNotIn("bad-orcid", cp._redis_values_ra)
         cp.storage_manager.delete_storage()
 
+    def test_to_validated_id_list_50k_references(self):
+        # Membership in the ids found in Meta must not scan them, or a file with tens of
+        # thousands of references takes minutes
+        cp = CrossrefProcessing(testing=True)
+        dois = [f"10.1000/ref.{i}" for i in range(50000)]
+        cp.update_redis_values(br=dois, ra=[])
+        start = time.perf_counter()
+        validated = [cp.to_validated_id_list({"id": f"doi:{doi}", "schema": "doi"}) for doi in dois]
+        elapsed = time.perf_counter() - start
+        self.assertEqual(validated[-1], ["doi:10.1000/ref.49999"])
+        self.assertTrue(all(validated))
+        self.assertLess(elapsed, 10)
+        cp.storage_manager.delete_storage()
+
 
 def test_validated_as_with_storage_manager(storage_manager):
     valid_doi_not_in_db = {"identifier": "doi:10.1001/2012.jama.10158", "schema": "doi"}
@@ -1017,6 +1044,88 @@ def test_validated_as_with_storage_manager(storage_manager):
     assert c_processing.validated_as(valid_doi_not_in_db) is None
 
 
+def test_prefetch_storage_values(storage_manager):
+    storage_manager.set_multi_value([("doi:10.1001/2012.jama.10368", True), ("orcid:0000-0002-1234-5678", False)])
+    ids = ["doi:10.1001/2012.jama.10368", "orcid:0000-0002-1234-5678", "doi:10.1001/2012.jama.10158"]
+    assert storage_manager.get_values_batch(ids) == {
+        "doi:10.1001/2012.jama.10368": True,
+        "orcid:0000-0002-1234-5678": False,
+        "doi:10.1001/2012.jama.10158": None,
+    }
+
+    c_processing = CrossrefProcessing(storage_manager=storage_manager, testing=True)
+    c_processing.prefetch_storage_values(ids)
+    with patch.object(storage_manager, "get_value", side_effect=AssertionError("not prefetched")):
+        assert c_processing.validated_as({"identifier": ids[0], "schema": "doi"}) is True
+        assert c_processing.validated_as({"identifier": ids[1], "schema": "orcid"}) is False
+        assert c_processing.stored_validity(ids[2]) is None
+
+    c_processing.tmp_doi_m.storage_manager.set_value(ids[2], True)
+    c_processing.memory_to_storage()
+    assert c_processing.validated_as({"identifier": ids[2], "schema": "doi"}) is True
+
+
+def test_prevalidated_repaired_doi(storage_manager):
+    """A DOI repaired during the concurrent prevalidation is stored as is_valid stores it:
+    the repaired DOI is valid and the broken one is not stored at all"""
+    for prevalidate, number in ((False, "10158"), (True, "10159")):
+        repaired = f"doi:10.1001/2012.jama.{number}"
+        broken = repaired + "http://example.com"
+        other = "doi:10.1001/2012.jama.10368"
+        c_processing = CrossrefProcessing(storage_manager=storage_manager, testing=True)
+        with patch.object(DOIManager, "exists", side_effect=lambda doi, *args, **kwargs: doi in (repaired, other)), \
+                patch.object(DOIManager, "attempt_repair", return_value=repaired.replace("doi:", "")):
+            if prevalidate:
+                c_processing.prevalidate_dois([broken, other])
+                assert broken in c_processing._prevalidated_dois
+            assert c_processing.to_validated_id_list({"id": broken, "schema": "doi"}) == [broken]
+        assert c_processing.temporary_manager.get_value(broken) is None
+        assert c_processing.temporary_manager.get_value(repaired) is True
+        c_processing.memory_to_storage()
+        assert storage_manager.get_value(broken) is None
+        assert storage_manager.get_value(repaired) is True
+
+
+def test_exists_in_meta():
+    c_processing = CrossrefProcessing(testing=True)
+    br_redis = c_processing.BR_redis
+    in_meta = ["doi:10.1001/2012.jama.10368", "doi:10.1001/2012.jama.10158"]
+    not_in_meta = ["doi:10.1001/2012.jama.10159", "doi:10.1001/2012.jama.10160"]
+    for norm_id in in_meta:
+        br_redis.sadd(norm_id, "omid:br/0601")
+    all_ids = in_meta + not_in_meta
+    expected = {norm_id: br_redis.exists_as_set(norm_id) for norm_id in all_ids}
+
+    # The batch of referenced ids and the citing ids are each checked with a single round-trip,
+    # and exists_in_meta answers them without querying Redis again
+    with patch.object(br_redis, "mexists_as_set", wraps=br_redis.mexists_as_set) as mexists, \
+            patch.object(br_redis, "exists_as_set", wraps=br_redis.exists_as_set) as exists:
+        assert c_processing.get_redis_validity_list([in_meta[0], not_in_meta[0]], "br") == [in_meta[0]]
+        assert mexists.call_count == 1
+        c_processing.prefetch_meta_existence([in_meta[0], in_meta[1], not_in_meta[1], in_meta[1]])
+        assert mexists.call_count == 2
+        mexists.assert_called_with([in_meta[1], not_in_meta[1]])
+        assert {norm_id: c_processing.exists_in_meta(norm_id) for norm_id in all_ids} == expected
+        assert exists.call_count == 0
+
+    # An id outside the batch falls back to a single lookup, whose answer is then kept
+    other = "doi:10.1001/2012.jama.10161"
+    with patch.object(br_redis, "exists_as_set", wraps=br_redis.exists_as_set) as exists:
+        assert c_processing.exists_in_meta(other) is False
+        assert c_processing.exists_in_meta(other) is False
+        assert exists.call_count == 1
+
+    # The answers do not outlive the file they were gathered for
+    for clear in (c_processing.reset_file_state, c_processing.memory_to_storage):
+        c_processing.prefetch_meta_existence(all_ids)
+        assert c_processing._meta_existence
+        clear()
+        assert c_processing._meta_existence == {}
+        br_redis.delete(in_meta[0])
+        assert c_processing.exists_in_meta(in_meta[0]) is False
+        br_redis.sadd(in_meta[0], "omid:br/0601")
+
+
 class TestCrossrefProcessingWithMockedAPI(unittest.TestCase):
     """Integration tests using mocked Crossref API responses from conftest.py."""
 
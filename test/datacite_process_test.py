@@ -10,8 +10,11 @@ import json
 import os
 import shutil
 import unittest
+from unittest.mock import patch
 
-from oc_ds_converter.run.datacite_process import preprocess
+from oc_ds_converter.datacite.datacite_processing import DataciteProcessing
+from oc_ds_converter.run import datacite_process
+from oc_ds_converter.run.datacite_process import _run_iteration, iter_json_lines, preprocess, read_json
 
 
 class DataciteProcessTest(unittest.TestCase):
@@ -342,5 +345,116 @@ class DataciteProcessTest(unittest.TestCase):
         if os.path.exists(self.cache):
             os.remove(self.cache)
 
+    def test_processor_built_once_per_iteration(self):
+        """The processor, with its DOI-ORCID index, is reused across the files of an iteration,
+        and the files moved to _bad are not read again in the second iteration"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_processor_reuse')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        input_dir = os.path.join(tmp_dir, 'input')
+        shutil.copytree(self.json_dir, input_dir)
+        with open(os.path.join(input_dir, 'malformed.json'), 'w', encoding='utf-8') as f:
+            f.write('{"data": [')
+        output = os.path.join(tmp_dir, 'output')
+
+        with patch.object(
+            datacite_process, '_create_processor', wraps=datacite_process._create_processor
+        ) as create_processor, patch.object(
+            datacite_process, 'read_json', wraps=datacite_process.read_json
+        ) as read_json:
+            preprocess(datacite_json_dir=input_dir, publishers_filepath=self.publisher_mapping,
+                       orcid_doi_filepath=self.iod, csv_dir=output,
+                       cache=os.path.join(tmp_dir, 'cache.json'), use_orcid_api=False)
+
+        self.assertEqual(create_processor.call_count, 2)
+        self.assertEqual(create_processor.call_args.args[0], self.iod)
+        self.assertEqual(read_json.call_count, 3 + 2)
+        self.assertEqual(os.listdir(os.path.join(output, '_bad')), ['malformed.json.bad.json'])
+
+        shutil.rmtree(tmp_dir)
+
+    def test_parallel_citing_iteration(self):
+        """With max_workers > 1, the workers receive the file paths and read the files themselves"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_parallel')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        output = os.path.join(tmp_dir, 'output')
+        citations_output = output + '_citations'
+        os.makedirs(citations_output)
+        json_files = sorted(os.path.join(self.json_dir, f) for f in os.listdir(self.json_dir))
+        processor_args = (self.iod, None, self.publisher_mapping, None, True, True, False, False, False, False)
+
+        _run_iteration(json_files, citations_output, output, os.path.join(output, '_bad'),
+                       os.path.join(tmp_dir, 'cache.json'), True, processor_args, max_workers=2)
+
+        self.assertEqual(sorted(os.listdir(output)), ['jSonFile_1_subject.csv', 'jSonFile_2_subject.csv'])
+
+        shutil.rmtree(tmp_dir)
+
+    def test_read_json_streams_json_lines(self):
+        """JSON Lines files are recognised from their first lines and read lazily, while a
+        single JSON document is still parsed as a whole"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_read_json')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+        jsonl = os.path.join(tmp_dir, 'records.jsonl')
+        with open(jsonl, 'w', encoding='utf-8') as f:
+            f.write('{"id": "10.1234/broken", \n{"id": "10.1234/a"}\n\n{"id": "10.1234/b"}\n')
+
+        records = read_json(jsonl, os.path.join(tmp_dir, '_bad'))
+        self.assertNotIsInstance(records, list)
+        self.assertEqual([r['id'] for r in records], ['10.1234/a', '10.1234/b'])
+
+        document = read_json(os.path.join(self.json_dir, 'jSonFile_1.json'))
+        self.assertIsInstance(document, list)
+        self.assertEqual(document[0]['id'], '10.5281/zenodo.8265216')
+
+        # A single document with one record per line is not mistaken for JSON Lines
+        for name, content, ids in (
+            ('records.json', '{"data": [\n{"id": "10.1234/a"},\n{"id": "10.1234/b"}\n]}\n', ['10.1234/a', '10.1234/b']),
+            ('record.json', '{"data": [\n{"id": "10.1234/a"}\n]}\n', ['10.1234/a']),
+        ):
+            path = os.path.join(tmp_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            document = read_json(path, os.path.join(tmp_dir, '_bad'))
+            self.assertIsInstance(document, list)
+            self.assertEqual([r['id'] for r in document], ids)
+        self.assertEqual(os.listdir(os.path.join(tmp_dir, '_bad')), ['records.jsonl.bad.jsonl'])
+
+        shutil.rmtree(tmp_dir)
+
+    def test_malformed_lines_quarantined(self):
+        """A malformed line of a JSON Lines file is copied to _bad and the other records of the
+        file are processed, instead of moving the whole file"""
+        tmp_dir = os.path.join(self.test_dir, 'tmp_malformed_lines')
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        input_dir = os.path.join(tmp_dir, 'input')
+        os.makedirs(input_dir)
+        source = os.path.join(self.error_input_folder, 'datacite_test_bad.ndjson')
+        shutil.copy(source, os.path.join(input_dir, 'records.jsonl'))
+        output = os.path.join(tmp_dir, 'output')
+        bad_dir = os.path.join(output, '_bad')
+
+        records = list(iter_json_lines(os.path.join(input_dir, 'records.jsonl'), bad_dir))
+        self.assertEqual([r['id'] for r in records], ['10.1234/abc1', '10.1234/abc2', '10.1234/abc3', '10.1234/abc5'])
+        with open(os.path.join(bad_dir, 'records.jsonl.bad.jsonl'), encoding='utf-8') as f:
+            bad_lines = f.readlines()
+        self.assertEqual(len(bad_lines), 1)
+        self.assertIn('"10.1234/bad', bad_lines[0])
+
+        with patch.object(DataciteProcessing, 'csv_creator', autospec=True, return_value=None) as csv_creator:
+            preprocess(datacite_json_dir=input_dir, publishers_filepath=None, orcid_doi_filepath=None,
+                       csv_dir=output, cache=os.path.join(tmp_dir, 'cache.json'), use_orcid_api=False)
+
+        self.assertTrue(os.path.exists(os.path.join(input_dir, 'records.jsonl')))
+        self.assertEqual(os.listdir(bad_dir), ['records.jsonl.bad.jsonl'])
+        subject_ids = [call.args[1]['id'] for call in csv_creator.call_args_list if call.args[1]['id'].startswith('10.1234/abc')]
+        self.assertEqual(subject_ids, ['10.1234/abc1', '10.1234/abc2', '10.1234/abc3', '10.1234/abc5'])
+
+        shutil.rmtree(tmp_dir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -911,7 +911,7 @@ class TestDataciteProcessing(unittest.TestCase):
         dcp = DataciteProcessing()
         # CASE_4: invalid doi in self._redis_values_br
         inp_4 = {'id': 'doi:10.1089/bsp.2008.002', 'schema': 'doi'}
-        dcp._redis_values_br.append(inp_4['id'])
+        dcp._redis_values_br.add(inp_4['id'])
         out_4 = dcp.to_validated_id_list(inp_4)
         exp_4 = ['doi:10.1089/bsp.2008.002']
         self.assertEqual(out_4, exp_4)
@@ -946,7 +946,7 @@ class TestDataciteProcessing(unittest.TestCase):
         dcp = DataciteProcessing(testing=True)
         # CASE_4: invalid doi in self._redis_values_br
         inp_4 = {'id': 'doi:10.1089/bsp.2008.002', 'schema': 'doi'}
-        dcp._redis_values_br.append(inp_4['id'])
+        dcp._redis_values_br.add(inp_4['id'])
         out_4 = dcp.to_validated_id_list(inp_4)
         exp_4 = ['doi:10.1089/bsp.2008.002']
         self.assertEqual(out_4, exp_4)
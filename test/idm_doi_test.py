@@ -4,11 +4,23 @@
 # SPDX-License-Identifier: ISC
 
 import json
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from os import makedirs
 from os.path import exists, join
-
+from unittest.mock import patch
+
+from oc_ds_converter.oc_idmanager.base import (
+    CHECK_WORKERS,
+    _get_check_executor,
+    disable_memoization,
+    enable_memoization,
+    memoization_stats,
+)
 from oc_ds_converter.oc_idmanager.doi import DOIManager
+from oc_ds_converter.oc_idmanager.oc_data_storage.batch_manager import BatchManager
+from oc_ds_converter.oc_idmanager.support import get_session
 
 class DOIIdentifierManagerTest(unittest.TestCase):
     """This class aim at testing identifiers manager."""
@@ -291,3 +303,55 @@ class DOIIdentifierManagerTest(unittest.TestCase):
         dm = DOIManager(use_api_service=True)
         repaired = dm.attempt_repair("10.1108/jd-12-2013-0166http://example.com")
         self.assertEqual(repaired, "10.1108/jd-12-2013-0166")
+
+    def test_is_valid_many(self):
+        dm = DOIManager(storage_manager=BatchManager())
+        dm.storage_manager.set_value("doi:10.1/stored", False)
+        with patch.object(DOIManager, "exists", side_effect=lambda doi: doi.endswith("ok")) as exists:
+            result = dm.is_valid_many(["10.1/a-ok", "doi:10.1/A-OK", "10.1/stored", "10.1/bad", "nodoi"])
+        self.assertEqual(result, {
+            "10.1/a-ok": True, "doi:10.1/A-OK": True, "10.1/stored": False, "10.1/bad": False, "nodoi": False,
+        })
+        self.assertEqual(exists.call_count, 2)
+        self.assertTrue(dm.storage_manager.get_value("doi:10.1/a-ok"))
+        self.assertFalse(dm.storage_manager.get_value("doi:10.1/bad"))
+
+    def test_check_many_repaired(self):
+        dm = DOIManager(storage_manager=BatchManager())
+        threads = set()
+
+        def exists(doi):
+            threads.add(threading.current_thread())
+            return doi == "doi:10.1/fixed"
+
+        with patch.object(DOIManager, "exists", side_effect=exists), \
+                patch.object(DOIManager, "attempt_repair", side_effect=lambda doi: "10.1/fixed" if "broken" in doi else None):
+            result = dm.check_many(["10.1/broken", "10.1/bad"])
+            dm.storage_manager.delete_storage()
+            dm.check_many(["10.1/broken", "10.1/bad"])
+        self.assertEqual(result, {"10.1/broken": (True, "doi:10.1/fixed"), "10.1/bad": (False, "doi:10.1/bad")})
+        self.assertTrue(dm.storage_manager.get_value("doi:10.1/fixed"))
+        self.assertIsNone(dm.storage_manager.get_value("doi:10.1/broken"))
+        # The checks of both calls ran in the threads of the same long-lived pool
+        self.assertTrue(threads <= _get_check_executor(CHECK_WORKERS)._threads)
+
+    def test_shared_session(self):
+        self.assertIs(get_session(), get_session())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNot(executor.submit(get_session).result(), get_session())
+
+    def test_memoized_normalise(self):
+        enable_memoization(maxsize=2)
+        try:
+            dm = DOIManager(storage_manager=BatchManager())
+            other_dm = DOIManager(storage_manager=BatchManager())
+            self.assertEqual(dm.normalise("https://doi.org/10.1/A%20B"), "10.1/ab")
+            self.assertEqual(other_dm.normalise("https://doi.org/10.1/A%20B"), "10.1/ab")
+            self.assertEqual(dm.normalise("10.1/x", include_prefix=True), "doi:10.1/x")
+            self.assertEqual(dm.normalise("10.1/y"), "10.1/y")
+            self.assertEqual(dm.normalise("https://doi.org/10.1/A%20B"), "10.1/ab")
+            stats = memoization_stats()["DOIManager.normalise"]
+            self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 4, 2))
+        finally:
+            disable_memoization()
+        self.assertEqual(memoization_stats(), {})
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import getpass
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+import responses
+from requests import Response
+from requests.exceptions import ConnectionError
+
+from oc_ds_converter.oc_idmanager import response_cache, support
+from oc_ds_converter.oc_idmanager.response_cache import (
+    HTTP_CACHE_ENV,
+    ResponseCache,
+    disable_response_cache,
+    enable_response_cache,
+)
+from oc_ds_converter.oc_idmanager.support import (
+    RATE_LIMIT_DIR_ENV,
+    RATE_LIMITS_ENV,
+    RateLimiter,
+    disable_rate_limit_overrides,
+    enable_rate_limits,
+    get_rate_limiter,
+    http_get,
+    parse_rate_limits,
+    retry_after_seconds,
+)
+
+URL = "https://api.example.org/item"
+
+
+def _response_with_retry_after(value: str) -> Response:
+    r = Response()
+    r.headers["Retry-After"] = value
+    return r
+
+
+class TestRateLimiter:
+    def test_shared_bucket(self, tmp_path) -> None:
+        first = RateLimiter("api.example.org", rate=20.0, burst=2, state_dir=str(tmp_path))
+        second = RateLimiter("api.example.org", rate=20.0, burst=2, state_dir=str(tmp_path))
+        start = time.monotonic()
+        first.acquire()
+        second.acquire()
+        assert time.monotonic() - start < 0.04
+        first.acquire()
+        second.acquire()
+        assert time.monotonic() - start >= 0.08
+
+    def test_pause(self, tmp_path) -> None:
+        first = RateLimiter("api.example.org", rate=100.0, burst=10, state_dir=str(tmp_path))
+        second = RateLimiter("api.example.org", rate=100.0, burst=10, state_dir=str(tmp_path))
+        first.pause(0.2)
+        start = time.monotonic()
+        second.acquire()
+        assert time.monotonic() - start >= 0.15
+
+
+class TestRateLimits:
+    def test_parse_rate_limits(self) -> None:
+        assert parse_rate_limits("doi.org=50/60, API.Crossref.org=2.5,pub.orcid.org=off") == {
+            "doi.org": (50.0, 60),
+            "api.crossref.org": (2.5, 2),
+            "pub.orcid.org": None,
+        }
+        assert parse_rate_limits("export.arxiv.org=0.5") == {"export.arxiv.org": (0.5, 1)}
+        assert parse_rate_limits("off") == {"*": None}
+        assert parse_rate_limits("") == {}
+        for invalid in ("doi.org", "doi.org=fast", "doi.org=0", "doi.org=5/0", "=5"):
+            with pytest.raises(ValueError):
+                parse_rate_limits(invalid)
+
+    def test_overrides(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv(RATE_LIMITS_ENV, raising=False)
+        monkeypatch.delenv(RATE_LIMIT_DIR_ENV, raising=False)
+        monkeypatch.setattr(support, "_limiters", {})
+        monkeypatch.setattr(support, "API_RATE_LIMITS", {"doi.org": (20.0, 20), "api.crossref.org": (5.0, 5)})
+        default = get_rate_limiter("https://doi.org/10.1000/1")
+        assert (default.rate, default.burst, default.state_dir) == (20.0, 20, support.RATE_LIMIT_STATE_DIR)
+        assert get_rate_limiter("https://api.example.org/item") is None
+        try:
+            with pytest.raises(ValueError):
+                enable_rate_limits("doi.org=fast")
+            enable_rate_limits("doi.org=100/50,api.crossref.org=off", str(tmp_path))
+            limiter = get_rate_limiter("https://doi.org/10.1000/1")
+            assert (limiter.rate, limiter.burst, limiter.state_dir) == (100.0, 50, str(tmp_path))
+            assert get_rate_limiter("https://api.crossref.org/works") is None
+            enable_rate_limits("off")
+            assert get_rate_limiter("https://doi.org/10.1000/1") is None
+            enable_rate_limits("*=off,api.example.org=2")
+            assert get_rate_limiter("https://doi.org/10.1000/1") is None
+            assert get_rate_limiter("https://api.example.org/item").rate == 2.0
+        finally:
+            disable_rate_limit_overrides()
+        assert get_rate_limiter("https://doi.org/10.1000/1").rate == 20.0
+
+    def test_state_dir_per_user(self) -> None:
+        assert support.RATE_LIMIT_STATE_DIR.startswith(os.path.join(tempfile.gettempdir(), ""))
+        assert os.path.basename(support.RATE_LIMIT_STATE_DIR) == f"oc_ds_converter_rate_limits_{getpass.getuser()}"
+
+
+class TestHttpGet:
+    def test_retry_after_seconds(self) -> None:
+        assert retry_after_seconds(_response_with_retry_after("3")) == 3.0
+        assert 8 < retry_after_seconds(_response_with_retry_after(formatdate(time.time() + 10, usegmt=True))) <= 10
+        assert retry_after_seconds(_response_with_retry_after("soon")) is None
+        assert retry_after_seconds(Response()) is None
+
+    def test_throttled_request_is_retried(self, monkeypatch) -> None:
+        monkeypatch.setattr(support, "API_RATE_LIMITS", {"api.example.org": (1000.0, 10)})
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, URL, status=429, headers={"Retry-After": "0"})
+            rsps.add(responses.GET, URL, status=503)
+            rsps.add(responses.GET, URL, json={"ok": True})
+            monkeypatch.setattr(support, "BACKOFF_BASE", 0.01)
+            r = http_get(URL, timeout=30)
+            assert r.status_code == 200
+            assert len(rsps.calls) == 3
+
+    def test_connection_error_backs_off(self, monkeypatch) -> None:
+        waits: list[float] = []
+        monkeypatch.setattr(support.time, "sleep", waits.append)
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.GET, URL, body=ConnectionError("down"))
+            rsps.add(responses.GET, URL, body=ConnectionError("down"))
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    http_get(URL, timeout=30)
+            rsps.add(responses.GET, URL, json={})
+            http_get(URL, timeout=30)
+        assert waits == [support.BACKOFF_BASE, support.BACKOFF_BASE * 2]
+        assert "api.example.org" not in support._failures
+
+    def test_backoff_from_several_threads(self) -> None:
+        host = "threads.example.org"
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: [support.backoff(host) for _ in range(1000)], range(8)))
+        assert support._failures.pop(host) == 8000
+
+
+class TestResponseCache:
+    def test_http_get_uses_cache(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv(HTTP_CACHE_ENV, raising=False)
+        enable_response_cache(str(tmp_path / "http_cache.db"))
+        try:
+            with responses.RequestsMock() as rsps:
+                rsps.add(responses.GET, URL, json={"ok": True})
+                rsps.add(responses.GET, URL + "/missing", status=404)
+                rsps.add(responses.GET, URL + "/error", status=500)
+                for _ in range(2):
+                    r = http_get(URL, headers={"Accept": "application/json"}, timeout=30)
+                    assert r.status_code == 200
+                    assert r.json() == {"ok": True}
+                    assert http_get(URL + "/missing", timeout=30).status_code == 404
+                    assert http_get(URL + "/error", timeout=30).status_code == 500
+                assert [c.request.url for c in rsps.calls] == [
+                    URL, URL + "/missing", URL + "/error", URL + "/error"
+                ]
+                rsps.add(responses.GET, URL, json={"ok": False})
+                assert http_get(URL, headers={"Accept": "text/html"}, timeout=30).json() == {"ok": False}
+        finally:
+            disable_response_cache()
+
+    def test_expiry_and_eviction(self, tmp_path, monkeypatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: clock[0])
+        cache = ResponseCache(str(tmp_path / "http_cache.db"), max_size=100)
+        response = Response()
+        response.status_code = 200
+        response._content = b"x" * 40
+        for i in range(3):
+            cache.put(f"{URL}/{i}", "api.example.org", response)
+            clock[0] += 1
+        # Reading the oldest response makes it the most recently used
+        clock[0] += 2 * 60 * 60
+        assert cache.get(f"{URL}/0") is not None
+        cache.evict()
+        assert cache.get(f"{URL}/1") is None
+        assert cache.get(f"{URL}/0").content == b"x" * 40
+        assert cache.get(f"{URL}/2") is not None
+
+        clock[0] += response_cache.DEFAULT_TTL
+        assert cache.get(f"{URL}/2") is None
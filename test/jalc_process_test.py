@@ -116,6 +116,38 @@ class TestJalcProcess(unittest.TestCase):
         if os.path.exists(self.any_db):
             os.remove(self.any_db)
 
+    def test_preprocess_single_pass(self):
+        """Single-pass mode produces the same output as the default two-pass mode"""
+        outputs = []
+        for single_pass in (False, True):
+            for el in os.listdir(self.sample_dump_dir):
+                if el.endswith("decompr_zip_dir"):
+                    shutil.rmtree(os.path.join(self.sample_dump_dir, el))
+            if os.path.exists(self.output_dir):
+                shutil.rmtree(self.output_dir)
+            citations_output_path = self.output_dir + "_citations"
+            if os.path.exists(citations_output_path):
+                shutil.rmtree(citations_output_path)
+
+            preprocess(jalc_json_dir=self.sample_dump_dir, orcid_doi_filepath=self.orcid_doi,
+                       csv_dir=self.output_dir, cache=self.cache_test, single_pass=single_pass)
+
+            output = {}
+            for out_dir in (self.output_dir, citations_output_path):
+                for fname in os.listdir(out_dir):
+                    with open(os.path.join(out_dir, fname), encoding='utf-8') as f:
+                        output[fname] = list(csv.DictReader(f))
+            outputs.append(output)
+
+            shutil.rmtree(self.output_dir)
+            shutil.rmtree(citations_output_path)
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(sum(len(rows) for rows in outputs[1].values()), 13 + 8)
+        for el in os.listdir(self.sample_dump_dir):
+            if el.endswith("decompr_zip_dir"):
+                shutil.rmtree(os.path.join(self.sample_dump_dir, el))
+
     def test_preprocess_wrong_doi_cited(self):
         for el in os.listdir(self.sample_fake_dump_dir):
             if el.endswith("decompr_zip_dir"):
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import gzip
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from oc_ds_converter.lib.jsonmanager import GzipJsonLines, batched, iter_json_items, load_json
+
+CROSSREF_DATA = os.path.join('test', 'crossref_processing', '0.json')
+
+
+class TestIterJsonItems:
+    def test_same_items_as_load_json(self) -> None:
+        expected = load_json(CROSSREF_DATA, None)
+        assert expected is not None
+        assert list(iter_json_items(CROSSREF_DATA, None)) == expected['items']
+
+    def test_small_chunks(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr('oc_ds_converter.lib.jsonmanager._STREAM_CHUNK_SIZE', 7)
+        data = {
+            "status": "ok",
+            "meta": {"items": [1, 2], "note": "a \"quoted\" ] } string"},
+            "items": [{"DOI": "10.1/a", "page": 12345}, 678, "tail", [1, {"x": None}]],
+            "total": 4,
+        }
+        path = tmp_path / 'chunks.json'
+        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        assert list(iter_json_items(str(path), None)) == data['items']
+
+    def test_gzip(self, tmp_path) -> None:
+        path = tmp_path / 'items.json.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump({"items": [{"DOI": "10.1/è"}]}, f)
+        assert list(iter_json_items(str(path), None)) == [{"DOI": "10.1/è"}]
+
+    def test_tar_member(self, tmp_path) -> None:
+        payload = json.dumps({"items": [{"DOI": "10.1/a"}, {"DOI": "10.1/b"}]}).encode('utf-8')
+        archive = tmp_path / 'items.tar.gz'
+        with tarfile.open(archive, 'w:gz') as tar:
+            member = tarfile.TarInfo('dump/1.json')
+            member.size = len(payload)
+            tar.addfile(member, io.BytesIO(payload))
+        with tarfile.open(archive, 'r:gz') as tar:
+            items = list(iter_json_items(tar.getmember('dump/1.json'), tar))
+        assert items == [{"DOI": "10.1/a"}, {"DOI": "10.1/b"}]
+
+    def test_empty_and_missing_items(self, tmp_path) -> None:
+        empty = tmp_path / 'empty.json'
+        empty.write_text('{"items": []}', encoding='utf-8')
+        missing = tmp_path / 'missing.json'
+        missing.write_text('{"other": [1]}', encoding='utf-8')
+        assert list(iter_json_items(str(empty), None)) == []
+        assert list(iter_json_items(str(missing), None)) == []
+
+    def test_malformed(self, tmp_path) -> None:
+        path = tmp_path / 'broken.json'
+        path.write_text('{"items": [{"DOI": "10.1/a"}, {"DOI": ', encoding='utf-8')
+        items = iter_json_items(str(path), None)
+        assert next(items) == {"DOI": "10.1/a"}
+        with pytest.raises(ValueError):
+            next(items)
+
+
+class TestGzipJsonLines:
+    def test_lines(self, tmp_path) -> None:
+        path = tmp_path / 'scholix.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write('{"n": 0}\n\n{"n": 2, "t": "\u00e9"}\n{"n": 3}')
+        assert list(GzipJsonLines(str(path))) == [{"n": 0}, None, {"n": 2, "t": "é"}, {"n": 3}]
+        assert list(GzipJsonLines(str(path), skip_lines=2)) == [{"n": 2, "t": "é"}, {"n": 3}]
+
+    def test_resume_from_offset(self, tmp_path) -> None:
+        path = tmp_path / 'scholix.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.writelines(f'{{"n": {n}}}\n' for n in range(10))
+        reader = GzipJsonLines(str(path))
+        first_part = next(batched(reader, 4))
+        assert first_part == [{"n": n} for n in range(4)]
+        assert list(GzipJsonLines(str(path), offset=reader.offset)) == [{"n": n} for n in range(4, 10)]
+
+
+class TestBatched:
+    def test_batches(self) -> None:
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(batched([], 3)) == []
+
+    def test_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(batched([1], 0))
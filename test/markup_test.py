@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import random
+import unittest
+import warnings
+
+from bs4 import BeautifulSoup
+
+from oc_ds_converter.lib.markup import strip_markup
+
+TITLES = [
+    'Plain title',
+    '',
+    '   ',
+    ' \n ',
+    'Effect of <i>Escherichia coli</i> on CO<sub>2</sub> levels',
+    '<jats:title>A <jats:italic>study</jats:italic></jats:title>',
+    '<mml:math xmlns:mml="http://www.w3.org/1998/Math/MathML"><mml:msup><mml:mi>x</mml:mi><mml:mn>2</mml:mn></mml:msup></mml:math> bounds',
+    'R&amp;D in <b>Europe</b>',
+    'Caf&eacute; &#233;t&#xE9; &nbsp;&lt;tag&gt;',
+    '&amp;lt;i&amp;gt;double&amp;lt;/i&amp;gt;',
+    'R&D',
+    'a & b',
+    'x &foo; y',
+    'a < b > c',
+    'tail<',
+    '<!-- comment -->text',
+    '<![CDATA[x < y]]> and z',
+    '<script>var x;</script>visible',
+    '<pre>  kept  </pre>',
+    '<p>unclosed',
+    'line<br/>break',
+    '<a href="http://example.org/?a=1&b=2">link</a>',
+    "<span class='x'>single quoted</span>",
+    '&#0; &#128; &#x1F600;',
+]
+
+FRAGMENTS = [
+    'a', 'Z', ' ', '\n', '\t', '<i>', '</i>', '<sup>', '</sup>', '<mml:mi>', '</mml:mi>', '<br/>',
+    '<span class="x">', '</span>', '&amp;', '&lt;', '&nbsp;', '&#39;', '&#x27;', '&Aacute;', '&',
+    '<', '>', '&foo;', '<!-- c -->', '<script>', '</script>', '<pre>', '</pre>', 'é', '"', "'", '=',
+]
+
+
+def _soup_text(text: str) -> str:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return BeautifulSoup(text, 'html.parser').get_text()
+
+
+class TestStripMarkup(unittest.TestCase):
+    def test_titles(self):
+        for title in TITLES:
+            with self.subTest(title=title):
+                self.assertEqual(strip_markup(title), _soup_text(title))
+
+    def test_random_markup(self):
+        rnd = random.Random(0)
+        for _ in range(5000):
+            text = ''.join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(1, 10)))
+            self.assertEqual(strip_markup(text), _soup_text(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
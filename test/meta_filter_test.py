@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from unittest.mock import patch
+
+from oc_ds_converter.datasource.meta_filter import (
+    BloomFilter,
+    MetaFilteredRedis,
+    disable_meta_filters,
+    enable_meta_filters,
+    export_meta_filter,
+    meta_filter_path,
+    meta_filtered,
+)
+from oc_ds_converter.datasource.redis import FakeRedisWrapper, RedisDataSource
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self, tmp_path) -> None:
+        path = str(tmp_path / "ids.bloom")
+        keys = [f"doi:10.1000/{i}" for i in range(5000)]
+        assert BloomFilter.write(path, keys, capacity=len(keys), error_rate=0.01) == 5000
+        bloom_filter = BloomFilter(path)
+        assert bloom_filter.count == 5000
+        assert all(key in bloom_filter for key in keys)
+        false_positives = sum(bloom_filter.might_contain(f"doi:10.2000/{i}") for i in range(5000))
+        assert false_positives < 5000 * 0.03
+        bloom_filter.close()
+
+
+class TestMetaFilteredRedis:
+    def setup_method(self) -> None:
+        self.redis = FakeRedisWrapper()
+        self.redis.sadd("doi:10.1000/a", "br/1")
+        self.redis.sadd("doi:10.1000/b", "br/2")
+
+    def test_export_and_filter(self, tmp_path) -> None:
+        path = str(tmp_path / "DB-META-BR.bloom")
+        with patch.object(self.redis, "scan_iter", wraps=self.redis.scan_iter) as scan_iter:
+            assert export_meta_filter(self.redis, path) == 2
+        scan_iter.assert_called_once_with(count=10000)
+        filtered = MetaFilteredRedis(self.redis, BloomFilter(path))
+        absent = [f"doi:10.2000/{i}" for i in range(100)]
+        with patch.object(self.redis, "mexists_as_set", wraps=self.redis.mexists_as_set) as mexists:
+            result = filtered.mexists_as_set(["doi:10.1000/a", *absent, "doi:10.1000/b"])
+        assert result == [True, *([False] * 100), True]
+        # Only the possible hits reach Redis
+        assert len(mexists.call_args.args[0]) < 10
+        assert filtered.exists_as_set("doi:10.1000/a")
+        assert not filtered.exists_as_set("doi:10.1000/c")
+        assert filtered.smembers("doi:10.1000/a") == {b"br/1"}
+
+    def test_meta_filtered(self, tmp_path) -> None:
+        datasource = object.__new__(RedisDataSource)
+        assert meta_filtered(datasource, "DB-META-BR") is datasource
+        enable_meta_filters(str(tmp_path))
+        try:
+            # Enabled, but no filter has been exported for this service
+            assert meta_filtered(datasource, "DB-META-BR") is datasource
+            export_meta_filter(self.redis, meta_filter_path(str(tmp_path), "DB-META-BR"))
+            filtered = meta_filtered(datasource, "DB-META-BR")
+            assert isinstance(filtered, MetaFilteredRedis)
+            assert filtered.bloom_filter.might_contain("doi:10.1000/b")
+        finally:
+            disable_meta_filters()
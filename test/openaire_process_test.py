@@ -5,8 +5,13 @@
 
 import os.path
 import shutil
+import tarfile
+import tempfile
 import unittest
 from os.path import join
+from unittest.mock import patch
+
+from oc_ds_converter.run import openaire_process
 from oc_ds_converter.run.openaire_process import *
 
 
@@ -362,5 +367,51 @@ class OpenAireProcessTest(unittest.TestCase):
             if el.endswith("decompr_zip_dir"):
                 shutil.rmtree(os.path.join(self.sample_2tar, el))
 
+    def test_resume_from_recorded_offset(self):
+        '''A file interrupted after its first part is resumed from the position recorded for that part,
+        producing the same output as an uninterrupted run for the remaining parts'''
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            with tarfile.open(join(self.sample_2tar, "part1.tar")) as tar:
+                member = next(m for m in tar.getmembers() if m.name.endswith("reduced_n2.gz"))
+                member.name = "reduced_n2.gz"
+                tar.extract(member, tmp_dir)
+            gz_file = join(tmp_dir, "reduced_n2.gz")
+
+            recorded_offsets = []
+
+            def run(name, completed_parts=0):
+                csv_dir = join(tmp_dir, name)
+                citations_dir = csv_dir + "_citations"
+                os.makedirs(csv_dir)
+                os.makedirs(citations_dir)
+                cache = join(tmp_dir, name + "_cache.json")
+                if completed_parts:
+                    with open(cache, "w", encoding="utf-8") as f:
+                        json.dump({"part1.tar": {gz_file: completed_parts}}, f)
+                    reader = GzipJsonLines(gz_file)
+                    parts = batched(reader, 2)
+                    for _ in range(completed_parts):
+                        next(parts)
+                    store_resume_offset(cache, FileLock(cache + ".lock"), gz_file, completed_parts, reader.offset)
+                    recorded_offsets.append(reader.offset)
+                get_citations_and_metadata("part1.tar", citations_dir, csv_dir, gz_file, None, None, True, cache, target=2)
+                output = dict()
+                for file in os.listdir(citations_dir):
+                    with open(join(citations_dir, file), encoding="utf-8") as f:
+                        output[file] = f.read()
+                return output
+
+            full_run = run("full")
+            with patch.object(openaire_process, "GzipJsonLines", wraps=GzipJsonLines) as reader_class:
+                resumed_run = run("resumed", completed_parts=1)
+            # The reader jumps to the recorded position instead of skipping the rows of the first part
+            self.assertGreater(recorded_offsets[0], 0)
+            reader_class.assert_called_once_with(gz_file, offset=recorded_offsets[0])
+            self.assertEqual(sorted(full_run), ["reduced_n2_1.csv", "reduced_n2_2.csv"])
+            self.assertEqual(resumed_run, {"reduced_n2_2.csv": full_run["reduced_n2_2.csv"]})
+        finally:
+            shutil.rmtree(tmp_dir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,13 +6,42 @@ import os
 import shutil
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 from oc_ds_converter.datasource.orcid_index import (
     OrcidIndexRedis,
+    OrcidIndexSQLite,
     PublishersRedis,
+    build_orcid_index_db,
+    is_orcid_index_db,
     load_orcid_index_to_redis,
     load_publishers_to_redis,
+    open_orcid_index,
 )
+from oc_ds_converter.lib.csvmanager import CSVManager
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    """Runs the parsing in threads and records how many parsed files were not consumed yet."""
+    max_in_flight = 0
+
+    def __init__(self, max_workers: int, mp_context: object = None) -> None:
+        super().__init__(max_workers)
+        self.in_flight = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        self.in_flight += 1
+        _RecordingExecutor.max_in_flight = max(_RecordingExecutor.max_in_flight, self.in_flight)
+        result = future.result
+
+        def consume(timeout=None):
+            self.in_flight -= 1
+            return result(timeout)
+
+        future.result = consume
+        return future
 
 
 class TestOrcidIndexRedis(unittest.TestCase):
@@ -76,10 +105,119 @@ class TestLoadOrcidIndexToRedis(unittest.TestCase):
         result2 = self.orcid_index.get_value("doi:10.1234/article2")
         self.assertEqual(result2, {"Brown, Alice orcid:0000-0003-4567-8901"})
 
+    def test_load_over_values_without_loaded_files(self) -> None:
+        # Values loaded by a version that did not record the loaded files
+        self.orcid_index.add_values_batch({
+            "doi:10.1234/article1": {"Smith, John orcid:0000-0001-2345-6789"},
+            "doi:10.1234/removed": {"Brown, Alice orcid:0000-0003-4567-8901"},
+        })
+        with open(os.path.join(self.temp_dir, "orcid_index.csv"), "w", encoding="utf-8") as f:
+            f.write('"id","value"\n"10.1234/article1","Doe, Jane orcid:0000-0002-3456-7890"\n')
+
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 1)
+        self.assertEqual(
+            self.orcid_index.get_value("doi:10.1234/article1"), {"Doe, Jane orcid:0000-0002-3456-7890"}
+        )
+        self.assertIsNone(self.orcid_index.get_value("doi:10.1234/removed"))
+        self.assertEqual(list(self.orcid_index.get_loaded_files()), ["orcid_index.csv"])
+
     def test_load_nonexistent_directory(self) -> None:
         load_orcid_index_to_redis("/nonexistent/path", self.orcid_index)
         self.assertFalse(self.orcid_index.has_data())
 
+    def test_incremental_load(self) -> None:
+        first = os.path.join(self.temp_dir, "orcid_index_1.csv")
+        second = os.path.join(self.temp_dir, "orcid_index_2.csv")
+        with open(first, "w", encoding="utf-8") as f:
+            f.write('"id","value"\n"10.1234/article1","Smith, John orcid:0000-0001-2345-6789"\n')
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 1)
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 0)
+
+        # A file touched but not changed is not loaded again
+        os.utime(first, ns=(0, 0))
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 0)
+
+        with open(second, "w", encoding="utf-8") as f:
+            f.write('"id","value"\n"10.1234/article2","Brown, Alice orcid:0000-0003-4567-8901"\n')
+        with open(first, "a", encoding="utf-8") as f:
+            f.write('"10.1234/article1","Doe, Jane orcid:0000-0002-3456-7890"\n')
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 2)
+        self.assertEqual(
+            self.orcid_index.get_value("doi:10.1234/article1"),
+            {"Smith, John orcid:0000-0001-2345-6789", "Doe, Jane orcid:0000-0002-3456-7890"},
+        )
+
+        # A row dropped from a loaded file is removed by reloading the index from all the files
+        with open(first, "w", encoding="utf-8") as f:
+            f.write('"id","value"\n"10.1234/article1","Doe, Jane orcid:0000-0002-3456-7890"\n')
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 2)
+        self.assertEqual(
+            self.orcid_index.get_value("doi:10.1234/article1"), {"Doe, Jane orcid:0000-0002-3456-7890"}
+        )
+        self.assertEqual(
+            self.orcid_index.get_value("doi:10.1234/article2"), {"Brown, Alice orcid:0000-0003-4567-8901"}
+        )
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 0)
+
+        # Removing a loaded file reloads the index from the remaining files
+        os.remove(first)
+        self.assertEqual(load_orcid_index_to_redis(self.temp_dir, self.orcid_index, max_workers=1), 1)
+        self.assertIsNone(self.orcid_index.get_value("doi:10.1234/article1"))
+        self.assertEqual(
+            self.orcid_index.get_value("doi:10.1234/article2"), {"Brown, Alice orcid:0000-0003-4567-8901"}
+        )
+
+
+class TestOrcidIndexSQLite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_dir = os.path.join(self.temp_dir, "index")
+        os.makedirs(self.csv_dir)
+        with open(os.path.join(self.csv_dir, "orcid_index_1.csv"), "w", encoding="utf-8") as f:
+            f.write('''"id","value"
+"10.1234/Article1","Smith, John orcid:0000-0001-2345-6789"
+"10.1234/article1","Doe, Jane orcid:0000-0002-3456-7890"
+''')
+        with open(os.path.join(self.csv_dir, "orcid_index_2.csv"), "w", encoding="utf-8") as f:
+            f.write('''"id","value"
+"doi:10.1234/article1","Smith, John orcid:0000-0001-2345-6789"
+"10.1234/article2","Brown, Alice orcid:0000-0003-4567-8901"
+''')
+        self.db_path = os.path.join(self.temp_dir, "orcid_index.db")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_build_and_read(self) -> None:
+        self.assertEqual(build_orcid_index_db(self.csv_dir, self.db_path, max_workers=1), 2)
+        self.assertTrue(is_orcid_index_db(self.db_path))
+        self.assertFalse(is_orcid_index_db(self.csv_dir))
+        index = open_orcid_index(self.db_path)
+        self.assertIsInstance(index, OrcidIndexSQLite)
+        self.assertEqual(
+            index.get_value("doi:10.1234/article1"),
+            {"Smith, John orcid:0000-0001-2345-6789", "Doe, Jane orcid:0000-0002-3456-7890"},
+        )
+        self.assertIsNone(index.get_value("doi:10.1234/missing"))
+        dois = ["doi:10.1234/article2", "doi:10.1234/missing"] + [f"doi:10.1234/{i}" for i in range(1200)]
+        self.assertEqual(
+            index.get_values_batch(dois),
+            {"doi:10.1234/article2": {"Brown, Alice orcid:0000-0003-4567-8901"}},
+        )
+        self.assertIsInstance(open_orcid_index(self.csv_dir), CSVManager)
+
+    def test_build_with_bounded_in_flight_files(self) -> None:
+        for i in range(3, 21):
+            with open(os.path.join(self.csv_dir, f"orcid_index_{i}.csv"), "w", encoding="utf-8") as f:
+                f.write(f'"id","value"\n"10.1234/article{i}","Doe, Jane orcid:0000-0002-3456-7890"\n')
+        _RecordingExecutor.max_in_flight = 0
+        with patch("oc_ds_converter.datasource.orcid_index.ProcessPoolExecutor", _RecordingExecutor):
+            self.assertEqual(build_orcid_index_db(self.csv_dir, self.db_path, max_workers=2), 20)
+        self.assertLessEqual(_RecordingExecutor.max_in_flight, 4)
+        index = open_orcid_index(self.db_path)
+        self.assertEqual(index.get_value("doi:10.1234/article20"), {"Doe, Jane orcid:0000-0002-3456-7890"})
+        index.close()
+
 
 class TestPublishersRedis(unittest.TestCase):
     def setUp(self) -> None:
@@ -106,6 +244,15 @@ class TestPublishersRedis(unittest.TestCase):
         result = self.publishers_redis.get_by_prefix("10.9999")
         self.assertIsNone(result)
 
+    def test_get_name_and_member_by_prefix(self) -> None:
+        self.publishers_redis.set_publisher("123", "Test Publisher", {"10.1234"})
+        self.assertEqual(self.publishers_redis.get_name_and_member_by_prefix("10.1234"), ("Test Publisher", "123"))
+        self.assertIsNone(self.publishers_redis.get_name_and_member_by_prefix("10.9999"))
+
+        # Layout without the prefix index
+        self.publishers_redis._r.hdel(PublishersRedis.PREFIX_INDEX_KEY, "10.1234")
+        self.assertEqual(self.publishers_redis.get_name_and_member_by_prefix("10.1234"), ("Test Publisher", "123"))
+
     def test_has_data_empty(self) -> None:
         self.assertFalse(self.publishers_redis.has_data())
 
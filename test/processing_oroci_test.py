@@ -1544,8 +1544,8 @@ class TestOpenaireProcessing(unittest.TestCase):
         ra = ["orcid:0000-0003-0530-4305"]
         op = OpenaireProcessing(testing=True)
         op.update_redis_values(br,ra)
-        self.assertEqual(op._redis_values_br, br)
-        self.assertEqual(op._redis_values_ra, ra)
+        self.assertEqual(op._redis_values_br, set(br))
+        self.assertEqual(op._redis_values_ra, set(ra))
 
 
     def test_find_openaire_orcid_with_index(self):
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import json
+import os
+import tempfile
+import unittest
+
+from oc_ds_converter.oc_idmanager.oc_data_storage.in_memory_manager import InMemoryStorageManager
+
+
+class TestInMemoryStorageManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp_dir.name, "storage.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_storage_management(self):
+        ism = InMemoryStorageManager(self.json_path)
+        ism.set_value("pmid:9", True)
+        ism.set_value("pmid:0", False)
+        self.assertCountEqual(ism.get_all_keys(), ["pmid:9", "pmid:0"])
+        self.assertTrue(ism.get_value("pmid:9"))
+        self.assertFalse(ism.get_value("pmid:0"))
+        self.assertIsNone(ism.get_value("pmid:1"))
+
+        ism.set_full_value("pmid:1212", {"valid": True, "title": "A title"})
+        ism.set_full_value("pmid:1212", {"valid": False, "year": "2020"})
+        self.assertTrue(ism.get_value("pmid:1212"))
+        self.assertEqual(ism.get_validity_list_of_tuples(), [("pmid:9", True), ("pmid:0", False), ("pmid:1212", True)])
+
+        ism.delete_storage()
+        self.assertEqual(ism.get_all_keys(), [])
+        self.assertFalse(os.path.exists(self.json_path))
+
+    def test_legacy_json_file(self):
+        with open(self.json_path, "w", encoding="utf8") as f:
+            json.dump({"doi:10.1/a": {"valid": True}, "doi:10.1/b": {"valid": False, "title": "b"}}, f, indent=4)
+        ism = InMemoryStorageManager(self.json_path)
+        self.assertEqual(ism.get_values_batch(["doi:10.1/a", "doi:10.1/b", "doi:10.1/c"]),
+                         {"doi:10.1/a": True, "doi:10.1/b": False, "doi:10.1/c": None})
+
+    def test_incremental_persistence(self):
+        ism = InMemoryStorageManager(self.json_path)
+        ism.set_multi_value([(f"doi:10.1/{i}", i % 2 == 0) for i in range(10)])
+        ism.store_file()
+        # The first save has nothing to append to, so it rewrites the json file
+        self.assertFalse(os.path.exists(ism.journal_filepath))
+
+        ism.set_value("doi:10.1/new", True)
+        ism.set_full_value("doi:10.1/info", {"valid": False, "title": "è"})
+        ism.store_file()
+        with open(ism.journal_filepath, encoding="utf8") as journal:
+            self.assertEqual(len(journal.readlines()), 2)
+        with open(self.json_path, encoding="utf8") as f:
+            self.assertEqual(len(json.load(f)), 10)
+
+        reloaded = InMemoryStorageManager(self.json_path)
+        self.assertEqual(reloaded.get_validity_dict(), ism.get_validity_dict())
+        with open(reloaded.journal_filepath, "a", encoding="utf8") as journal:
+            journal.write('["doi:10.1/trunc')
+        reloaded = InMemoryStorageManager(self.json_path)
+        self.assertEqual(len(reloaded.get_all_keys()), 12)
+
+        reloaded.set_multi_value([(f"doi:10.2/{i}", True) for i in range(20)])
+        reloaded.store_file()
+        self.assertFalse(os.path.exists(reloaded.journal_filepath))
+        with open(self.json_path, encoding="utf8") as f:
+            snapshot = json.load(f)
+        self.assertEqual(len(snapshot), 32)
+        self.assertEqual(snapshot["doi:10.1/info"], {"valid": False, "title": "è"})
+
+
+if __name__ == '__main__':
+    unittest.main()
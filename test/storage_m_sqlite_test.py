@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from oc_ds_converter.oc_idmanager.oc_data_storage.sqlite_manager import SqliteStorageManager
+
+
+def _write_from_worker(db_path: str, worker: int) -> None:
+    ssm = SqliteStorageManager(db_path)
+    for batch in range(5):
+        ssm.set_multi_value([(f"doi:10.{worker}/{batch}-{i}", True) for i in range(100)])
+        ssm.get_value(f"doi:10.{worker}/0-0")
+
+
+class TestSqliteStorageManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "storage.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_storage_management(self):
+        ssm = SqliteStorageManager(self.db_path)
+        ssm.set_value("pmid:9", True)
+        ssm.set_value("pmid:0", False)
+        self.assertCountEqual(ssm.get_all_keys(), ["pmid:9", "pmid:0"])
+
+        ssm.set_multi_value([("pmid:1020", True), ("pmid:2020", False)])
+        self.assertTrue(ssm.get_value("pmid:1020"))
+        self.assertFalse(ssm.get_value("pmid:2020"))
+        self.assertIsNone(ssm.get_value("pmid:3020"))
+        self.assertIsNone(ssm.get_value("pmid:3020' OR '1'='1"))
+
+        ssm.set_full_value("pmid:1212", {"valid": True})
+        self.assertTrue(ssm.get_value("pmid:1212"))
+
+        ssm.delete_storage()
+        for suffix in ("", "-wal", "-shm"):
+            self.assertFalse(os.path.exists(self.db_path + suffix))
+
+    def test_get_values_batch(self):
+        ssm = SqliteStorageManager(self.db_path)
+        ssm.set_multi_value([(f"doi:10.1/{i}", i % 2 == 0) for i in range(2000)])
+        ssm.set_value("doi:10.1/pending", True)
+        ids = [f"doi:10.1/{i}" for i in range(2000)] + ["doi:10.1/pending", "doi:10.1/missing"]
+        values = ssm.get_values_batch(ids)
+        self.assertEqual(len(values), 2002)
+        self.assertTrue(values["doi:10.1/0"])
+        self.assertFalse(values["doi:10.1/1999"])
+        self.assertTrue(values["doi:10.1/pending"])
+        self.assertIsNone(values["doi:10.1/missing"])
+        self.assertEqual(ssm.get_values_batch([]), {})
+        ssm.delete_storage()
+
+    def test_buffered_writes(self):
+        ssm = SqliteStorageManager(self.db_path, write_batch_size=3)
+        ssm.set_value("pmid:1", True)
+        ssm.set_value("pmid:2", False)
+        reader = sqlite3.connect(self.db_path)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM info").fetchone()[0], 0)
+        self.assertFalse(ssm.get_value("pmid:2"))
+        ssm.set_value("pmid:3", True)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM info").fetchone()[0], 3)
+        ssm.set_value("pmid:4", True)
+        ssm.store_file()
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM info").fetchone()[0], 4)
+        self.assertEqual(reader.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        reader.close()
+        ssm.delete_storage()
+
+    def test_values_persisted_on_release(self):
+        ssm = SqliteStorageManager(self.db_path)
+        ssm.set_value("pmid:1", True)
+        con = ssm.con
+        del ssm
+        # The pending row is flushed and the connection closed, which removes the WAL files
+        with self.assertRaises(sqlite3.ProgrammingError):
+            con.execute("SELECT 1")
+        self.assertFalse(os.path.exists(self.db_path + "-wal"))
+        reader = sqlite3.connect(self.db_path)
+        self.assertEqual(reader.execute("SELECT id, value FROM info").fetchall(), [("pmid:1", 1)])
+        reader.close()
+        reopened = SqliteStorageManager(self.db_path)
+        self.assertTrue(reopened.get_value("pmid:1"))
+        reopened.delete_storage()
+
+    def test_concurrent_writers(self):
+        SqliteStorageManager(self.db_path).store_file()
+        with ProcessPoolExecutor(max_workers=4, mp_context=get_context('spawn')) as executor:
+            list(executor.map(_write_from_worker, [self.db_path] * 4, range(4)))
+        ssm = SqliteStorageManager(self.db_path)
+        self.assertEqual(len(ssm.get_all_keys()), 2000)
+        self.assertTrue(ssm.get_value("doi:10.3/4-99"))
+        ssm.delete_storage()
+
+
+if __name__ == '__main__':
+    unittest.main()